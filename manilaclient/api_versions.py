@@ -16,8 +16,12 @@
 import functools
 import logging
 import re
+import threading
+import time
 import warnings
 
+import six
+
 import manilaclient
 from manilaclient.common._i18n import _
 from manilaclient.common import cliutils
@@ -31,6 +35,13 @@ MAX_VERSION = '2.57'
 MIN_VERSION = '2.0'
 DEPRECATED_VERSION = '1.0'
 _VERSIONED_METHOD_MAP = {}
+# Versioned method called by name and API version, filled on first call
+_VERSIONED_METHOD_CACHE = {}
+
+# Number of seconds the API version range discovered for an endpoint is reused
+SERVER_VERSION_CACHE_TTL = 300
+_SERVER_VERSION_CACHE = {}
+_SERVER_VERSION_CACHE_LOCK = threading.Lock()
 
 
 class APIVersion(object):
@@ -49,15 +60,7 @@ class APIVersion(object):
         self.ver_minor = 0
 
         if version_str is not None:
-            match = re.match(r"^([1-9]\d*)\.([1-9]\d*|0)$", version_str)
-            if match:
-                self.ver_major = int(match.group(1))
-                self.ver_minor = int(match.group(2))
-            else:
-                msg = _("Invalid format of client version '%s'. "
-                        "Expected format 'X.Y', where X is a major part and Y "
-                        "is a minor part of version.") % version_str
-                raise exceptions.UnsupportedVersion(msg)
+            self.ver_major, self.ver_minor = _parse_version(version_str)
 
     def __str__(self):
         """Debug/Logging representation of object."""
@@ -93,6 +96,9 @@ class APIVersion(object):
         return ((self.ver_major, self.ver_minor) >
                 (other.ver_major, other.ver_minor))
 
+    def __hash__(self):
+        return hash((self.ver_major, self.ver_minor))
+
     def __le__(self, other):
         return self < other or self == other
 
@@ -146,6 +152,21 @@ class APIVersion(object):
         return "%s" % self.ver_major
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_version(version_str):
+    """Returns the major and minor parts of a version string.
+
+    Results are cached, as the same few versions are parsed over and over.
+    """
+    match = re.match(r"^([1-9]\d*)\.([1-9]\d*|0)$", version_str)
+    if not match:
+        msg = _("Invalid format of client version '%s'. "
+                "Expected format 'X.Y', where X is a major part and Y "
+                "is a minor part of version.") % version_str
+        raise exceptions.UnsupportedVersion(msg)
+    return int(match.group(1)), int(match.group(2))
+
+
 class VersionedMethod(object):
 
     def __init__(self, name, start_version, end_version, func):
@@ -217,8 +238,60 @@ def get_api_version(version_string):
     return api_version
 
 
-def _get_server_version_range(client):
-    """Obtain version range from server."""
+def _get_endpoint(client):
+    endpoint = getattr(getattr(client, 'client', None), 'endpoint_url', None)
+    return endpoint if isinstance(endpoint, six.string_types) else None
+
+
+def get_cached_server_version_range(endpoint):
+    """Returns the version range cached for an endpoint or None."""
+    with _SERVER_VERSION_CACHE_LOCK:
+        cached = _SERVER_VERSION_CACHE.get(endpoint)
+    if cached is None:
+        return None
+    min_version, max_version, expires_at = cached
+    if expires_at < time.time():
+        with _SERVER_VERSION_CACHE_LOCK:
+            _SERVER_VERSION_CACHE.pop(endpoint, None)
+        return None
+    return min_version, max_version
+
+
+def cache_server_version_range(endpoint, min_version, max_version,
+                               ttl=None):
+    """Caches the version range supported by an endpoint.
+
+    :param endpoint: URL of the Manila endpoint.
+    :param min_version: APIVersion object representing server min
+    :param max_version: APIVersion object representing server max
+    :param ttl: number of seconds the range is valid for, defaults to
+        SERVER_VERSION_CACHE_TTL.
+    """
+    if ttl is None:
+        ttl = SERVER_VERSION_CACHE_TTL
+    with _SERVER_VERSION_CACHE_LOCK:
+        _SERVER_VERSION_CACHE[endpoint] = (
+            min_version, max_version, time.time() + ttl)
+
+
+def clear_server_version_cache():
+    """Forget all the cached server version ranges."""
+    with _SERVER_VERSION_CACHE_LOCK:
+        _SERVER_VERSION_CACHE.clear()
+
+
+def get_server_version_range(client):
+    """Obtain version range from server.
+
+    The range is cached per endpoint for SERVER_VERSION_CACHE_TTL seconds,
+    so clients talking to the same endpoint only request it once.
+    """
+    endpoint = _get_endpoint(client)
+    if endpoint:
+        cached = get_cached_server_version_range(endpoint)
+        if cached is not None:
+            return cached
+
     response = client.services.server_api_version('')
 
     server_version = None
@@ -229,15 +302,17 @@ def _get_server_version_range(client):
                 break
 
     if not hasattr(server_version, 'version') or not server_version.version:
-        return APIVersion(), APIVersion()
-
-    min_version = APIVersion(server_version.min_version)
-    max_version = APIVersion(server_version.version)
+        min_version, max_version = APIVersion(), APIVersion()
+    else:
+        min_version = APIVersion(server_version.min_version)
+        max_version = APIVersion(server_version.version)
 
+    if endpoint:
+        cache_server_version_range(endpoint, min_version, max_version)
     return min_version, max_version
 
 
-def discover_version(client, requested_version):
+def discover_version(client, requested_version, server_version_range=None):
     """Discovers the most recent version for client and API.
 
     Checks 'requested_version' and returns the most recent version
@@ -246,10 +321,14 @@ def discover_version(client, requested_version):
 
     :param client: client object
     :param requested_version: requested version represented by APIVersion obj
+    :param server_version_range: tuple with the min and max APIVersion
+        objects supported by the server, if already known. The server is not
+        queried when it is provided.
     :returns: APIVersion
     """
-    server_start_version, server_end_version = _get_server_version_range(
-        client)
+    if server_version_range is None:
+        server_version_range = get_server_version_range(client)
+    server_start_version, server_end_version = server_version_range
 
     valid_version = requested_version
     if server_start_version.is_null() and server_end_version.is_null():
@@ -337,6 +416,7 @@ def _validate_server_version(server_start_version, server_end_version):
 def add_versioned_method(versioned_method):
     _VERSIONED_METHOD_MAP.setdefault(versioned_method.name, [])
     _VERSIONED_METHOD_MAP[versioned_method.name].append(versioned_method)
+    _VERSIONED_METHOD_CACHE.clear()
 
 
 def get_versioned_methods(func_name, api_version=None):
@@ -347,6 +427,21 @@ def get_versioned_methods(func_name, api_version=None):
     return versioned_methods
 
 
+def _get_versioned_method(name, api_version):
+    """Returns the latest method matching the API version."""
+    methods = get_versioned_methods(name, api_version)
+
+    if not methods:
+        raise exceptions.UnsupportedVersion(
+            _("API version '%(version)s' is not supported on "
+              "'%(method)s' method.") % {
+                "version": api_version.get_string(),
+                "method": name,
+            })
+
+    return max(methods, key=lambda f: f.start_version)
+
+
 def experimental_api(f):
     """Adds to HTTP Header to indicate this is an experimental API call."""
 
@@ -384,18 +479,13 @@ def wraps(start_version, end_version=MAX_VERSION):
 
         @functools.wraps(func)
         def substitution(obj, *args, **kwargs):
-            methods = get_versioned_methods(name, obj.api_version)
-
-            if not methods:
-                raise exceptions.UnsupportedVersion(
-                    _("API version '%(version)s' is not supported on "
-                      "'%(method)s' method.") % {
-                        "version": obj.api_version.get_string(),
-                        "method": name,
-                    })
-
-            method = max(methods, key=lambda f: f.start_version)
-
+            api_version = obj.api_version
+            key = (name, api_version.ver_major, api_version.ver_minor)
+            try:
+                method = _VERSIONED_METHOD_CACHE[key]
+            except KeyError:
+                method = _VERSIONED_METHOD_CACHE[key] = (
+                    _get_versioned_method(name, api_version))
             return method.func(obj, *args, **kwargs)
 
         if hasattr(func, 'arguments'):
@@ -19,11 +19,14 @@
 Base utilities to build API operation managers and objects on top of.
 """
 
+import asyncio
+from concurrent import futures
 import contextlib
-import hashlib
-import os
+import warnings
 
-from manilaclient.common import cliutils
+from manilaclient.common.apiclient import base as common_base
+from manilaclient.common import columnar
+from manilaclient.common import json_stream
 from manilaclient import exceptions
 from manilaclient import utils
 
@@ -35,6 +38,80 @@ except NameError:
     def all(iterable):
         return True not in (not x for x in iterable)
 
+# NOTE: Default number of resources requested per page when iterating over
+# listings, it matches the default 'osapi_max_limit' of the Manila API.
+DEFAULT_PAGE_SIZE = 1000
+
+# NOTE: Number of bytes read from the socket at once when streaming
+# listings.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class _PageCursor(object):
+    """Position of a listing requested page by page.
+
+    It holds the paging logic shared by :meth:`Manager._list_iter` and
+    :meth:`AsyncManagerMixin._list_iter`, which only differ in how the pages
+    are requested.
+    """
+
+    def __init__(self, search_opts=None, page_size=None):
+        self.search_opts = dict(search_opts or {})
+        self.search_opts.pop('with_count', None)
+        self.page_size = int(page_size or DEFAULT_PAGE_SIZE)
+        self.offset = int(self.search_opts.pop('offset', 0) or 0)
+        remaining = self.search_opts.pop('limit', None)
+        self.remaining = int(remaining) if remaining is not None else None
+        self.limit = None
+        self.has_more = True
+        self.bounds = None
+
+    def next_page_opts(self):
+        """Returns the search options of the next page, None at the end."""
+        if not self.has_more:
+            return None
+        if self.remaining is None:
+            self.limit = self.page_size
+        else:
+            self.limit = min(self.page_size, self.remaining)
+        if self.limit <= 0:
+            return None
+        return dict(self.search_opts, offset=self.offset, limit=self.limit)
+
+    def advance(self, page):
+        """Accounts for a page of resources returned by the server.
+
+        A server ignoring 'limit' or 'offset' would make the listing endless,
+        it ends when a page is longer than requested or repeats the previous
+        one.
+
+        :returns: the resources of the page to return.
+        """
+        bounds = tuple(getattr(resource, 'id', resource)
+                       for resource in (page[0], page[-1])) if page else None
+        if bounds is not None and bounds == self.bounds:
+            self.has_more = False
+            return []
+        self.bounds = bounds
+
+        if len(page) > self.limit:
+            self.has_more = False
+            if self.remaining is not None:
+                page = page[:self.remaining]
+        else:
+            self.has_more = len(page) == self.limit
+        self.offset += len(page)
+        if self.remaining is not None:
+            self.remaining -= len(page)
+        return page
+
+    @staticmethod
+    def get_resources(page):
+        # NOTE: Drop the resource count if the server returned it.
+        if isinstance(page, tuple):
+            page = page[0]
+        return page
+
 
 class Manager(utils.HookableMixin):
     """Manager for CRUD operations.
@@ -44,6 +121,10 @@ class Manager(utils.HookableMixin):
     """
     resource_class = None
 
+    # NOTE: Fields holding dicts that columnar listings split into one
+    # column per key.
+    columnar_flatten = ()
+
     def __init__(self, api):
         self.api = api
         self.client = api.client
@@ -52,15 +133,91 @@ class Manager(utils.HookableMixin):
     def api_version(self):
         return self.api.api_version
 
-    def _list(self, url, response_key, obj_class=None, body=None):
+    def _list(self, url, response_key, obj_class=None, body=None,
+              stream=False, compact=False, columnar=False, load_details=None):
+        """List resources.
+
+        With ``stream``, a generator is returned instead of a list, the
+        resources being built one by one while the response is received,
+        so only one of them is kept in memory at a time. Streamed resources
+        are not stored in the completion cache and the resource count is
+        not returned.
+
+        With ``compact``, read-only resources storing their attributes only
+        once are returned, see
+        :class:`manilaclient.common.apiclient.base.CompactResource`.
+
+        With ``columnar``, no resource is built, the listed items are
+        returned as a :class:`manilaclient.common.columnar.Table`. Combined
+        with ``stream``, the table is filled while the response is received.
+
+        ``load_details`` is meant for listings which miss some details of
+        the resources. It is a callable returning the detailed resources,
+        called once when a missing attribute of any of the listed resources
+        is first accessed, see
+        :class:`manilaclient.common.apiclient.base.BatchLoader`. It is
+        ignored by streamed and compact listings.
+        """
+        if stream:
+            resp, body = self.api.client.get(url, stream=True)
+            if columnar:
+                return self._stream_table(resp, response_key)
+            return self._stream_list(resp, response_key, obj_class, compact)
+
         resp = None
         if body:
             resp, body = self.api.client.post(url, body=body)
         else:
             resp, body = self.api.client.get(url)
+        if columnar:
+            return self._build_table(body, response_key)
+        return self._build_list(body, response_key, obj_class, compact,
+                                load_details)
+
+    def _build_table(self, body, response_key):
+        """Returns the items of a list response body as a table."""
+        table = columnar.Table.from_rows(
+            [res for res in body[response_key] if res],
+            flatten=self.columnar_flatten)
+        if 'count' in body:
+            return table, body['count']
+        return table
+
+    def _stream_table(self, resp, response_key):
+        """Returns the items of a streamed list response as a table."""
+        try:
+            chunks = resp.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            return columnar.Table.from_rows(
+                (res for res in json_stream.iter_items(chunks, response_key)
+                 if res),
+                flatten=self.columnar_flatten)
+        finally:
+            resp.close()
 
+    def _stream_list(self, resp, response_key, obj_class=None,
+                     compact=False):
+        """Yield the resources of a streamed list response."""
         if obj_class is None:
             obj_class = self.resource_class
+        if compact:
+            obj_class = common_base.get_compact_class(obj_class)
+
+        try:
+            chunks = resp.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            for res in json_stream.iter_items(chunks, response_key):
+                if res:
+                    yield obj_class(self, res, loaded=True)
+        finally:
+            resp.close()
+
+    def _build_list(self, body, response_key, obj_class=None, compact=False,
+                    load_details=None):
+        """Returns the resources of a list response body."""
+        if obj_class is None:
+            obj_class = self.resource_class
+        resource_class = obj_class
+        if compact:
+            resource_class = common_base.get_compact_class(obj_class)
 
         data = body[response_key]
         # NOTE(ja): keystone returns values as list as {'values': [ ... ]}
@@ -71,75 +228,110 @@ class Manager(utils.HookableMixin):
             except KeyError:
                 pass
 
-        with self.completion_cache('human_id', obj_class, mode="w"):
-            with self.completion_cache('uuid', obj_class, mode="w"):
-                resource = [obj_class(self, res, loaded=True)
-                            for res in data if res]
-                if 'count' in body:
-                    return resource, body['count']
-                else:
-                    return resource
-
-    @contextlib.contextmanager
-    def completion_cache(self, cache_type, obj_class, mode):
-        """Bash autocompletion items storage.
-
-        The completion cache store items that can be used for bash
-        autocompletion, like UUIDs or human-friendly IDs.
-
-        A resource listing will clear and repopulate the cache.
-
-        A resource create will append to the cache.
-
-        Delete is not handled because listings are assumed to be performed
-        often enough to keep the cache reasonably up-to-date.
+        if load_details is not None and not compact:
+            loader = common_base.BatchLoader(load_details)
+            resource = [resource_class(self, res) for res in data if res]
+            for res in resource:
+                loader.add(res)
+        else:
+            resource = [resource_class(self, res, loaded=True)
+                        for res in data if res]
+        self._update_completion_cache(obj_class, resource, replace=True)
+        if 'count' in body:
+            return resource, body['count']
+        else:
+            return resource
+
+    def _list_iter(self, list_func, search_opts=None, page_size=None,
+                   prefetch=False, **kwargs):
+        """Lazily iterate over all the resources returned by ``list_func``.
+
+        Resources are requested page by page using the 'limit' and 'offset'
+        search options, so at most one page (or two, if ``prefetch`` is set)
+        is kept in memory at a time.
+
+        :param list_func: manager method returning one page of resources,
+            it must accept a ``search_opts`` keyword argument.
+        :param search_opts: dict with search options passed to ``list_func``.
+            'offset' sets the position of the first resource to return and
+            'limit' the maximum number of resources to return in total.
+        :param page_size: number of resources requested per API call, it
+            should not exceed the 'osapi_max_limit' of the server.
+        :param prefetch: whether to request the next page in background
+            while the current one is being consumed.
+        :param kwargs: extra keyword arguments passed to ``list_func``.
         """
-        base_dir = cliutils.env('manilaclient_UUID_CACHE_DIR',
-                                'MANILACLIENT_UUID_CACHE_DIR',
-                                default="~/.manilaclient")
-
-        # NOTE(sirp): Keep separate UUID caches for each username + endpoint
-        # pair
-        username = cliutils.env('OS_USERNAME', 'MANILA_USERNAME')
-        url = cliutils.env('OS_URL', 'MANILA_URL')
-        uniqifier = hashlib.md5(username.encode('utf-8') +
-                                url.encode('utf-8')).hexdigest()
+        cursor = _PageCursor(search_opts, page_size)
 
-        cache_dir = os.path.expanduser(os.path.join(base_dir, uniqifier))
+        def _get_page(page_opts):
+            return cursor.get_resources(
+                list_func(search_opts=page_opts, **kwargs))
 
+        executor = None
+        if prefetch:
+            executor = futures.ThreadPoolExecutor(max_workers=1)
         try:
-            os.makedirs(cache_dir, 0o755)
-        except OSError:
-            # NOTE(kiall): This is typically either permission denied while
-            #              attempting to create the directory, or the directory
-            #              already exists. Either way, don't fail.
-            pass
+            page_opts = cursor.next_page_opts()
+            page = _get_page(page_opts) if page_opts else []
+            while page:
+                page = cursor.advance(page)
+                page_opts = cursor.next_page_opts()
+                next_page = None
+                if page_opts and executor:
+                    next_page = executor.submit(_get_page, page_opts)
+
+                for resource in page:
+                    yield resource
+                page = None
+
+                if next_page:
+                    page = next_page.result()
+                elif page_opts:
+                    page = _get_page(page_opts)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
 
-        resource = obj_class.__name__.lower()
-        filename = "%s-%s-cache" % (resource, cache_type.replace('_', '-'))
-        path = os.path.join(cache_dir, filename)
+    def _update_completion_cache(self, obj_class, resources, replace=False):
+        """Store the IDs of resources for bash autocompletion.
 
-        cache_attr = "_%s_cache" % cache_type
+        Nothing is stored unless the client was given a completion cache,
+        which the manila shell does.
+        """
+        cache = getattr(self.api, 'completion_cache', None)
+        if cache is not None:
+            cache.update(obj_class.__name__.lower(), resources,
+                         replace=replace)
 
-        try:
-            setattr(self, cache_attr, open(path, mode))
-        except IOError:
-            # NOTE(kiall): This is typically a permission denied while
-            #              attempting to write the cache file.
-            pass
+    @contextlib.contextmanager
+    def completion_cache(self, cache_type, obj_class, mode):
+        """Deprecated, pass a ``completion_cache`` to the client instead.
 
+        The values written with :meth:`write_to_completion_cache` within the
+        context are added to the completion cache of the client, if any.
+        """
+        warnings.warn("Manager.completion_cache() is deprecated, pass a "
+                      "completion_cache to the client instead.",
+                      DeprecationWarning)
+        cache_attr = "_%s_cache" % cache_type
+        values = []
+        setattr(self, cache_attr, values)
         try:
             yield
         finally:
-            cache = getattr(self, cache_attr, None)
-            if cache:
-                cache.close()
-                delattr(self, cache_attr)
+            delattr(self, cache_attr)
+            cache = getattr(self.api, 'completion_cache', None)
+            if cache is not None and values:
+                cache.add_values(obj_class.__name__.lower(), values)
 
     def write_to_completion_cache(self, cache_type, val):
+        """Deprecated, see :meth:`completion_cache`."""
+        warnings.warn("Manager.write_to_completion_cache() is deprecated, "
+                      "pass a completion_cache to the client instead.",
+                      DeprecationWarning)
         cache = getattr(self, "_%s_cache" % cache_type, None)
-        if cache:
-            cache.write("%s\n" % val)
+        if cache is not None:
+            cache.append(str(val))
 
     def _get(self, url, response_key=None):
         resp, body = self.api.client.get(url)
@@ -162,9 +354,9 @@ class Manager(utils.HookableMixin):
         if return_raw:
             return body[response_key]
 
-        with self.completion_cache('human_id', self.resource_class, mode="a"):
-            with self.completion_cache('uuid', self.resource_class, mode="a"):
-                return self.resource_class(self, body[response_key])
+        resource = self.resource_class(self, body[response_key])
+        self._update_completion_cache(self.resource_class, [resource])
+        return resource
 
     def _delete(self, url):
         resp, body = self.api.client.delete(url)
@@ -189,11 +381,16 @@ class Manager(utils.HookableMixin):
 
 class ManagerWithFind(Manager):
     """Like a `Manager`, but with additional `find()`/`findall()` methods."""
+
+    # NOTE: Attributes the list API of the manager can filter on, they are
+    # passed to the server as search options by findall().
+    server_side_filters = ()
+
     def find(self, **kwargs):
         """Find a single item with attributes matching ``**kwargs``.
 
-        This isn't very efficient: it loads the entire list then filters on
-        the Python side.
+        Attributes listed in ``server_side_filters`` are filtered by the
+        server, the remaining ones on the Python side.
         """
         matches = self.findall(**kwargs)
         num_matches = len(matches)
@@ -208,14 +405,21 @@ class ManagerWithFind(Manager):
     def findall(self, **kwargs):
         """Find all items with attributes matching ``**kwargs``.
 
-        This isn't very efficient: it loads the entire list then filters on
-        the Python side.
+        Attributes listed in ``server_side_filters`` are sent to the server
+        as search options, so only matching resources are returned by the
+        API. Every attribute is still compared on the Python side, while the
+        listing is consumed page by page when the manager supports it.
         """
         found = []
         searches = list(kwargs.items())
 
         search_opts = {'all_tenants': 1}
-        for obj in self.list(search_opts=search_opts):
+        for attr, value in searches:
+            if attr in self.server_side_filters:
+                search_opts[attr] = value
+
+        list_func = getattr(self, 'list_iter', self.list)
+        for obj in list_func(search_opts=search_opts):
             try:
                 if all(getattr(obj, attr) == value
                        for (attr, value) in searches):
@@ -227,3 +431,140 @@ class ManagerWithFind(Manager):
 
     def list(self, search_opts=None):
         raise NotImplementedError
+
+
+class AsyncManagerMixin(object):
+    """Awaitable versions of the CRUD operations of a `Manager`.
+
+    It must come before the `Manager` class in the bases of a manager whose
+    API client uses :class:`manilaclient.common.async_httpclient.
+    AsyncHTTPClient`, so manager methods that return the result of these
+    operations (or of ``self.api.client`` calls) return coroutines.
+    Resources are always built as loaded, because lazy loading would need a
+    blocking API call.
+    """
+
+    @staticmethod
+    def _check_not_streamed(stream):
+        """Rejects streamed listings, which need a blocking response body."""
+        if stream:
+            raise ValueError("Streamed listings are not supported by the "
+                             "asyncio client, use list_iter() to iterate "
+                             "over large listings page by page.")
+
+    async def _list(self, url, response_key, obj_class=None, body=None,
+                    stream=False, compact=False, columnar=False,
+                    load_details=None):
+        self._check_not_streamed(stream)
+        if body:
+            resp, body = await self.api.client.post(url, body=body)
+        else:
+            resp, body = await self.api.client.get(url)
+        if columnar:
+            return self._build_table(body, response_key)
+        return self._build_list(body, response_key, obj_class, compact)
+
+    async def _list_iter(self, list_func, search_opts=None, page_size=None,
+                         prefetch=False, **kwargs):
+        """Asynchronously iterate over all the resources of ``list_func``.
+
+        It works like :meth:`Manager._list_iter`, but returns an asynchronous
+        iterator, and the next page is requested in a task of the running
+        event loop when ``prefetch`` is set.
+        """
+        cursor = _PageCursor(search_opts, page_size)
+
+        async def _get_page(page_opts):
+            return cursor.get_resources(
+                await list_func(search_opts=page_opts, **kwargs))
+
+        next_page = None
+        try:
+            page_opts = cursor.next_page_opts()
+            page = await _get_page(page_opts) if page_opts else []
+            while page:
+                page = cursor.advance(page)
+                page_opts = cursor.next_page_opts()
+                if page_opts and prefetch:
+                    next_page = asyncio.ensure_future(_get_page(page_opts))
+
+                for resource in page:
+                    yield resource
+                page = None
+
+                if next_page:
+                    page = await next_page
+                    next_page = None
+                elif page_opts:
+                    page = await _get_page(page_opts)
+        finally:
+            if next_page:
+                next_page.cancel()
+
+    async def _get(self, url, response_key=None):
+        resp, body = await self.api.client.get(url)
+        if response_key:
+            body = body[response_key]
+        return self.resource_class(self, body, loaded=True)
+
+    async def _create(self, url, body, response_key, return_raw=False,
+                      **kwargs):
+        self.run_hooks('modify_body_for_create', body, **kwargs)
+        resp, body = await self.api.client.post(url, body=body)
+        if return_raw:
+            return body[response_key]
+
+        resource = self.resource_class(self, body[response_key], loaded=True)
+        self._update_completion_cache(self.resource_class, [resource])
+        return resource
+
+    async def _delete(self, url):
+        resp, body = await self.api.client.delete(url)
+
+    async def _update(self, url, body, response_key=None, **kwargs):
+        self.run_hooks('modify_body_for_update', body, **kwargs)
+        resp, body = await self.api.client.put(url, body=body)
+        if body:
+            if response_key:
+                body = body[response_key]
+            return self.resource_class(self, body, loaded=True)
+
+    async def find(self, **kwargs):
+        """Find a single item with attributes matching ``**kwargs``."""
+        matches = await self.findall(**kwargs)
+        num_matches = len(matches)
+        if num_matches == 0:
+            msg = "No %s matching %s." % (self.resource_class.__name__, kwargs)
+            raise exceptions.NotFound(404, msg)
+        elif num_matches > 1:
+            raise exceptions.NoUniqueMatch
+        else:
+            return matches[0]
+
+    async def findall(self, **kwargs):
+        """Find all items with attributes matching ``**kwargs``."""
+        found = []
+        searches = list(kwargs.items())
+
+        search_opts = {'all_tenants': 1}
+        for attr, value in searches:
+            if attr in getattr(self, 'server_side_filters', ()):
+                search_opts[attr] = value
+
+        def _matches(obj):
+            try:
+                return all(getattr(obj, attr) == value
+                           for (attr, value) in searches)
+            except AttributeError:
+                return False
+
+        if hasattr(self, 'list_iter'):
+            # NOTE: Resources are filtered while the pages are received.
+            async for obj in self.list_iter(search_opts=search_opts):
+                if _matches(obj):
+                    found.append(obj)
+        else:
+            objs = await self.list(search_opts=search_opts)
+            found.extend(obj for obj in objs if _matches(obj))
+
+        return found
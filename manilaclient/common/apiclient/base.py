@@ -24,7 +24,10 @@ Base utilities to build API operation managers and objects on top of.
 # pylint: disable=E1102
 
 import abc
+import collections
 import copy
+import logging
+import threading
 
 from oslo_utils import strutils
 import six
@@ -33,6 +36,15 @@ from manilaclient.common._i18n import _
 from manilaclient.common.apiclient import exceptions
 from manilaclient import utils
 
+LOG = logging.getLogger(__name__)
+
+# Number of API requests made to lazy load resources of a class after which
+# a warning is logged.
+LAZY_LOAD_WARNING_THRESHOLD = 10
+
+_lazy_load_counts = collections.Counter()
+_lazy_load_lock = threading.Lock()
+
 
 def getid(obj):
     """Return id if argument is a Resource.
@@ -472,14 +484,31 @@ class Resource(object):
     def __getattr__(self, k):
         if k not in self.__dict__:
             # NOTE(bcwaldon): disallow lazy-loading if already loaded once
-            if not self.is_loaded():
-                self.get()
+            # NOTE: Special attributes probed by copy, pickle and the like
+            # don't load a whole group of resources.
+            batched = '_batch_loader' in self.__dict__
+            if not self.is_loaded() and not (batched and k.startswith('__')):
+                self._lazy_load()
                 return self.__getattr__(k)
 
             raise AttributeError(k)
         else:
             return self.__dict__[k]
 
+    def _lazy_load(self):
+        """Loads the details of the resource on first access.
+
+        Resources attached to a :class:`BatchLoader` are loaded together
+        with the other resources of their group, the others with
+        :meth:`get`.
+        """
+        loader = self.__dict__.get('_batch_loader')
+        if loader is not None:
+            loader.load()
+        if not self.is_loaded():
+            self.get()
+            record_lazy_load(self, 1)
+
     def get(self):
         """Support for lazy loading details.
 
@@ -516,3 +545,169 @@ class Resource(object):
 
     def to_dict(self):
         return copy.deepcopy(self._info)
+
+
+class BatchLoader(object):
+    """Loads the details of a group of resources with a single API call.
+
+    Resources of a listing which misses some details, such as a summary
+    listing, are added to the same loader. The first access to a missing
+    attribute of any of them loads all of them, instead of issuing one GET
+    for each resource.
+    """
+
+    def __init__(self, load_func):
+        """Create a loader.
+
+        :param load_func: callable returning the detailed resources, such as
+            a detailed listing with the same filters. A tuple returned with
+            the resource count is accepted too.
+        """
+        self._load_func = load_func
+        self._resources = []
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def add(self, resource):
+        resource.__dict__['_batch_loader'] = self
+        self._resources.append(resource)
+
+    def load(self):
+        """Loads the details of all the resources of the group, once."""
+        with self._lock:
+            if self.loaded:
+                return
+            self.loaded = True
+            resources, self._resources = self._resources, []
+
+            detailed = self._load_func()
+            if isinstance(detailed, tuple):
+                detailed = detailed[0]
+            details = dict((new._info.get('id'), new._info)
+                           for new in detailed)
+            for resource in resources:
+                info = details.get(resource._info.get('id'))
+                if info is not None:
+                    resource._add_details(info)
+                # NOTE: Resources missing from the detailed listing, deleted
+                # since they were listed, are not loaded one by one.
+                resource.set_loaded(True)
+                resource.__dict__.pop('_batch_loader', None)
+
+        if resources:
+            record_lazy_load(resources[0], len(resources))
+
+
+def record_lazy_load(resource, num_resources):
+    """Accounts for an API request made to lazy load resources.
+
+    The requests are counted by resource class, see
+    :func:`get_lazy_load_counts`, and a warning is logged when
+    LAZY_LOAD_WARNING_THRESHOLD requests were made for the same class.
+    The 'lazy_load' hooks of the manager of the resource are called with
+    the resource and the number of resources loaded by the request.
+    """
+    name = resource.__class__.__name__
+    with _lazy_load_lock:
+        _lazy_load_counts[name] += 1
+        count = _lazy_load_counts[name]
+    if count == LAZY_LOAD_WARNING_THRESHOLD:
+        LOG.warning("%(count)s API requests were made to lazy load the "
+                    "details of %(name)s resources, consider listing them "
+                    "with details.", {'count': count, 'name': name})
+
+    run_hooks = getattr(resource.manager, 'run_hooks', None)
+    if run_hooks is not None:
+        run_hooks('lazy_load', resource, num_resources)
+
+
+def get_lazy_load_counts():
+    """Returns the number of lazy load requests made by resource class."""
+    with _lazy_load_lock:
+        return dict(_lazy_load_counts)
+
+
+def reset_lazy_load_counts():
+    with _lazy_load_lock:
+        _lazy_load_counts.clear()
+
+
+class CompactResource(object):
+    """Mixin making resources compact and read-only.
+
+    Attributes of a regular resource are stored twice, in ``_info`` and in
+    the ``__dict__`` of the instance. Compact resources keep their state in
+    three slots, attribute lookups being served from ``_info``, which makes
+    them cheaper to build and to keep around for listings of many
+    resources. They are not fully slotted: being instances of their
+    resource class, they still have a ``__dict__``, but nothing is stored
+    in it. They are never lazy loaded and their attributes can't be set.
+
+    Use :func:`get_compact_class` to get the compact version of a resource
+    class.
+    """
+
+    __slots__ = ('manager', '_info', '_loaded')
+
+    # NOTE: Set on the generated classes.
+    _resource_class = Resource
+
+    def __init__(self, manager, info, loaded=True):
+        object.__setattr__(self, 'manager', manager)
+        object.__setattr__(self, '_info', info)
+        object.__setattr__(self, '_loaded', True)
+
+    def __getattr__(self, k):
+        if k in CompactResource.__slots__:
+            raise AttributeError(k)
+        try:
+            return self._info[k]
+        except KeyError:
+            raise AttributeError(k)
+
+    def __setattr__(self, k, v):
+        if k == '_loaded':
+            object.__setattr__(self, k, v)
+        else:
+            raise AttributeError(
+                "Can't set attribute '%s' of a read-only %s." % (
+                    k, self._resource_class.__name__))
+
+    def __reduce__(self):
+        return self.__class__, (self.manager, self._info)
+
+    def __eq__(self, other):
+        if not isinstance(other, Resource):
+            return NotImplemented
+        if not isinstance(other, self._resource_class):
+            return False
+        if hasattr(self, 'id') and hasattr(other, 'id'):
+            return self.id == other.id
+        return self._info == other._info
+
+    def _compact_repr(self):
+        info = ", ".join("%s=%s" % (k, self._info[k])
+                         for k in sorted(self._info) if k[0] != '_')
+        return "<%s %s>" % (self._resource_class.__name__, info)
+
+
+_compact_classes = {}
+
+
+def get_compact_class(resource_class):
+    """Returns the compact, read-only, version of a resource class.
+
+    Instances of the returned class are also instances of
+    ``resource_class``, so its methods can be used on them.
+    """
+    try:
+        return _compact_classes[resource_class]
+    except KeyError:
+        pass
+
+    attrs = {'__slots__': (), '_resource_class': resource_class}
+    if resource_class.__repr__ is Resource.__repr__:
+        attrs['__repr__'] = CompactResource._compact_repr
+    compact_class = type('Compact%s' % resource_class.__name__,
+                         (CompactResource, resource_class), attrs)
+    return _compact_classes.setdefault(resource_class, compact_class)
@@ -445,8 +445,6 @@ def from_response(response, method, url):
         "url": url,
         "request_id": req_id,
     }
-    if "retry-after" in response.headers:
-        kwargs["retry_after"] = response.headers["retry-after"]
 
     content_type = response.headers.get("Content-Type", "")
     if content_type.startswith("application/json"):
@@ -474,4 +472,9 @@ def from_response(response, method, url):
             cls = HTTPClientError
         else:
             cls = HttpError
+    # NOTE: The Retry-After header of other responses can be read from the
+    # response of the exception.
+    if ("retry-after" in response.headers and
+            issubclass(cls, RequestEntityTooLarge)):
+        kwargs["retry_after"] = response.headers["retry-after"]
     return cls(**kwargs)
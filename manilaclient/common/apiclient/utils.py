@@ -11,6 +11,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import threading
+import time
+import weakref
+
 from oslo_utils import encodeutils
 from oslo_utils import uuidutils
 import six
@@ -19,6 +23,93 @@ from manilaclient.common._i18n import _
 from manilaclient.common.apiclient import exceptions
 
 
+# Number of seconds a name to ID mapping found by find_resource() is reused
+NAME_CACHE_TTL = 60
+
+_name_cache = weakref.WeakKeyDictionary()
+_name_cache_lock = threading.Lock()
+
+
+def _name_cache_get(manager, key):
+    with _name_cache_lock:
+        entry = _name_cache.get(manager, {}).get(key)
+    if entry is None:
+        return None
+    resource_id, expires_at = entry
+    if expires_at < time.time():
+        _name_cache_evict(manager, key)
+        return None
+    return resource_id
+
+
+def _name_cache_set(manager, key, resource_id):
+    with _name_cache_lock:
+        cache = _name_cache.setdefault(manager, {})
+        cache[key] = (resource_id, time.time() + NAME_CACHE_TTL)
+
+
+def _name_cache_evict(manager, key):
+    with _name_cache_lock:
+        _name_cache.get(manager, {}).pop(key, None)
+
+
+def clear_name_cache():
+    """Forget all name to ID mappings cached by find_resource()."""
+    with _name_cache_lock:
+        _name_cache.clear()
+
+
+def _matches(resource, filters):
+    try:
+        return all(getattr(resource, attr) == value
+                   for (attr, value) in filters.items())
+    except AttributeError:
+        return False
+
+
+def _find_by_name(manager, name_attr, name, find_args):
+    """Find a resource by name with a single, server filtered, request.
+
+    The name filter is sent to the server, but results are filtered again on
+    the client side, so APIs ignoring the filter still return the right
+    resource.
+    """
+    filters = {name_attr: name}
+    filters.update(find_args)
+    cache_key = tuple(sorted(filters.items()))
+
+    resource_id = _name_cache_get(manager, cache_key)
+    if resource_id is not None:
+        try:
+            resource = manager.get(resource_id)
+        except exceptions.NotFound:
+            resource = None
+        if resource is not None and _matches(resource, filters):
+            return resource
+        _name_cache_evict(manager, cache_key)
+
+    search_opts = {'all_tenants': 1}
+    search_opts.update(filters)
+    try:
+        resources = manager.list(search_opts=search_opts)
+    except exceptions.BadRequest:
+        # NOTE: The API rejected the filters, look for the resource in the
+        # whole list instead.
+        resources = manager.list(search_opts={'all_tenants': 1})
+
+    matches = [resource for resource in resources
+               if _matches(resource, filters)]
+    if not matches:
+        raise exceptions.NotFound(404)
+    elif len(matches) > 1:
+        raise exceptions.NoUniqueMatch()
+
+    resource = matches[0]
+    if getattr(resource, 'id', None) is not None:
+        _name_cache_set(manager, cache_key, resource.id)
+    return resource
+
+
 def find_resource(manager, name_or_id, **find_args):
     """Look for resource in a given manager.
 
@@ -30,6 +121,11 @@ def find_resource(manager, name_or_id, **find_args):
         def _find_hypervisor(cs, hypervisor):
             #Get a hypervisor by name or ID.
             return cliutils.find_resource(cs.hypervisors, hypervisor)
+
+    IDs are looked up with a single GET request. Names are looked up with a
+    single list request filtered by name on the server side, and the name to
+    ID mapping is cached for ``NAME_CACHE_TTL`` seconds, so later lookups of
+    the same name only need a GET request.
     """
     # first try to get entity as integer id
     try:
@@ -56,19 +152,20 @@ def find_resource(manager, name_or_id, **find_args):
         except exceptions.NotFound:
             pass
 
+    resource = getattr(manager, 'resource_class', None)
     try:
-        try:
-            return manager.find(human_id=name_or_id, **find_args)
-        except exceptions.NotFound:
-            pass
+        # human_id is only set for resources with HUMAN_ID enabled, don't
+        # list all of them for nothing otherwise.
+        if getattr(resource, 'HUMAN_ID', False):
+            try:
+                return manager.find(human_id=name_or_id, **find_args)
+            except exceptions.NotFound:
+                pass
 
         # finally try to find entity by name
         try:
-            resource = getattr(manager, 'resource_class', None)
             name_attr = resource.NAME_ATTR if resource else 'name'
-            kwargs = {name_attr: name_or_id}
-            kwargs.update(find_args)
-            return manager.find(**kwargs)
+            return _find_by_name(manager, name_attr, name_or_id, find_args)
         except exceptions.NotFound:
             msg = _("No %(name)s with a name or "
                     "ID of '%(name_or_id)s' exists.") % \
@@ -0,0 +1,167 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Non-blocking HTTP client used by the asyncio API client."""
+
+import asyncio
+import ssl
+
+from oslo_serialization import jsonutils
+import six
+
+from manilaclient.common import httpclient
+from manilaclient import exceptions
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Maximum number of connections kept to the endpoint by default, it matches
+# the default limit of aiohttp connectors.
+DEFAULT_POOL_MAXSIZE = 100
+
+
+class AsyncResponse(object):
+    """Response of an :class:`AsyncHTTPClient` request.
+
+    It has the attributes of a requests' response used by manilaclient, so
+    it can be passed to :func:`manilaclient.exceptions.from_response`.
+    """
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', 'replace')
+
+    def json(self):
+        return jsonutils.loads(self.content)
+
+
+class AsyncHTTPClient(httpclient.HTTPClient):
+    """HTTP client whose requests are coroutines.
+
+    Requests go through an ``aiohttp`` session owning a pool of up to
+    ``pool_maxsize`` keep-alive connections. The session is created on the
+    first request, inside the running event loop, and must be released
+    with :meth:`close`. A preconfigured session can be passed as
+    ``http_session``, which is closed together with the client.
+
+    ``get``, ``post``, ``put`` and ``delete`` return coroutines resolving to
+    a ``(response, body)`` tuple.
+    """
+
+    def __init__(self, endpoint_url, token, user_agent, api_version,
+                 insecure=False, cacert=None, timeout=None, retries=None,
+                 http_log_debug=False, pool_maxsize=None, keep_alive=True,
+                 http_session=None, retry_policy=None):
+        if aiohttp is None and http_session is None:
+            raise ImportError(
+                "The asyncio client requires the 'aiohttp' library, it can "
+                "be installed with 'pip install python-manilaclient[async]'.")
+        self._pool_maxsize = pool_maxsize or DEFAULT_POOL_MAXSIZE
+        self._keep_alive = keep_alive
+        self._http_session = http_session
+        super(AsyncHTTPClient, self).__init__(
+            endpoint_url, token, user_agent, api_version, insecure=insecure,
+            cacert=cacert, timeout=timeout, retries=retries,
+            http_log_debug=http_log_debug, keep_alive=keep_alive,
+            retry_policy=retry_policy)
+
+    def _get_http_session(self, pool_connections=None, pool_maxsize=None,
+                          pool_block=False):
+        # NOTE: aiohttp sessions must be created in a running event loop,
+        # so it is only created by the first request.
+        return self._http_session
+
+    def _create_http_session(self):
+        verify = self.request_options['verify']
+        if verify is False:
+            ssl_context = False
+        elif verify is True:
+            ssl_context = None
+        else:
+            ssl_context = ssl.create_default_context(cafile=verify)
+
+        connector = aiohttp.TCPConnector(
+            limit=self._pool_maxsize, force_close=not self._keep_alive,
+            ssl=ssl_context)
+        timeout = aiohttp.ClientTimeout(
+            total=self.request_options.get('timeout'))
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    async def close(self):
+        """Closes all the pooled connections of this client."""
+        if self.http_session is not None:
+            await self.http_session.close()
+            self.http_session = None
+
+    async def request(self, url, method, **kwargs):
+        headers = self.default_headers
+        if 'headers' in kwargs or 'body' in kwargs:
+            headers = dict(headers)
+            headers.update(kwargs.get('headers', {}))
+
+        data = None
+        if 'body' in kwargs:
+            headers['Content-Type'] = 'application/json'
+            data = jsonutils.dumps(kwargs['body'])
+
+        if self.http_session is None:
+            self.http_session = self._create_http_session()
+
+        self.log_request(method, url, headers, data)
+        async with self.http_session.request(
+                method, url, headers=headers, data=data) as http_resp:
+            resp = AsyncResponse(http_resp.status, http_resp.headers,
+                                 await http_resp.read())
+        self.log_response(resp)
+
+        body = self._load_body(resp)
+
+        if resp.status_code >= 400:
+            raise exceptions.from_response(resp, method, url)
+
+        return resp, body
+
+    async def _cs_request_with_retries(self, url, method, **kwargs):
+        retry_exceptions = (exceptions.ClientException, asyncio.TimeoutError)
+        if aiohttp is not None:
+            retry_exceptions += (aiohttp.ClientError, )
+
+        policy = self.retry_policy
+        policy.record_request()
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                resp, body = await self.request(url, method, **kwargs)
+                return resp, body
+            except retry_exceptions as e:
+                timeout = policy.get_retry_delay(method, e, attempts)
+                if timeout is None:
+                    raise
+
+                self._logger.debug("Request error: %s", six.text_type(e))
+
+            self._logger.debug(
+                "Failed attempt(%(current)s of %(total)s), "
+                " retrying in %(sec).2f seconds", {
+                    'current': attempts,
+                    'total': policy.retries,
+                    'sec': timeout
+                })
+            await asyncio.sleep(timeout)
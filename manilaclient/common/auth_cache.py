@@ -0,0 +1,148 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Cache of Keystone discovery results and tokens of password clients."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from keystoneclient import access
+
+LOG = logging.getLogger(__name__)
+
+# Number of seconds the versions discovered for an auth URL are reused
+DISCOVERY_TTL = 3600
+
+
+class AuthCache(object):
+    """Keystone discovery results and tokens, shared by clients.
+
+    Clients authenticating with a password, and given this cache as
+    ``auth_cache``, look up the identity API versions offered by the auth
+    URL and their token, with its service catalog, here before asking
+    Keystone. Tokens are reused until they are about to expire, as
+    determined by the ``cached_token_lifetime`` of the client.
+
+    Entries are kept in memory and, when ``path`` is given, in a JSON file
+    only readable by its owner, so that they can be reused by other
+    processes. Tokens are keyed by the auth URL, user and project, like
+    tokens stored in the keyring.
+
+    :param path: optional path of the file the cache is persisted to.
+    :param discovery_ttl: number of seconds discovery results are reused.
+    """
+
+    def __init__(self, path=None, discovery_ttl=DISCOVERY_TTL):
+        self.path = os.path.expanduser(path) if path else None
+        self.discovery_ttl = discovery_ttl
+        self._lock = threading.Lock()
+        self._entries = self._read()
+
+    def _read(self):
+        if not self.path:
+            return {}
+        try:
+            with open(self.path) as cache_file:
+                entries = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _write(self, merge=True):
+        if not self.path:
+            return
+        if merge:
+            # NOTE: Keep the entries written by other processes meanwhile.
+            entries = self._read()
+            entries.update(self._entries)
+            self._entries = entries
+        directory = os.path.dirname(self.path)
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory, 0o700)
+            # NOTE: mkstemp creates the file readable by its owner only.
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.auth-')
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(self._entries, cache_file)
+            os.replace(tmp_path, self.path)
+        except (IOError, OSError):
+            LOG.debug("Unable to write the auth cache to %s.", self.path)
+
+    @staticmethod
+    def get_token_key(**auth_params):
+        """Returns the key of the token obtained with the given parameters.
+
+        The password is not part of the key.
+        """
+        auth_params.pop('password', None)
+        params = json.dumps(auth_params, sort_keys=True)
+        return hashlib.sha256(params.encode('utf-8')).hexdigest()
+
+    def get_discovery(self, auth_url):
+        """Returns the URLs of the identity API versions, or None.
+
+        :returns: dict mapping 'v2.0' and 'v3.0' to the URL of the version,
+            or None when it is not offered by the auth URL.
+        """
+        with self._lock:
+            entry = self._entries.get('discovery:' + auth_url)
+        if not entry or entry.get('expires_at', 0) < time.time():
+            return None
+        return entry['versions']
+
+    def set_discovery(self, auth_url, versions):
+        with self._lock:
+            self._entries['discovery:' + auth_url] = {
+                'versions': versions,
+                'expires_at': time.time() + self.discovery_ttl,
+            }
+            self._write()
+
+    def get_auth_ref(self, key, stale_duration=None):
+        """Returns the cached token of a key, unless it expires soon.
+
+        :param key: key returned by :meth:`get_token_key`.
+        :param stale_duration: tokens expiring in less than this number of
+            seconds are not returned.
+        :returns: a keystoneclient AccessInfo object, or None.
+        """
+        with self._lock:
+            entry = self._entries.get('token:' + key)
+        if not entry:
+            return None
+        try:
+            auth_ref = access.AccessInfo.factory(
+                **dict(entry['body'], auth_token=entry['auth_token']))
+            if auth_ref.will_expire_soon(stale_duration):
+                return None
+        except Exception as e:
+            LOG.debug("Ignoring invalid cached token: %s", e)
+            return None
+        return auth_ref
+
+    def set_auth_ref(self, key, auth_ref):
+        with self._lock:
+            self._entries['token:' + key] = {
+                'auth_token': auth_ref.auth_token,
+                'body': dict(auth_ref),
+            }
+            self._write()
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+            self._write(merge=False)
@@ -0,0 +1,68 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Helpers to run the same operation over many resources concurrently."""
+
+from concurrent import futures
+
+# Maximum number of concurrent calls made by bulk operations by default.
+DEFAULT_MAX_WORKERS = 10
+
+
+class BulkResult(object):
+    """Outcome of a bulk operation for a single item."""
+
+    def __init__(self, item, result=None, error=None):
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def failed(self):
+        return self.error is not None
+
+    def __repr__(self):
+        return "<BulkResult item=%s result=%s error=%s>" % (
+            self.item, self.result, self.error)
+
+
+def run(func, items, max_workers=DEFAULT_MAX_WORKERS):
+    """Call ``func`` once for each of ``items`` using a bounded thread pool.
+
+    Exceptions raised by ``func`` are not propagated, they are stored in the
+    ``error`` attribute of the result of the item that raised them, so one
+    failing item does not prevent the remaining ones from being processed.
+
+    :param func: callable accepting a single item.
+    :param items: iterable of items to process.
+    :param max_workers: maximum number of concurrent calls to ``func``. With
+        a value of 1 (or less) items are processed serially in the calling
+        thread.
+    :returns: list of :class:`BulkResult`, in the same order as ``items``.
+    """
+    results = [BulkResult(item) for item in items]
+
+    def _run(result):
+        try:
+            result.result = func(result.item)
+        except Exception as e:
+            result.error = e
+
+    max_workers = min(int(max_workers or 1), len(results))
+    if max_workers <= 1:
+        for result in results:
+            _run(result)
+    else:
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_run, results))
+
+    return results
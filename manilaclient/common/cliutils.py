@@ -16,8 +16,10 @@
 # W0621: Redefining name %s from outer scope
 # pylint: disable=W0603,W0621
 
+import csv
 import getpass
 import inspect
+import json
 import os
 import sys
 import textwrap
@@ -31,6 +33,12 @@ from six import moves
 from manilaclient.common._i18n import _
 
 
+# Formats of the output of print_list and print_dict. The rows of the
+# machine-readable ones are written as they are produced, only 'table'
+# needs all of them before printing anything.
+OUTPUT_FORMATS = ('table', 'json', 'jsonl', 'csv', 'value')
+
+
 class MissingArgs(Exception):
     """Supplied arguments are not sufficient for calling a function."""
     def __init__(self, missing):
@@ -136,10 +144,20 @@ def isunauthenticated(func):
     return getattr(func, 'unauthenticated', False)
 
 
+def _check_output_format(output_format):
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(_("Output format must be one of %s.")
+                         % ', '.join(OUTPUT_FORMATS))
+
+
 def print_list(objs, fields, formatters=None, sortby_index=0,
-               mixed_case_fields=None, field_labels=None):
+               mixed_case_fields=None, field_labels=None,
+               output_format='table'):
     """Print a list or objects as a table, one row per object.
 
+    With an output format other than 'table', rows are printed as they are
+    read from ``objs``, in its order, so that it can be a generator.
+
     :param objs: iterable of :class:`Resource`
     :param fields: attributes that correspond to columns, in order
     :param formatters: `dict` of callables for field formatting
@@ -148,7 +166,9 @@ def print_list(objs, fields, formatters=None, sortby_index=0,
         have mixed case names (e.g., 'serverId')
     :param field_labels: Labels to use in the heading of the table, default to
         fields.
+    :param output_format: one of :data:`OUTPUT_FORMATS`.
     """
+    _check_output_format(output_format)
     formatters = formatters or {}
     mixed_case_fields = mixed_case_fields or []
     field_labels = field_labels or fields
@@ -157,6 +177,23 @@ def print_list(objs, fields, formatters=None, sortby_index=0,
                            "of elements than fields list %(fields)s"),
                          {'labels': field_labels, 'fields': fields})
 
+    field_names = []
+    for field in fields:
+        if field in mixed_case_fields:
+            field_names.append(field.replace(' ', '_'))
+        else:
+            field_names.append(field.lower().replace(' ', '_'))
+
+    def get_rows():
+        for o in objs:
+            yield [formatters[field](o) if field in formatters
+                   else getattr(o, field_name, '')
+                   for field, field_name in zip(fields, field_names)]
+
+    if output_format != 'table':
+        _print_rows(field_labels, get_rows(), output_format)
+        return
+
     if sortby_index is None:
         kwargs = {}
     else:
@@ -164,18 +201,7 @@ def print_list(objs, fields, formatters=None, sortby_index=0,
     pt = prettytable.PrettyTable(field_labels)
     pt.align = 'l'
 
-    for o in objs:
-        row = []
-        for field in fields:
-            if field in formatters:
-                row.append(formatters[field](o))
-            else:
-                if field in mixed_case_fields:
-                    field_name = field.replace(' ', '_')
-                else:
-                    field_name = field.lower().replace(' ', '_')
-                data = getattr(o, field_name, '')
-                row.append(data)
+    for row in get_rows():
         pt.add_row(row)
 
     if six.PY3:
@@ -184,13 +210,24 @@ def print_list(objs, fields, formatters=None, sortby_index=0,
         print(encodeutils.safe_encode(pt.get_string(**kwargs)))
 
 
-def print_dict(dct, dict_property="Property", wrap=0):
+def print_dict(dct, dict_property="Property", wrap=0, output_format='table'):
     """Print a `dict` as a table of two columns.
 
     :param dct: `dict` to print
     :param dict_property: name of the first column
     :param wrap: wrapping for the second column
+    :param output_format: one of :data:`OUTPUT_FORMATS`.
     """
+    _check_output_format(output_format)
+    if output_format in ('json', 'jsonl'):
+        indent = 4 if output_format == 'json' else None
+        _write(json.dumps(dct, indent=indent, default=six.text_type) + '\n')
+        return
+    if output_format != 'table':
+        _print_rows([dict_property, 'Value'],
+                    ([k, v] for k, v in dct.items()), output_format)
+        return
+
     pt = prettytable.PrettyTable([dict_property, 'Value'])
     pt.align = 'l'
     for k, v in dct.items():
@@ -216,6 +253,49 @@ def print_dict(dct, dict_property="Property", wrap=0):
         print(encodeutils.safe_encode(pt.get_string()))
 
 
+def _write(text):
+    if six.PY3:
+        sys.stdout.write(text)
+    else:
+        sys.stdout.write(encodeutils.safe_encode(text))
+
+
+def _to_text(value):
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=six.text_type)
+    return six.text_type(value)
+
+
+def _print_rows(labels, rows, output_format):
+    """Print rows in a machine-readable output format.
+
+    Each row is written once built, nothing is buffered besides the
+    buffering of stdout.
+    """
+    if output_format == 'csv':
+        writer = csv.writer(sys.stdout, lineterminator='\n')
+        writer.writerow(labels)
+        for row in rows:
+            writer.writerow([_to_text(value) for value in row])
+    elif output_format == 'value':
+        for row in rows:
+            _write(' '.join(_to_text(value) for value in row) + '\n')
+    elif output_format == 'jsonl':
+        for row in rows:
+            _write(json.dumps(dict(zip(labels, row)),
+                              default=six.text_type) + '\n')
+    else:
+        # NOTE: The JSON array is written one item at a time.
+        separator = '[\n'
+        for row in rows:
+            _write(separator + '    ' + json.dumps(
+                dict(zip(labels, row)), default=six.text_type))
+            separator = ',\n'
+        _write('[]\n' if separator == '[\n' else '\n]\n')
+
+
 def get_password(max_password_prompts=3):
     """Read password from TTY."""
     verify = strutils.bool_from_string(env("OS_VERIFY_PASSWORD"))
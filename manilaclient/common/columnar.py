@@ -0,0 +1,102 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Column oriented representation of list results."""
+
+import collections
+
+
+class Table(collections.OrderedDict):
+    """List results stored as a dict of columns.
+
+    Keys are the names of the fields of the listed resources, in the order
+    they were first seen, and values are lists holding the value of the
+    field for each resource, or None for resources without it. It can be
+    passed as is to ``pandas.DataFrame``, or converted to NumPy arrays or an
+    Arrow table, when those libraries are installed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(Table, self).__init__(*args, **kwargs)
+        self.num_rows = len(next(iter(self.values()), []))
+
+    @classmethod
+    def from_rows(cls, rows, flatten=()):
+        """Builds a table from dicts, such as the items of a list response.
+
+        :param rows: iterable of dicts, only consumed once so that rows can
+            be generated while they are received.
+        :param flatten: names of the fields holding dicts whose items are
+            stored in separate columns, named '<field>.<key>'.
+        """
+        if isinstance(rows, list):
+            if flatten:
+                rows = [_flatten(row, flatten) for row in rows]
+            names = collections.OrderedDict()
+            for row in rows:
+                for name in row:
+                    names[name] = None
+            return cls((name, [row.get(name) for row in rows])
+                       for name in names)
+
+        # NOTE: Rows are not kept, columns are filled one row at a time and
+        # the ones first seen in later rows are backfilled with None.
+        columns = collections.OrderedDict()
+        num_rows = 0
+        for row in rows:
+            if flatten:
+                row = _flatten(row, flatten)
+            for name in row:
+                if name not in columns:
+                    columns[name] = [None] * num_rows
+            for name, column in columns.items():
+                column.append(row.get(name))
+            num_rows += 1
+        return cls(columns)
+
+    def rows(self):
+        """Yield the rows of the table as dicts."""
+        names = list(self)
+        for values in zip(*self.values()):
+            yield dict(zip(names, values))
+
+    def to_numpy(self):
+        """Returns a dict of NumPy arrays, one for each column."""
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("NumPy is required to convert tables to "
+                              "arrays, it can be installed with "
+                              "'pip install numpy'.")
+        return collections.OrderedDict(
+            (name, numpy.asarray(column)) for name, column in self.items())
+
+    def to_arrow(self):
+        """Returns a ``pyarrow.Table`` with the columns of the table."""
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("PyArrow is required to convert tables to "
+                              "Arrow tables, it can be installed with "
+                              "'pip install pyarrow'.")
+        return pyarrow.Table.from_pydict(dict(self))
+
+
+def _flatten(row, fields):
+    flat = {}
+    for name, value in row.items():
+        if name in fields and isinstance(value, dict):
+            for key, item in value.items():
+                flat['%s.%s' % (name, key)] = item
+        else:
+            flat[name] = value
+    return flat
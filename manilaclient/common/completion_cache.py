@@ -0,0 +1,129 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Storage of resource IDs used for bash autocompletion."""
+
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+
+from manilaclient.common import cliutils
+
+LOG = logging.getLogger(__name__)
+
+CACHE_FILE = 'completion-cache'
+
+
+class FileCompletionCache(object):
+    """Bash autocompletion items stored in a single file.
+
+    Each line of the file holds the type of a resource and either its UUID
+    or its human-friendly ID, separated by a space. A resource listing
+    replaces all the items of its resource type, a resource create appends
+    to them. Every update rewrites the file once, atomically.
+
+    Delete is not handled because listings are assumed to be performed
+    often enough to keep the cache reasonably up-to-date.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+        # NOTE: Commands acting on several resources update the cache from
+        # concurrent threads, updates must not overwrite each other.
+        self._lock = threading.Lock()
+
+    def _read(self):
+        try:
+            with io.open(self.path, encoding='utf-8') as cache_file:
+                return [line.rstrip('\n') for line in cache_file if line]
+        except (IOError, OSError):
+            return []
+
+    def _write(self, lines):
+        directory = os.path.dirname(self.path)
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory, 0o755)
+            fd, tmp_path = tempfile.mkstemp(dir=directory,
+                                            prefix='.completion-')
+            with io.open(fd, 'w', encoding='utf-8') as cache_file:
+                cache_file.writelines(line + '\n' for line in lines)
+            os.replace(tmp_path, self.path)
+        except (IOError, OSError):
+            # NOTE: This is typically a permission denied while attempting to
+            # write the cache file, don't fail because of it.
+            LOG.debug("Unable to write the completion cache to %s.",
+                      self.path)
+
+    def update(self, resource_type, resources, replace=False):
+        """Add the IDs of ``resources`` to the cache.
+
+        :param resource_type: name of the type of the resources.
+        :param resources: list of resources.
+        :param replace: whether to drop the items cached for
+            ``resource_type`` first.
+        """
+        values = []
+        for resource in resources:
+            # NOTE: Read the ID from the resource info, so resources that are
+            # not loaded are not fetched from the API.
+            for value in (resource._info.get('id'), resource.human_id):
+                if value is not None:
+                    values.append(str(value))
+        self.add_values(resource_type, values, replace=replace)
+
+    def add_values(self, resource_type, values, replace=False):
+        """Add UUIDs or human-friendly IDs to the cache.
+
+        The file is only rewritten when the cached items change.
+
+        :param resource_type: name of the type of the resources.
+        :param values: list of IDs.
+        :param replace: whether to drop the items cached for
+            ``resource_type`` first.
+        """
+        prefix = resource_type + ' '
+        with self._lock:
+            lines = self._read()
+            if replace:
+                new_lines = [line for line in lines
+                             if not line.startswith(prefix)]
+            else:
+                new_lines = list(lines)
+            known = set(new_lines)
+            for value in values:
+                line = prefix + value
+                if line not in known:
+                    known.add(line)
+                    new_lines.append(line)
+            if set(new_lines) != set(lines):
+                self._write(new_lines)
+
+
+def get_default_cache():
+    """Returns the cache used by the manila shell.
+
+    The cache is kept under env[MANILACLIENT_UUID_CACHE_DIR] (defaulting to
+    ~/.manilaclient), in a separate directory for each username and endpoint
+    pair.
+    """
+    base_dir = cliutils.env('manilaclient_UUID_CACHE_DIR',
+                            'MANILACLIENT_UUID_CACHE_DIR',
+                            default="~/.manilaclient")
+    username = cliutils.env('OS_USERNAME', 'MANILA_USERNAME')
+    url = cliutils.env('OS_URL', 'MANILA_URL')
+    uniqifier = hashlib.md5(username.encode('utf-8') +
+                            url.encode('utf-8')).hexdigest()
+    return FileCompletionCache(os.path.join(base_dir, uniqifier, CACHE_FILE))
@@ -16,16 +16,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import logging
 from urllib import parse
 
+from keystoneauth1 import adapter
 from oslo_serialization import jsonutils
 from oslo_utils import strutils
 import re
 import requests
 import six
 
+from manilaclient.common import retry
+from manilaclient.common import single_flight
 from manilaclient import exceptions
 
 try:
@@ -47,11 +49,19 @@ class HTTPClient(object):
 
     def __init__(self, endpoint_url, token, user_agent, api_version,
                  insecure=False, cacert=None, timeout=None, retries=None,
-                 http_log_debug=False):
+                 http_log_debug=False, pool_connections=None,
+                 pool_maxsize=None, pool_block=False, keep_alive=True,
+                 response_cache=None, coalesce_requests=False,
+                 retry_policy=None):
         self.endpoint_url = endpoint_url
         self.base_url = self._get_base_url(self.endpoint_url)
         self.retries = int(retries or 0)
+        self.retry_policy = retry_policy or retry.RetryPolicy(
+            retries=self.retries)
         self.http_log_debug = http_log_debug
+        self.response_cache = response_cache
+        self.in_flight = (single_flight.SingleFlight() if coalesce_requests
+                          else None)
 
         self.request_options = self._set_request_options(
             insecure, cacert, timeout)
@@ -62,9 +72,42 @@ class HTTPClient(object):
             'User-Agent': user_agent,
             'Accept': 'application/json',
         }
+        if not keep_alive:
+            self.default_headers['Connection'] = 'close'
+
+        self.http_session = self._get_http_session(
+            pool_connections, pool_maxsize, pool_block)
 
         self._add_log_handlers(http_log_debug)
 
+    def _get_http_session(self, pool_connections=None, pool_maxsize=None,
+                          pool_block=False):
+        """Returns a session owning a pool of reusable connections.
+
+        All the requests made by this client (and thus by every manager of
+        the API client that owns it) go through the same session, so TCP/TLS
+        connections to the endpoint are kept alive and reused between calls.
+
+        :param pool_connections: number of per-host connection pools to cache
+        :param pool_maxsize: maximum number of connections kept per host
+        :param pool_block: whether to block, instead of opening extra
+            connections, when all the ``pool_maxsize`` connections to a host
+            are in use
+        """
+        http_session = requests.Session()
+        http_adapter = requests.adapters.HTTPAdapter(
+            pool_connections=(pool_connections or
+                              requests.adapters.DEFAULT_POOLSIZE),
+            pool_maxsize=pool_maxsize or requests.adapters.DEFAULT_POOLSIZE,
+            pool_block=pool_block)
+        for scheme in ('http://', 'https://'):
+            http_session.mount(scheme, http_adapter)
+        return http_session
+
+    def close(self):
+        """Closes all the pooled connections of this client."""
+        self.http_session.close()
+
     def _add_log_handlers(self, http_log_debug):
         self._logger = logging.getLogger(__name__)
 
@@ -103,38 +146,122 @@ class HTTPClient(object):
         return options
 
     def request(self, url, method, **kwargs):
-        headers = copy.deepcopy(self.default_headers)
-        headers.update(kwargs.get('headers', {}))
+        if (self.in_flight is None or method != 'GET' or
+                kwargs.get('stream')):
+            return self._request(url, method, **kwargs)
+
+        # NOTE: Identical GETs made by other threads while this one is in
+        # flight wait for its response instead of being sent. Each of them
+        # decodes its own body, so that they don't share mutable objects.
+        headers = dict(self.default_headers, **kwargs.get('headers', {}))
+        key = (url, tuple(sorted(headers.items())))
+        (resp, body), shared = self.in_flight.do(
+            key, self._request, url, method, **kwargs)
+        if shared:
+            body = self._load_body(resp)
+        return resp, body
 
-        options = copy.deepcopy(self.request_options)
+    def _request(self, url, method, **kwargs):
+        # NOTE: Headers and options only hold strings and numbers, so they
+        # are only copied, shallowly, when the request adds to them.
+        headers = self.default_headers
+        options = self.request_options
+
+        if 'headers' in kwargs or 'body' in kwargs:
+            headers = dict(headers)
+            headers.update(kwargs.get('headers', {}))
 
         if 'body' in kwargs:
             headers['Content-Type'] = 'application/json'
-            options['data'] = jsonutils.dumps(kwargs['body'])
+            options = dict(options, data=jsonutils.dumps(kwargs['body']))
+
+        stream = kwargs.get('stream', False)
+        if stream:
+            options = dict(options, stream=True)
 
         self.log_request(method, url, headers, options.get('data', None))
-        resp = requests.request(method, url, headers=headers, **options)
-        self.log_response(resp)
+        resp = self._send(method, url, headers, options)
 
-        body = None
+        if stream and resp.status_code < 400:
+            # NOTE: The body is left unread, the caller consumes it with
+            # resp.iter_content() and closes the response.
+            self.log_response(resp, stream=True)
+            return resp, None
 
-        if resp.text:
-            try:
-                body = jsonutils.loads(resp.text)
-            except ValueError:
-                pass
+        self.log_response(resp)
+
+        body = self._load_body(resp)
 
         if resp.status_code >= 400:
             raise exceptions.from_response(resp, method, url)
 
         return resp, body
 
+    def _send(self, method, url, headers, options):
+        """Sends a request, returns its response whatever its status."""
+        return self.http_session.request(
+            method, url, headers=headers, **options)
+
+    @staticmethod
+    def _load_body(resp):
+        """Returns the deserialized JSON body of a response, if any.
+
+        The body is decoded from the raw bytes of the response, which avoids
+        guessing the encoding of the text of large responses.
+        """
+        if resp.status_code == 204 or not resp.content:
+            return None
+        try:
+            return jsonutils.loads(resp.content)
+        except ValueError:
+            return None
+
     def _cs_request(self, url, method, **kwargs):
+        if self.response_cache is not None and not kwargs.get('stream'):
+            return self._cs_request_cached(url, method, **kwargs)
         return self._cs_request_with_retries(
             self.endpoint_url + url,
             method,
             **kwargs)
 
+    def _cs_request_cached(self, url, method, **kwargs):
+        """Makes a request through the response cache of the client.
+
+        GET responses of cacheable resources are returned from the cache
+        while fresh, any other request drops the responses cached for the
+        collection it acts on.
+        """
+        cache = self.response_cache
+        if method != 'GET':
+            try:
+                return self._cs_request_with_retries(
+                    self.endpoint_url + url, method, **kwargs)
+            finally:
+                cache.invalidate(url)
+
+        if cache.get_ttl(url) is None:
+            return self._cs_request_with_retries(
+                self.endpoint_url + url, method, **kwargs)
+
+        headers = dict(self.default_headers, **kwargs.get('headers', {}))
+        key = (url, tuple(sorted(headers.items())))
+        entry, fresh = cache.lookup(key)
+        if fresh:
+            return entry.resp, self._load_body(entry.resp)
+
+        if entry is not None:
+            kwargs['headers'] = dict(kwargs.get('headers', {}),
+                                     **cache.get_conditional_headers(entry))
+        resp, body = self._cs_request_with_retries(
+            self.endpoint_url + url, method, **kwargs)
+
+        if entry is not None and resp.status_code == 304:
+            cache.refresh(key, url, entry)
+            return entry.resp, self._load_body(entry.resp)
+        if resp.status_code == 200:
+            cache.store(key, url, resp)
+        return resp, body
+
     def _cs_request_base_url(self, url, method, **kwargs):
         return self._cs_request_with_retries(
             self.base_url + url,
@@ -142,30 +269,30 @@ class HTTPClient(object):
             **kwargs)
 
     def _cs_request_with_retries(self, url, method, **kwargs):
+        policy = self.retry_policy
+        policy.record_request()
         attempts = 0
-        timeout = 1
         while True:
             attempts += 1
             try:
                 resp, body = self.request(url, method, **kwargs)
                 return resp, body
-            except (exceptions.BadRequest,
-                    requests.exceptions.RequestException,
+            except (requests.exceptions.RequestException,
                     exceptions.ClientException) as e:
-                if attempts > self.retries:
+                timeout = policy.get_retry_delay(method, e, attempts)
+                if timeout is None:
                     raise
 
                 self._logger.debug("Request error: %s", six.text_type(e))
 
             self._logger.debug(
                 "Failed attempt(%(current)s of %(total)s), "
-                " retrying in %(sec)s seconds", {
+                " retrying in %(sec).2f seconds", {
                     'current': attempts,
-                    'total': self.retries,
+                    'total': policy.retries,
                     'sec': timeout
                 })
             sleep(timeout)
-            timeout *= 2
 
     def get_with_base_url(self, url, **kwargs):
         return self._cs_request_base_url(url, 'GET', **kwargs)
@@ -198,12 +325,54 @@ class HTTPClient(object):
             string_parts.append(" -d '%s'" % data)
         self._logger.debug("\nREQ: %s\n", "".join(string_parts))
 
-    def log_response(self, resp):
+    def log_response(self, resp, stream=False):
         if not self.http_log_debug:
             return
         self._logger.debug(
             "RESP: [%(code)s] %(headers)s\nRESP BODY: %(body)s\n", {
                 'code': resp.status_code,
                 'headers': resp.headers,
-                'body': resp.text
+                'body': '<streamed>' if stream else resp.text
             })
+
+
+class SessionClient(HTTPClient):
+    """HTTP client sending requests through a keystoneauth session.
+
+    Requests reuse the pooled connections of the session and are
+    authenticated by it: the token is obtained from the auth plugin on each
+    request, so it is renewed when it expires, and a request rejected with
+    "401 Unauthorized" is retried once with a new token. Retries, response
+    caching and request coalescing work as with :class:`HTTPClient`.
+
+    The session is owned by the caller, :meth:`close` does not close it.
+    """
+
+    def __init__(self, session, endpoint_url, user_agent, api_version,
+                 auth=None, timeout=None, retries=None, http_log_debug=False,
+                 response_cache=None, coalesce_requests=False,
+                 retry_policy=None):
+        self.adapter = adapter.Adapter(session=session, auth=auth,
+                                       user_agent=user_agent)
+        super(SessionClient, self).__init__(
+            endpoint_url, None, user_agent, api_version, timeout=timeout,
+            retries=retries, http_log_debug=http_log_debug,
+            response_cache=response_cache,
+            coalesce_requests=coalesce_requests, retry_policy=retry_policy)
+        # NOTE: The session adds the token and the user agent.
+        del self.default_headers['X-Auth-Token']
+        del self.default_headers['User-Agent']
+
+    def _get_http_session(self, pool_connections=None, pool_maxsize=None,
+                          pool_block=False):
+        return self.adapter.session
+
+    def close(self):
+        pass
+
+    def _send(self, method, url, headers, options):
+        # NOTE: TLS verification is configured on the session.
+        options = dict((k, v) for k, v in options.items() if k != 'verify')
+        return self.adapter.request(url, method, headers=headers,
+                                    raise_exc=False,
+                                    log=not options.get('stream'), **options)
@@ -0,0 +1,120 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Incremental parsing of JSON list responses."""
+
+import codecs
+import json
+
+_WHITESPACE = ' \t\n\r'
+
+
+class _Reader(object):
+    """Text buffer filled from an iterable of byte chunks on demand."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json_decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _read(self):
+        """Appends the next chunk to the buffer, returns False at the end."""
+        if self.eof:
+            return False
+        # NOTE: Drop the consumed text so the buffer does not grow with the
+        # size of the response.
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        for chunk in self._chunks:
+            if chunk:
+                self.buffer += self._decoder.decode(chunk)
+                return True
+        self.buffer += self._decoder.decode(b'', final=True)
+        self.eof = True
+        return True
+
+    def peek(self):
+        """Returns the next non whitespace character, without consuming it."""
+        while True:
+            while (self.pos < len(self.buffer) and
+                   self.buffer[self.pos] in _WHITESPACE):
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read():
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, chars):
+        char = self.peek()
+        if char not in chars:
+            raise ValueError("Expected one of %r at position %d, got %r" % (
+                chars, self.pos, char))
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decodes and consumes the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(
+                    self.buffer, self.pos)
+            except ValueError:
+                if not self._read():
+                    raise
+                continue
+            # NOTE: A number at the end of the buffer could continue in the
+            # next chunk, values are only complete once followed by another
+            # character.
+            if end < len(self.buffer) or not self._read():
+                self.pos = end
+                return value
+
+
+def iter_items(chunks, key, values=None):
+    """Yield the items of a list of a JSON object one by one.
+
+    Only the text of the item being decoded is kept in memory, so a listing
+    can be processed as it is received, whatever its size.
+
+    :param chunks: iterable of bytes with the UTF-8 encoded JSON object,
+        such as ``requests.Response.iter_content()``.
+    :param key: key of the list in the JSON object.
+    :param values: optional dict, updated with the other keys of the JSON
+        object (e.g. 'count') as they are read.
+    :raises ValueError: if the document is not a valid JSON object.
+    """
+    reader = _Reader(chunks)
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+    while True:
+        name = reader.value()
+        reader.expect(':')
+        if name == key and reader.peek() == '[':
+            reader.expect('[')
+            if reader.peek() == ']':
+                reader.expect(']')
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.expect(',]') == ']':
+                        break
+        else:
+            value = reader.value()
+            if values is not None:
+                values[name] = value
+        if reader.expect(',}') == '}':
+            return
@@ -0,0 +1,171 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Client side cache of the responses of read-mostly API resources."""
+
+import collections
+import re
+import threading
+import time
+
+# Paths of the resources cached by default, relative to the endpoint, and
+# the number of seconds their responses are fresh for. Limits include the
+# resources in use by the project, so they are only cached briefly.
+DEFAULT_TTLS = (
+    (r'/types([/?]|$)', 300),
+    (r'/share-group-types([/?]|$)', 300),
+    (r'/(os-)?availability-zones?([/?]|$)', 300),
+    (r'/(os-)?services([/?]|$)', 60),
+    (r'/(os-)?quota-sets/[^/?]+/defaults([?]|$)', 300),
+    (r'/limits([?]|$)', 10),
+)
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+def get_collection(url):
+    """Returns the name of the collection a relative URL belongs to.
+
+    Legacy 'os-' prefixes are dropped, so that '/os-services' and
+    '/services' belong to the same collection.
+    """
+    name = re.split(r'[/?]', url.lstrip('/'), 1)[0]
+    if name.startswith('os-'):
+        name = name[3:]
+    return name
+
+
+class _Entry(object):
+
+    __slots__ = ('resp', 'collection', 'expires_at')
+
+    def __init__(self, resp, collection, expires_at):
+        self.resp = resp
+        self.collection = collection
+        self.expires_at = expires_at
+
+
+class MemoryResponseCache(object):
+    """In-memory LRU cache of the responses of GET requests.
+
+    It is passed to :class:`manilaclient.common.httpclient.HTTPClient` as
+    ``response_cache``. Only the responses of the GET requests whose path
+    matches one of ``ttls`` are stored, they are returned until they are
+    ``ttl`` seconds old. Any other request made by the client to the
+    collection of a cached response, e.g. a share type create or delete,
+    drops the responses cached for that collection.
+
+    Responses are cached by URL and request headers, so responses obtained
+    with different tokens or API versions are not mixed up.
+
+    With ``conditional=True`` an expired response with an ETag or a
+    Last-Modified header is revalidated with a conditional request, and
+    reused if the server answers with "304 Not Modified".
+
+    :param ttls: sequence of (regular expression, seconds) pairs, matched
+        in order against the path of the request relative to the endpoint.
+        Defaults to :data:`DEFAULT_TTLS`.
+    :param max_entries: maximum number of cached responses, the least
+        recently used ones are dropped first.
+    :param conditional: whether to revalidate expired responses.
+    """
+
+    def __init__(self, ttls=None, max_entries=DEFAULT_MAX_ENTRIES,
+                 conditional=True):
+        self.ttls = [(re.compile(pattern), ttl)
+                     for pattern, ttl in (ttls or DEFAULT_TTLS)]
+        self.max_entries = max_entries
+        self.conditional = conditional
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = collections.Counter()
+
+    def get_ttl(self, url):
+        """Returns the TTL of the responses of a URL, None if not cached."""
+        for pattern, ttl in self.ttls:
+            if pattern.match(url):
+                return ttl
+        return None
+
+    def lookup(self, key):
+        """Returns the entry cached for a key and whether it is fresh.
+
+        Stale entries are only returned when they can be revalidated.
+        Lookups of fresh entries are counted as hits, the others as misses.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return entry, True
+                if not (self.conditional and self._validators(entry.resp)):
+                    del self._entries[key]
+                    entry = None
+            self._stats['misses'] += 1
+            return entry, False
+
+    def store(self, key, url, resp):
+        """Caches the response of a GET request, until its TTL expires."""
+        ttl = self.get_ttl(url)
+        if ttl is None:
+            return
+        with self._lock:
+            self._entries[key] = _Entry(resp, get_collection(url),
+                                        time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def refresh(self, key, url, entry):
+        """Renews an entry after the server reported it is not modified."""
+        with self._lock:
+            self._stats['revalidations'] += 1
+        self.store(key, url, entry.resp)
+
+    def invalidate(self, url=None):
+        """Drops the responses of the collection of a URL, or all of them."""
+        collection = get_collection(url) if url is not None else None
+        with self._lock:
+            keys = [key for key, entry in self._entries.items()
+                    if collection is None or entry.collection == collection]
+            for key in keys:
+                del self._entries[key]
+            self._stats['invalidations'] += len(keys)
+
+    def get_conditional_headers(self, entry):
+        """Returns the headers of a request revalidating an entry."""
+        if not self.conditional:
+            return {}
+        return self._validators(entry.resp)
+
+    @staticmethod
+    def _validators(resp):
+        headers = {}
+        if resp.headers.get('ETag'):
+            headers['If-None-Match'] = resp.headers['ETag']
+        if resp.headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = resp.headers['Last-Modified']
+        return headers
+
+    def get_stats(self):
+        """Returns the hits, misses, revalidations and invalidations."""
+        with self._lock:
+            stats = dict.fromkeys(
+                ('hits', 'misses', 'revalidations', 'invalidations'), 0)
+            stats.update(self._stats)
+            stats['entries'] = len(self._entries)
+            return stats
+
+    def __len__(self):
+        return len(self._entries)
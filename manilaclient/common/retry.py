@@ -0,0 +1,190 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Policies deciding whether and when failed API requests are retried."""
+
+import collections
+from email import utils as email_utils
+import random
+import threading
+import time
+
+import requests
+
+from manilaclient import exceptions
+
+# Methods whose requests can be sent again without side effects.
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+
+# Statuses of the responses to idempotent requests that are retried.
+RETRY_STATUSES = frozenset((408, 413, 429, 500, 502, 503, 504))
+
+# Statuses of the responses to other requests that are retried, the
+# server did not process the request.
+NON_IDEMPOTENT_RETRY_STATUSES = frozenset((413, 429, 503))
+
+# Transport errors raised before the request was sent, so that any
+# request can be retried after them.
+CONNECT_ERRORS = (requests.exceptions.ConnectTimeout, )
+
+
+class RetryBudget(object):
+    """Caps the number of retries relative to the number of requests.
+
+    Each request deposits ``ratio`` in the budget, up to ``reserve``, and
+    each retry withdraws 1. Over time retries are thus limited to
+    ``ratio`` times the number of requests, with bursts of up to
+    ``reserve`` retries, so that retries don't multiply the load of an
+    API that is already struggling.
+    """
+
+    def __init__(self, ratio=0.2, reserve=10):
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = float(reserve)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._balance = min(self.reserve, self._balance + self.ratio)
+
+    def withdraw(self):
+        """Returns whether a retry is allowed, accounting for it if so."""
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy(object):
+    """Decides whether and when failed requests are retried.
+
+    Only transport errors and the responses whose status is in
+    ``retry_statuses`` are retried, client errors such as 400, 404 or 409
+    are not. Requests whose method is not idempotent, e.g. POST, are only
+    retried when the server did not process them: the statuses of
+    ``non_idempotent_statuses`` and errors establishing the connection.
+
+    Retries are delayed with a capped exponential backoff, with jitter, or
+    by the number of seconds of the Retry-After header of the response
+    when there is one, up to ``max_retry_after``.
+
+    :param retries: maximum number of retries of a request.
+    :param backoff: delay before the first retry, in seconds, doubled for
+        each subsequent one.
+    :param max_backoff: maximum delay between two attempts, in seconds.
+    :param jitter: whether to randomize delays, between half and all of
+        their value, to spread the retries of concurrent clients.
+    :param retry_statuses: statuses retried for idempotent methods.
+    :param non_idempotent_statuses: statuses retried for other methods.
+    :param idempotent_methods: methods considered idempotent.
+    :param max_retry_after: maximum delay honoured from Retry-After
+        headers, requests asking to wait longer are not retried.
+    :param budget: optional :class:`RetryBudget` shared by the requests.
+    :param on_retry: optional callable called with the method, the
+        error, the attempt number and the delay of every retry, e.g. to
+        report metrics.
+    """
+
+    def __init__(self, retries=0, backoff=1.0, max_backoff=30.0,
+                 jitter=True, retry_statuses=RETRY_STATUSES,
+                 non_idempotent_statuses=NON_IDEMPOTENT_RETRY_STATUSES,
+                 idempotent_methods=IDEMPOTENT_METHODS, max_retry_after=60,
+                 budget=None, on_retry=None):
+        self.retries = int(retries or 0)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.non_idempotent_statuses = frozenset(non_idempotent_statuses)
+        self.idempotent_methods = frozenset(idempotent_methods)
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+        self.on_retry = on_retry
+        self._stats = collections.Counter()
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        """Accounts for a new request, before its first attempt."""
+        if self.budget is not None:
+            self.budget.deposit()
+        self._count('requests')
+
+    def get_retry_delay(self, method, error, attempt):
+        """Returns the seconds to wait before retrying, None to give up.
+
+        :param method: HTTP method of the request.
+        :param error: exception raised by the attempt.
+        :param attempt: number of the failed attempt, starting at 1.
+        """
+        if not self.is_retryable(method, error):
+            return None
+        if attempt > self.retries:
+            self._count('exhausted')
+            return None
+
+        delay = self._get_retry_after(error)
+        if delay is None:
+            delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+            if self.jitter:
+                delay = random.uniform(delay / 2.0, delay)
+        elif delay > self.max_retry_after:
+            self._count('retry_after_exceeded')
+            return None
+
+        if self.budget is not None and not self.budget.withdraw():
+            self._count('budget_exhausted')
+            return None
+
+        self._count('retries')
+        status = getattr(error, 'http_status', None)
+        self._count('retries.%s' % (status or type(error).__name__))
+        if self.on_retry is not None:
+            self.on_retry(method, error, attempt, delay)
+        return delay
+
+    def is_retryable(self, method, error):
+        """Returns whether a request failing with ``error`` can be retried."""
+        idempotent = method.upper() in self.idempotent_methods
+        if isinstance(error, exceptions.HttpError):
+            statuses = (self.retry_statuses if idempotent
+                        else self.non_idempotent_statuses)
+            return error.http_status in statuses
+        if isinstance(error, exceptions.ClientException):
+            return False
+        return idempotent or isinstance(error, CONNECT_ERRORS)
+
+    @staticmethod
+    def _get_retry_after(error):
+        response = getattr(error, 'response', None)
+        value = getattr(response, 'headers', {}).get('retry-after')
+        if not value:
+            return None
+        try:
+            return max(0, float(value))
+        except ValueError:
+            pass
+        try:
+            date = email_utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0, date.timestamp() - time.time())
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def get_stats(self):
+        """Returns the number of requests and retries, by cause."""
+        with self._lock:
+            return dict(self._stats)
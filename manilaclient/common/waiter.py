@@ -0,0 +1,213 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Wait for many resources to reach a status with a few API calls."""
+
+import random
+import time
+
+from manilaclient.common.apiclient import base as common_base
+from manilaclient import exceptions
+
+# Possible outcomes of waiting for a resource
+SUCCESS = 'success'
+DELETED = 'deleted'
+ERROR = 'error'
+NOT_FOUND = 'not_found'
+TIMEOUT = 'timeout'
+
+
+class WaitResult(object):
+    """Outcome of waiting for a single resource."""
+
+    def __init__(self, resource_id, outcome, resource=None):
+        self.resource_id = resource_id
+        self.outcome = outcome
+        self.resource = resource
+
+    @property
+    def succeeded(self):
+        return self.outcome in (SUCCESS, DELETED)
+
+    def __repr__(self):
+        return "<WaitResult resource_id=%s outcome=%s>" % (
+            self.resource_id, self.outcome)
+
+
+# Maximum number of pending resources checked with one GET each, a listing
+# is only made when more of them are pending.
+GET_THRESHOLD = 3
+
+# Maximum number of pages of resources listed by each check.
+MAX_PAGES = 5
+
+PAGE_SIZE = 100
+
+
+def _get_resources(manager, resource_ids):
+    resources = {}
+    for resource_id in resource_ids:
+        try:
+            resources[resource_id] = manager.get(resource_id)
+        except exceptions.NotFound:
+            pass
+    return resources
+
+
+def _list_resources(manager, resource_ids, search_opts,
+                    get_threshold=GET_THRESHOLD, max_pages=MAX_PAGES,
+                    page_size=PAGE_SIZE):
+    """Returns the current state of the given resources.
+
+    A few resources, or resources whose listing can't be narrowed by
+    ``search_opts``, are requested one by one. Otherwise at most
+    ``max_pages`` pages of resources are listed, the most recent first,
+    stopping as soon as all of them were seen, and the ones missing from
+    the listing are requested one by one, to tell deleted resources from
+    ones listed later.
+
+    :returns: a tuple of a dict with the found resources by ID, and whether
+        the listing was worth it. It is not when it was cut before all the
+        resources were seen, the next checks should request them one by
+        one then.
+    """
+    limit = max_pages * page_size
+    if (search_opts is None or len(resource_ids) <= get_threshold or
+            len(resource_ids) > limit):
+        return _get_resources(manager, resource_ids), False
+
+    # NOTE: Resources being waited for are usually recent ones.
+    search_opts = dict({'sort_key': 'created_at', 'sort_dir': 'desc'},
+                       **search_opts)
+    search_opts['limit'] = limit
+    if hasattr(manager, 'list_iter'):
+        resources = manager.list_iter(search_opts=search_opts,
+                                      page_size=page_size)
+    else:
+        resources = manager.list(search_opts=search_opts)
+
+    wanted = set(resource_ids)
+    found = {}
+    listed = 0
+    try:
+        for resource in resources:
+            listed += 1
+            if resource.id in wanted:
+                found[resource.id] = resource
+                if len(found) == len(wanted):
+                    break
+    finally:
+        close = getattr(resources, 'close', None)
+        if close is not None:
+            close()
+
+    missing = [resource_id for resource_id in resource_ids
+               if resource_id not in found]
+    found.update(_get_resources(manager, missing))
+    return found, not missing or listed < limit
+
+
+def _get_search_opts(resources):
+    """Returns options listing the project of the resources, or None."""
+    # NOTE: Attributes are read from _info, so that summary resources are
+    # not loaded just to find their project.
+    project_ids = set(getattr(resource, '_info', {}).get('project_id')
+                      for resource in resources)
+    if len(project_ids) != 1 or None in project_ids:
+        return None
+    return {'all_tenants': 1, 'project_id': project_ids.pop()}
+
+
+def wait_for_resources(manager, resources, expected_status=('available',),
+                       status_attr='status', search_opts=None, timeout=900,
+                       interval=1, max_interval=30,
+                       get_threshold=GET_THRESHOLD, max_pages=MAX_PAGES):
+    """Wait for several resources to reach one of the expected states.
+
+    Instead of polling every resource on its own, each check lists the
+    most recent resources of ``manager`` once, filtered by ``search_opts``,
+    and looks up the pending ones in the result. When only a few resources
+    are pending, when the listing can't be filtered, or once a listing was
+    cut before all of them were seen, they are polled one by one.
+    Checks are spaced with an exponential backoff with jitter, and waiting
+    stops at the latest after ``timeout`` seconds.
+
+    :param manager: manager of the resources, it must implement ``get`` and
+        ``list`` (with a ``search_opts`` argument).
+    :param resources: list of resources or resource IDs to wait for.
+    :param expected_status: a string or a list of strings with the expected
+        states. 'deleted' means waiting for the resources to disappear.
+    :param status_attr: name of the attribute holding the status.
+    :param search_opts: search options narrowing the listing of the
+        resources. Defaults to listing the project of the resources when
+        they all belong to the same known project, else resources are
+        polled one by one.
+    :param timeout: maximum number of seconds to wait for.
+    :param interval: number of seconds to wait before the first retry.
+    :param max_interval: maximum number of seconds between two checks.
+    :param get_threshold: maximum number of pending resources polled one by
+        one instead of being listed.
+    :param max_pages: maximum number of pages listed by each check.
+    :returns: list of :class:`WaitResult` in the same order as ``resources``.
+    """
+    if not isinstance(expected_status, (list, tuple, set)):
+        expected_status = (expected_status, )
+    if search_opts is None:
+        search_opts = _get_search_opts(resources)
+
+    resource_ids = [common_base.getid(resource) for resource in resources]
+    if not resource_ids:
+        return []
+
+    results = {}
+    pending = list(resource_ids)
+    list_opts = search_opts
+    deadline = time.time() + timeout
+    attempt = 0
+
+    while True:
+        current, worth_listing = _list_resources(
+            manager, pending, list_opts, get_threshold=get_threshold,
+            max_pages=max_pages)
+        if not worth_listing:
+            # NOTE: The listing does not cover the pending resources, it
+            # would only add requests to the ones made for each of them.
+            list_opts = None
+        for resource_id in list(pending):
+            resource = current.get(resource_id)
+            if resource is None:
+                outcome = (DELETED if 'deleted' in expected_status
+                           else NOT_FOUND)
+            else:
+                status = getattr(resource, status_attr, None) or ''
+                if status in expected_status:
+                    outcome = SUCCESS
+                elif 'error' in status:
+                    outcome = ERROR
+                else:
+                    continue
+            results[resource_id] = WaitResult(resource_id, outcome, resource)
+            pending.remove(resource_id)
+
+        remaining = deadline - time.time()
+        if not pending or remaining <= 0:
+            break
+
+        delay = min(max_interval, interval * 2 ** attempt)
+        time.sleep(min(remaining, random.uniform(delay / 2.0, delay)))
+        attempt += 1
+
+    for resource_id in pending:
+        results[resource_id] = WaitResult(
+            resource_id, TIMEOUT, current.get(resource_id))
+
+    return [results[resource_id] for resource_id in resource_ids]
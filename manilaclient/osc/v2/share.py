@@ -24,7 +24,9 @@ from osc_lib import utils as oscutils
 from manilaclient import api_versions
 from manilaclient.common._i18n import _
 from manilaclient.common.apiclient import utils as apiutils
+from manilaclient.common import bulk
 from manilaclient.common import cliutils
+from manilaclient.common import waiter
 from manilaclient.osc import utils
 
 LOG = logging.getLogger(__name__)
@@ -276,35 +278,51 @@ class DeleteShare(command.Command):
             default=False,
             help=_("Wait for share deletion")
         )
+        parser.add_argument(
+            "--concurrency",
+            metavar="<concurrency>",
+            type=int,
+            default=bulk.DEFAULT_MAX_WORKERS,
+            help=_("Maximum number of shares deleted concurrently "
+                   "(defaults to %d)") % bulk.DEFAULT_MAX_WORKERS
+        )
         return parser
 
     def take_action(self, parsed_args):
         share_client = self.app.client_manager.share
-        result = 0
+        share_group_id = None
+        if parsed_args.share_group:
+            share_group_id = apiutils.find_resource(
+                share_client.share_groups, parsed_args.share_group).id
+
+        def _delete_share(share):
+            share_obj = apiutils.find_resource(
+                share_client.shares, share
+            )
+            if parsed_args.force:
+                share_client.shares.force_delete(share_obj)
+            else:
+                share_client.shares.delete(share_obj,
+                                           share_group_id)
+            return share_obj
 
-        for share in parsed_args.shares:
-            try:
-                share_obj = apiutils.find_resource(
-                    share_client.shares, share
-                )
-                share_group_id = (share_group_id if parsed_args.share_group
-                                  else None)
-                if parsed_args.force:
-                    share_client.shares.force_delete(share_obj)
-                else:
-                    share_client.shares.delete(share_obj,
-                                               share_group_id)
-                if parsed_args.wait:
-                    if not oscutils.wait_for_delete(
-                            manager=share_client.shares,
-                            res_id=share_obj.id):
-                        result += 1
-
-            except Exception as exc:
+        result = 0
+        deleted_shares = []
+        for outcome in bulk.run(_delete_share, parsed_args.shares,
+                                max_workers=parsed_args.concurrency):
+            if outcome.failed:
                 result += 1
                 LOG.error(_("Failed to delete share with "
                             "name or ID '%(share)s': %(e)s"),
-                          {'share': share, 'e': exc})
+                          {'share': outcome.item, 'e': outcome.error})
+            else:
+                deleted_shares.append(outcome.result)
+
+        if parsed_args.wait:
+            wait_results = waiter.wait_for_resources(
+                share_client.shares, deleted_shares,
+                expected_status='deleted')
+            result += len([r for r in wait_results if not r.succeeded])
 
         if result > 0:
             total = len(parsed_args.shares)
@@ -928,33 +946,46 @@ class AbandonShare(command.Command):
             action='store_true',
             help=_("Wait until share is abandoned")
         )
+        parser.add_argument(
+            "--concurrency",
+            metavar="<concurrency>",
+            type=int,
+            default=bulk.DEFAULT_MAX_WORKERS,
+            help=_("Maximum number of shares abandoned concurrently "
+                   "(defaults to %d)") % bulk.DEFAULT_MAX_WORKERS
+        )
         return parser
 
     def take_action(self, parsed_args):
         share_client = self.app.client_manager.share
-        result = 0
 
-        for share in parsed_args.share:
-            try:
-                share_obj = apiutils.find_resource(
-                    share_client.shares, share
-                )
-                share_client.shares.unmanage(share_obj)
-
-                if parsed_args.wait:
-                    # 'wait_for_delete' checks that the resource is no longer
-                    # retrievable with the given 'res_id' so we can use it
-                    # to check that the share has been abandoned
-                    if not oscutils.wait_for_delete(
-                            manager=share_client.shares,
-                            res_id=share_obj.id):
-                        result += 1
+        def _abandon_share(share):
+            share_obj = apiutils.find_resource(
+                share_client.shares, share
+            )
+            share_client.shares.unmanage(share_obj)
+            return share_obj
 
-            except Exception as e:
+        result = 0
+        abandoned_shares = []
+        for outcome in bulk.run(_abandon_share, parsed_args.share,
+                                max_workers=parsed_args.concurrency):
+            if outcome.failed:
                 result += 1
                 LOG.error(_("Failed to abandon share with "
                             "name or ID '%(share)s': %(e)s"),
-                          {'share': share, 'e': e})
+                          {'share': outcome.item, 'e': outcome.error})
+            else:
+                abandoned_shares.append(outcome.result)
+
+        if parsed_args.wait:
+            # NOTE: Waiting for the shares to be 'deleted' checks that they
+            # are no longer retrievable, so we can use it to check that the
+            # shares have been abandoned
+            wait_results = waiter.wait_for_resources(
+                share_client.shares, abandoned_shares,
+                expected_status='deleted')
+            result += len([r for r in wait_results if not r.succeeded])
 
         if result > 0:
             total = len(parsed_args.share)
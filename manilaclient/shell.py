@@ -19,35 +19,117 @@ Command-line interface to the OpenStack Manila API.
 """
 
 import argparse
+import collections
 import glob
+import hashlib
 from importlib import util as importlib_util
 import itertools
+import json
 import logging
 import os
 import pkgutil
+import shlex
 import sys
+import tempfile
+import time
 
 from oslo_utils import encodeutils
 import six
 
 from manilaclient import api_versions
 from manilaclient import client
+from manilaclient.common import bulk
 from manilaclient.common import cliutils
+from manilaclient.common import completion_cache
 from manilaclient.common import constants
 from manilaclient import exceptions as exc
 import manilaclient.extension
-from manilaclient.v2 import shell as shell_v2
 
 DEFAULT_OS_SHARE_API_VERSION = api_versions.MAX_VERSION
 DEFAULT_MANILA_ENDPOINT_TYPE = 'publicURL'
 DEFAULT_MAJOR_OS_SHARE_API_VERSION = "2"
 V1_MAJOR_VERSION = '1'
 V2_MAJOR_VERSION = '2'
+VERSION_CACHE_FILE = 'api-versions-cache.json'
 
 
 logger = logging.getLogger(__name__)
 
 
+def _get_version_cache_path():
+    base_dir = cliutils.env('manilaclient_UUID_CACHE_DIR',
+                            'MANILACLIENT_UUID_CACHE_DIR',
+                            default="~/.manilaclient")
+    return os.path.expanduser(os.path.join(base_dir, VERSION_CACHE_FILE))
+
+
+def _read_version_cache():
+    try:
+        with open(_get_version_cache_path()) as cache_file:
+            cache = json.load(cache_file)
+    except (IOError, OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _load_server_version_range(cache_key):
+    """Returns the server version range cached on disk and its endpoint.
+
+    :returns: a ((min version, max version), endpoint URL) tuple, or None.
+    """
+    entry = _read_version_cache().get(cache_key)
+    try:
+        if entry['expires_at'] < time.time():
+            return None
+        return ((api_versions.APIVersion(entry['min_version']),
+                 api_versions.APIVersion(entry['max_version'])),
+                entry.get('endpoint'))
+    except (KeyError, TypeError, AttributeError, exc.UnsupportedVersion):
+        return None
+
+
+def _get_endpoint(cs):
+    """Returns the URL of the endpoint a client sends its requests to."""
+    endpoint = getattr(getattr(cs, 'client', None), 'endpoint_url', None)
+    return endpoint if isinstance(endpoint, six.string_types) else None
+
+
+def _save_server_version_range(cache_key, server_version_range, ttl,
+                               endpoint=None):
+    """Stores the server version range on disk for ``ttl`` seconds.
+
+    :param endpoint: URL of the endpoint the range was discovered from.
+    """
+    now = time.time()
+    cache = dict((key, entry) for key, entry in _read_version_cache().items()
+                 if isinstance(entry, dict) and
+                 entry.get('expires_at', 0) >= now)
+    cache[cache_key] = {
+        'min_version': (None if server_version_range[0].is_null()
+                        else server_version_range[0].get_string()),
+        'max_version': (None if server_version_range[1].is_null()
+                        else server_version_range[1].get_string()),
+        'endpoint': endpoint,
+        'expires_at': now + ttl,
+    }
+
+    path = _get_version_cache_path()
+    directory = os.path.dirname(path)
+    try:
+        if not os.path.isdir(directory):
+            os.makedirs(directory, 0o755)
+        # NOTE: The cache is replaced atomically, so that concurrent
+        # invocations never read a partially written file.
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.versions-')
+        with os.fdopen(fd, 'w') as cache_file:
+            json.dump(cache, cache_file)
+        os.replace(tmp_path, path)
+    except (IOError, OSError):
+        # NOTE: The cache is an optimization only, don't fail if it cannot
+        # be written.
+        logger.debug("Unable to write the API version cache to %s.", path)
+
+
 class AllowOnlyOneAliasAtATimeAction(argparse.Action):
     """Allows only one alias of argument to be used at a time."""
 
@@ -55,8 +137,11 @@ class AllowOnlyOneAliasAtATimeAction(argparse.Action):
         # NOTE(vponomaryov): this method is redefinition of
         # argparse.Action.__call__ interface
 
-        if not hasattr(self, 'calls'):
+        # NOTE: Parsers are reused to parse the commands of a batch, aliases
+        # are only checked against the ones of the same command line.
+        if getattr(self, 'namespace', None) is not namespace:
             self.calls = {}
+            self.namespace = namespace
 
         if self.dest not in self.calls:
             self.calls[self.dest] = set()
@@ -83,8 +168,10 @@ class ManilaClientArgumentParser(argparse.ArgumentParser):
         """error(message: string)
 
         Prints a usage message incorporating the message to stderr and
-        exits.
+        exits, or raises ArgumentError if ``exit_on_error`` is False.
         """
+        if not getattr(self, 'exit_on_error', True):
+            raise argparse.ArgumentError(None, message)
         self.print_usage(sys.stderr)
         # FIXME(lzyeval): if changes occur in argparse.ArgParser._check_value
         choose_from = ' (choose from'
@@ -340,6 +427,43 @@ class OpenStackManilaShell(object):
                             default=0,
                             help='Number of retries.')
 
+        parser.add_argument('--format',
+                            metavar='<format>',
+                            dest='output_format',
+                            choices=cliutils.OUTPUT_FORMATS,
+                            default=cliutils.env(
+                                'MANILACLIENT_OUTPUT_FORMAT',
+                                default='table'),
+                            help='Output format of the list and show '
+                                 'commands, one of %s. Rows are printed as '
+                                 'they are received with the formats other '
+                                 'than table. Defaults to '
+                                 'env[MANILACLIENT_OUTPUT_FORMAT] or table.'
+                                 % ', '.join(cliutils.OUTPUT_FORMATS))
+
+        parser.add_argument('--bulk-concurrency',
+                            metavar='<bulk-concurrency>',
+                            type=int,
+                            default=cliutils.env(
+                                'MANILACLIENT_BULK_CONCURRENCY',
+                                default=bulk.DEFAULT_MAX_WORKERS),
+                            help='Maximum number of concurrent API calls '
+                                 'made by commands acting on multiple '
+                                 'resources. Defaults to '
+                                 'env[MANILACLIENT_BULK_CONCURRENCY] or %d.'
+                                 % bulk.DEFAULT_MAX_WORKERS)
+
+        parser.add_argument('--version-cache-ttl',
+                            metavar='<seconds>',
+                            type=int,
+                            default=cliutils.env(
+                                'MANILACLIENT_VERSION_CACHE_TTL', default=0),
+                            help='Number of seconds the API version range '
+                                 'discovered from the server is cached on '
+                                 'disk and reused by later invocations, 0 '
+                                 'disables the cache. Defaults to '
+                                 'env[MANILACLIENT_VERSION_CACHE_TTL] or 0.')
+
         parser.add_argument('--os-cert',
                             metavar='<certificate>',
                             default=cliutils.env('OS_CERT'),
@@ -352,12 +476,22 @@ class OpenStackManilaShell(object):
 
         return parser
 
-    def get_subcommand_parser(self, version):
+    def get_subcommand_parser(self, version, commands=None):
+        """Build the parser of the manila commands.
+
+        :param version: major API version string.
+        :param commands: names of the subcommands to build a parser for, all
+            of them are built if it is None or if any of the names is not a
+            known subcommand, so argparse can list the valid ones.
+        """
         parser = self.get_base_parser()
 
         self.subcommands = {}
         subparsers = parser.add_subparsers(metavar='<subcommand>')
 
+        # NOTE: The commands module is big, only import it when the parser
+        # is built.
+        from manilaclient.v2 import shell as shell_v2
         try:
             actions_module = {
                 V2_MAJOR_VERSION: shell_v2,
@@ -365,11 +499,21 @@ class OpenStackManilaShell(object):
         except KeyError:
             actions_module = shell_v2
 
-        self._find_actions(subparsers, actions_module)
-        self._find_actions(subparsers, self)
+        modules = [actions_module, self]
+        modules.extend(extension.module for extension in self.extensions)
 
-        for extension in self.extensions:
-            self._find_actions(subparsers, extension.module)
+        actions = [self._get_actions(module) for module in modules]
+        if commands is not None:
+            known_commands = set(itertools.chain(*actions))
+            known_commands.add('bash_completion')
+            if not set(commands).issubset(known_commands):
+                commands = None
+
+        for module, module_actions in zip(modules, actions):
+            # NOTE: The commands of the shell itself print nothing that
+            # depends on the output format.
+            self._find_actions(subparsers, module_actions, commands,
+                               format_option=module is not self)
 
         self._add_bash_completion_subparser(subparsers)
 
@@ -428,11 +572,31 @@ class OpenStackManilaShell(object):
         self.subcommands['bash_completion'] = subparser
         subparser.set_defaults(func=self.do_bash_completion)
 
-    def _find_actions(self, subparsers, actions_module):
+    def _get_actions(self, actions_module):
+        """Returns a dict mapping the command names to their callbacks."""
+        actions = collections.OrderedDict()
         for attr in (a for a in dir(actions_module) if a.startswith('do_')):
             # I prefer to be hypen-separated instead of underscores.
             command = attr[3:].replace('_', '-')
-            callback = getattr(actions_module, attr)
+            actions[command] = getattr(actions_module, attr)
+        return actions
+
+    def _find_actions(self, subparsers, actions, commands=None,
+                      format_option=False):
+        """Add subparsers for the commands in ``actions``.
+
+        :param actions: module with ``do_*`` functions or a dict returned by
+            :meth:`_get_actions`.
+        :param commands: names of the commands to add, all of them if None.
+        :param format_option: whether the commands accept ``--format``, it
+            overrides the global option of the same name.
+        """
+        if not isinstance(actions, dict):
+            actions = self._get_actions(actions)
+
+        for command, callback in actions.items():
+            if commands is not None and command not in commands:
+                continue
             desc = callback.__doc__ or ''
             help = desc.strip()
             arguments = getattr(callback, 'arguments', [])
@@ -451,6 +615,16 @@ class OpenStackManilaShell(object):
             self.subcommands[command] = subparser
             for (args, kwargs) in arguments:
                 subparser.add_argument(*args, **kwargs)
+            if format_option:
+                subparser.add_argument(
+                    '--format',
+                    metavar='<format>',
+                    dest='output_format',
+                    choices=cliutils.OUTPUT_FORMATS,
+                    default=argparse.SUPPRESS,
+                    help='Output format, one of %s. Defaults to the global '
+                         '--format option.'
+                         % ', '.join(cliutils.OUTPUT_FORMATS))
             subparser.set_defaults(func=callback)
 
     def setup_debugging(self, debug):
@@ -463,16 +637,35 @@ class OpenStackManilaShell(object):
                           ).setLevel(logging.WARNING)
         logging.getLogger('keystoneauth1.session').setLevel(logging.WARNING)
 
+    def _get_invoked_commands(self, options, args):
+        """Returns the subcommands needed to run a command line.
+
+        :param options: global options parsed by the base parser.
+        :param args: arguments left over by the base parser.
+        :returns: list of subcommand names, or None if all of them are
+            needed, e.g. to print the list of commands.
+        """
+        if options.help or not args or args[0].startswith('-'):
+            return None
+        if args[0] == 'help':
+            if len(args) < 2 or args[1].startswith('-'):
+                return None
+            return args[:2]
+        if args[0] in ('bash-completion', 'bash_completion', 'batch'):
+            return None
+        return args[:1]
+
     def _build_subcommands_and_extensions(self,
                                           os_api_version,
                                           argv,
-                                          options):
+                                          options,
+                                          commands=None):
 
         self.extensions = self._discover_extensions(os_api_version)
         self._run_extension_hooks('__pre_parse_args__')
 
         self.parser = self.get_subcommand_parser(
-            os_api_version.get_major_version())
+            os_api_version.get_major_version(), commands=commands)
 
         if argv and len(argv) > 1 and '--help' in argv:
             argv = [x for x in argv if x != '--help']
@@ -497,10 +690,13 @@ class OpenStackManilaShell(object):
 
         os_api_version = self._validate_input_api_version(options)
 
-        # build available subcommands based on version
+        # build available subcommands based on version, only the parsers of
+        # the invoked ones are built.
+        commands = self._get_invoked_commands(options, args)
         args = self._build_subcommands_and_extensions(os_api_version,
                                                       argv,
-                                                      options)
+                                                      options,
+                                                      commands)
         if not args:
             return 0
 
@@ -511,6 +707,9 @@ class OpenStackManilaShell(object):
         elif args.func == self.do_bash_completion:
             self.do_bash_completion(args)
             return 0
+        elif args.func == self.do_batch:
+            # NOTE: Fail before authenticating if the file can't be read.
+            batch_file = self._open_batch_file(args.file)
 
         if not options.os_share_api_version:
             api_version = api_versions.get_api_version(
@@ -551,6 +750,7 @@ class OpenStackManilaShell(object):
             cert=args.os_cert,
             input_auth_token=args.os_token,
             service_catalog_url=args.bypass_url,
+            completion_cache=completion_cache.get_default_cache(),
         )
 
         # Handle deprecated parameters
@@ -563,19 +763,62 @@ class OpenStackManilaShell(object):
             args.os_token, args.bypass_url,
             client_args['auth_url'])
 
-        # This client is needed to discover the server api version.
-        temp_client = client.Client(manilaclient.API_MAX_VERSION,
-                                    **client_args)
-
-        self.cs, discovered_version = self._discover_client(temp_client,
-                                                            os_api_version,
-                                                            os_endpoint_type,
-                                                            os_service_type,
-                                                            client_args)
-
-        args = self._build_subcommands_and_extensions(discovered_version,
-                                                      argv,
-                                                      options)
+        version_cache_key = None
+        cached_version_range = None
+        if (options.version_cache_ttl > 0 and
+                os_api_version != manilaclient.API_DEPRECATED_VERSION):
+            version_cache_key = self._get_version_cache_key(client_args)
+            cached_version_range = _load_server_version_range(
+                version_cache_key)
+
+        temp_client = None
+        if cached_version_range is not None:
+            # NOTE: The server version range is known already, so there is no
+            # need for a client to discover it.
+            server_version_range, endpoint = cached_version_range
+            discovered_version = api_versions.discover_version(
+                None, os_api_version,
+                server_version_range=server_version_range)
+            self.cs, discovered_version = self._get_versioned_client(
+                None, discovered_version, os_endpoint_type, os_service_type,
+                client_args)
+            if endpoint and endpoint != _get_endpoint(self.cs):
+                # NOTE: The range was discovered from another endpoint,
+                # e.g. the service catalog changed, discover it again.
+                temp_client = self.cs
+
+        if cached_version_range is None or temp_client is not None:
+            # This client is needed to discover the server api version.
+            if temp_client is None:
+                temp_client = client.Client(manilaclient.API_MAX_VERSION,
+                                            **client_args)
+
+            self.cs, discovered_version = self._discover_client(
+                temp_client,
+                os_api_version,
+                os_endpoint_type,
+                os_service_type,
+                client_args)
+
+            if version_cache_key:
+                _save_server_version_range(
+                    version_cache_key,
+                    api_versions.get_server_version_range(temp_client),
+                    options.version_cache_ttl, _get_endpoint(temp_client))
+
+        # NOTE: Commands and extensions only depend on the major version,
+        # there is no need to build them again if it did not change.
+        if (discovered_version.get_major_version() !=
+                os_api_version.get_major_version()):
+            args = self._build_subcommands_and_extensions(discovered_version,
+                                                          argv,
+                                                          options,
+                                                          commands)
+
+        if args.func == self.do_batch:
+            with batch_file:
+                return self._run_batch(batch_file, args.stop_on_error,
+                                       options)
 
         args.func(self.cs, args)
 
@@ -595,13 +838,26 @@ class OpenStackManilaShell(object):
                 os_api_version
             )
 
+        return self._get_versioned_client(current_client,
+                                          discovered_version,
+                                          os_endpoint_type,
+                                          os_service_type,
+                                          client_args)
+
+    def _get_versioned_client(self,
+                              current_client,
+                              discovered_version,
+                              os_endpoint_type,
+                              os_service_type,
+                              client_args):
         if not os_endpoint_type:
             os_endpoint_type = DEFAULT_MANILA_ENDPOINT_TYPE
 
         if not os_service_type:
             os_service_type = self._discover_service_type(discovered_version)
 
-        if (discovered_version != manilaclient.API_MAX_VERSION or
+        if (current_client is None or
+                discovered_version != manilaclient.API_MAX_VERSION or
                 os_service_type != constants.V1_SERVICE_TYPE or
                 os_endpoint_type != DEFAULT_MANILA_ENDPOINT_TYPE):
             client_args['version'] = discovered_version
@@ -613,6 +869,19 @@ class OpenStackManilaShell(object):
         else:
             return current_client, discovered_version
 
+    def _get_version_cache_key(self, client_args):
+        """Identifies the endpoint a client would be built for.
+
+        The endpoint itself is only known once the client is authenticated,
+        it is stored with the cached versions and compared then.
+        """
+        key = "|".join(six.text_type(client_args.get(arg) or '') for arg in (
+            'auth_url', 'service_catalog_url', 'region_name', 'service_type',
+            'service_name', 'endpoint_type', 'project_name', 'tenant_id',
+            'project_domain_id', 'project_domain_name', 'username',
+            'user_id', 'user_domain_id', 'user_domain_name'))
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
     def _discover_service_type(self, discovered_version):
         major_version = discovered_version.get_major_version()
         service_type = constants.SERVICE_TYPES[major_version]
@@ -680,6 +949,117 @@ class OpenStackManilaShell(object):
         commands.remove('bash_completion')
         print(' '.join(commands | options))
 
+    @cliutils.arg(
+        'file',
+        metavar='<file>',
+        nargs='?',
+        default='-',
+        help='File with one subcommand and its arguments per line, e.g. '
+             '"show <share>", read from stdin if omitted or "-". Empty '
+             'lines and the text after a "#" are ignored.')
+    @cliutils.arg(
+        '--stop-on-error',
+        '--stop_on_error',
+        action='store_true',
+        default=False,
+        help='Stop at the first failed subcommand, instead of reporting its '
+             'error and running the next ones.')
+    def do_batch(self, args):
+        """Run the subcommands of a file with a single client.
+
+        Authentication, API version discovery and the parsing of the
+        options of this invocation are done once, and HTTP connections are
+        reused by all the subcommands.
+        """
+        # NOTE: Batches are run by main(), once the client is created.
+
+    def _open_batch_file(self, path):
+        if path == '-':
+            return open(sys.stdin.fileno(), closefd=False)
+        try:
+            return open(path)
+        except (IOError, OSError) as e:
+            raise exc.CommandError("Unable to read batch file %s: %s" %
+                                   (path, e))
+
+    def _run_batch(self, lines, stop_on_error=False, options=None):
+        """Run the subcommands of a batch with the client of the shell.
+
+        Failures are reported on stderr with their line number.
+
+        :param options: global options of the batch command, shared by all
+            the subcommands.
+        :returns: 0 if all subcommands succeeded.
+        :raises CommandError: when any of them failed.
+        """
+        options = options or argparse.Namespace()
+        failed = total = 0
+        for line_number, line in enumerate(lines, 1):
+            try:
+                argv = shlex.split(line, comments=True)
+                if not argv:
+                    continue
+                total += 1
+                self._run_batch_command(argv, options)
+            except KeyboardInterrupt:
+                raise
+            except Exception as e:
+                print("ERROR (line %d): %s" % (
+                    line_number, six.text_type(e)), file=sys.stderr)
+                failed += 1
+                if stop_on_error:
+                    break
+
+        if failed:
+            raise exc.CommandError("%d of %d batch commands failed." %
+                                   (failed, total))
+        return 0
+
+    def _run_batch_command(self, argv, options):
+        if argv[0] == 'batch':
+            raise exc.CommandError("Batches can't be nested.")
+        subparser = self.subcommands.get(argv[0])
+        if subparser is None and not argv[0].startswith('-'):
+            raise exc.CommandError("'%s' is not a valid subcommand" %
+                                   argv[0])
+
+        # NOTE: Only the options of the subcommand are parsed, the global
+        # ones apply to the whole batch.
+        global_options = self.parser._optionals._option_string_actions
+        command_options = (subparser._optionals._option_string_actions
+                           if subparser else {})
+        for arg in argv:
+            option = arg.split('=', 1)[0]
+            if option in global_options and option not in command_options:
+                raise exc.CommandError(
+                    "Global option %s is not allowed in a batch, pass it to "
+                    "the batch command." % option)
+        if subparser is None:
+            raise exc.CommandError("'%s' is not a valid subcommand" %
+                                   argv[0])
+
+        if '--help' in argv:
+            subparser.print_help()
+            return
+
+        subparser.exit_on_error = False
+        try:
+            args = subparser.parse_args(argv[1:])
+        except argparse.ArgumentError as e:
+            raise exc.CommandError(six.text_type(e))
+        finally:
+            subparser.exit_on_error = True
+        for dest, value in vars(options).items():
+            if not hasattr(args, dest):
+                setattr(args, dest, value)
+        self._run_extension_hooks('__post_parse_args__', args)
+        if args.func == self.do_help:
+            self.do_help(args)
+        elif args.func == self.do_bash_completion:
+            self.do_bash_completion(args)
+        else:
+            args.func(self.cs, args)
+
     @cliutils.arg('command', metavar='<subcommand>', nargs='?',
                   help='Display help for <subcommand>')
     def do_help(self, args):
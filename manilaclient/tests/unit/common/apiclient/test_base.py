@@ -0,0 +1,156 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import copy
+from unittest import mock
+
+from manilaclient.common.apiclient import base
+from manilaclient.tests.unit import utils
+
+
+class FakeResource(base.Resource):
+    HUMAN_ID = True
+
+    def describe(self):
+        return "%s (%s)" % (self.name, self.size)
+
+
+class FakeReprResource(base.Resource):
+
+    def __repr__(self):
+        return "<FakeReprResource: %s>" % self.id
+
+
+class BatchLoaderTest(utils.TestCase):
+
+    def setUp(self):
+        super(BatchLoaderTest, self).setUp()
+        base.reset_lazy_load_counts()
+        self.addCleanup(base.reset_lazy_load_counts)
+        self.manager = mock.Mock()
+        self.load_func = mock.Mock(return_value=[
+            FakeResource(None, {'id': '1', 'name': 'one', 'size': 1}),
+            FakeResource(None, {'id': '2', 'name': 'two', 'size': 2}),
+        ])
+        self.loader = base.BatchLoader(self.load_func)
+        self.resources = []
+        for resource_id in ('1', '2', '3'):
+            resource = FakeResource(self.manager, {'id': resource_id})
+            self.loader.add(resource)
+            self.resources.append(resource)
+
+    def test_load_group_once(self):
+        self.assertEqual(2, self.resources[1].size)
+        self.assertEqual(1, self.resources[0].size)
+
+        self.load_func.assert_called_once_with()
+        self.assertFalse(self.manager.get.called)
+        self.assertTrue(all(r.is_loaded() for r in self.resources))
+        self.assertEqual({'FakeResource': 1}, base.get_lazy_load_counts())
+        self.manager.run_hooks.assert_called_once_with(
+            'lazy_load', self.resources[0], 3)
+
+    def test_load_missing_resource(self):
+        self.assertRaises(AttributeError, getattr, self.resources[2], 'size')
+
+        self.load_func.assert_called_once_with()
+        self.assertFalse(self.manager.get.called)
+
+    def test_load_with_count(self):
+        self.load_func.return_value = (self.load_func.return_value, 2)
+
+        self.assertEqual('one', self.resources[0].name)
+
+    def test_lazy_load_without_loader(self):
+        self.manager.get.return_value = FakeResource(
+            None, {'id': '4', 'size': 4})
+        resource = FakeResource(self.manager, {'id': '4'})
+
+        self.assertEqual(4, resource.size)
+
+        self.manager.get.assert_called_once_with('4')
+        self.assertEqual({'FakeResource': 1}, base.get_lazy_load_counts())
+        self.manager.run_hooks.assert_called_once_with(
+            'lazy_load', resource, 1)
+
+    @mock.patch.object(base.LOG, 'warning')
+    def test_warning_threshold(self, mock_warning):
+        for i in range(base.LAZY_LOAD_WARNING_THRESHOLD + 1):
+            base.record_lazy_load(self.resources[0], 1)
+
+        self.assertEqual(1, mock_warning.call_count)
+        self.assertEqual(
+            {'FakeResource': base.LAZY_LOAD_WARNING_THRESHOLD + 1},
+            base.get_lazy_load_counts())
+
+
+class CompactResourceTest(utils.TestCase):
+
+    def setUp(self):
+        super(CompactResourceTest, self).setUp()
+        self.compact_class = base.get_compact_class(FakeResource)
+        self.info = {'id': 'fake_id', 'name': 'Fake Name', 'size': 1}
+        self.resource = self.compact_class('fake_manager', self.info)
+
+    def test_get_compact_class(self):
+        self.assertIs(self.compact_class,
+                      base.get_compact_class(FakeResource))
+        self.assertTrue(issubclass(self.compact_class, FakeResource))
+
+    def test_attributes_not_copied(self):
+        # NOTE: The instance __dict__ inherited from Resource stays empty.
+        self.assertEqual({}, vars(self.resource))
+
+    def test_attributes(self):
+        self.assertEqual('fake_id', self.resource.id)
+        self.assertEqual('Fake Name', self.resource.name)
+        self.assertEqual('fake_manager', self.resource.manager)
+        self.assertEqual('Fake Name (1)', self.resource.describe())
+        self.assertEqual('fake-name', self.resource.human_id)
+        self.assertTrue(self.resource.is_loaded())
+        self.assertRaises(AttributeError, getattr, self.resource, 'missing')
+
+    def test_info_is_stored_once(self):
+        self.assertIs(self.info, self.resource._info)
+        self.assertEqual({}, getattr(self.resource, '__dict__', {}))
+
+    def test_read_only(self):
+        self.assertRaises(AttributeError, setattr, self.resource, 'name', 'x')
+        self.assertEqual('Fake Name', self.resource.name)
+
+    def test_to_dict(self):
+        result = self.resource.to_dict()
+
+        self.assertEqual(self.info, result)
+        self.assertIsNot(self.info, result)
+
+    def test_eq(self):
+        regular = FakeResource(None, dict(self.info))
+
+        self.assertEqual(regular, self.resource)
+        self.assertEqual(self.resource, regular)
+        self.assertNotEqual(self.resource,
+                            base.Resource(None, dict(self.info)))
+
+    def test_copy(self):
+        result = copy.deepcopy(self.resource)
+
+        self.assertIsInstance(result, self.compact_class)
+        self.assertEqual(self.info, result._info)
+
+    def test_repr(self):
+        self.assertEqual(
+            "<FakeResource id=fake_id, name=Fake Name, size=1>",
+            repr(self.resource))
+        self.assertEqual(
+            "<FakeReprResource: fake_id>",
+            repr(base.get_compact_class(FakeReprResource)(None, self.info)))
@@ -0,0 +1,130 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from unittest import mock
+
+from manilaclient.common.apiclient import base as common_base
+from manilaclient.common.apiclient import exceptions
+from manilaclient.common.apiclient import utils
+from manilaclient.tests.unit import utils as test_utils
+
+FAKE_UUID = 'e05ebd1d-6a3e-4d8f-a1a5-0bb2ed6b03a8'
+
+
+class FakeResource(common_base.Resource):
+    pass
+
+
+class FindResourceTest(test_utils.TestCase):
+
+    def setUp(self):
+        super(FindResourceTest, self).setUp()
+        self.addCleanup(utils.clear_name_cache)
+        self.manager = mock.Mock(
+            spec=['get', 'list', 'find', 'resource_class'])
+        self.manager.resource_class = FakeResource
+        self.manager.get.side_effect = exceptions.NotFound(404)
+
+    def _resource(self, id, name):
+        return FakeResource(self.manager, {'id': id, 'name': name})
+
+    def test_find_by_uuid(self):
+        resource = self._resource(FAKE_UUID, 'foo')
+        self.manager.get.side_effect = None
+        self.manager.get.return_value = resource
+
+        self.assertIs(resource, utils.find_resource(self.manager, FAKE_UUID))
+
+        self.manager.get.assert_called_once_with(FAKE_UUID)
+        self.assertFalse(self.manager.list.called)
+        self.assertFalse(self.manager.find.called)
+
+    def test_find_by_name(self):
+        resource = self._resource(FAKE_UUID, 'foo')
+        self.manager.list.return_value = [
+            self._resource('other', 'foobar'), resource]
+
+        self.assertIs(resource, utils.find_resource(self.manager, 'foo'))
+
+        self.manager.list.assert_called_once_with(
+            search_opts={'all_tenants': 1, 'name': 'foo'})
+        self.assertFalse(self.manager.get.called)
+        self.assertFalse(self.manager.find.called)
+
+    def test_find_by_name_cached(self):
+        resource = self._resource(FAKE_UUID, 'foo')
+        self.manager.list.return_value = [resource]
+        utils.find_resource(self.manager, 'foo')
+        self.manager.get.side_effect = None
+        self.manager.get.return_value = resource
+
+        self.assertIs(resource, utils.find_resource(self.manager, 'foo'))
+
+        self.manager.list.assert_called_once_with(
+            search_opts={'all_tenants': 1, 'name': 'foo'})
+        self.manager.get.assert_called_once_with(FAKE_UUID)
+
+    def test_find_by_name_cache_expired(self):
+        self.mock_object(utils, 'NAME_CACHE_TTL', -1)
+        self.manager.list.return_value = [self._resource(FAKE_UUID, 'foo')]
+
+        utils.find_resource(self.manager, 'foo')
+        utils.find_resource(self.manager, 'foo')
+
+        self.assertEqual(2, self.manager.list.call_count)
+        self.assertFalse(self.manager.get.called)
+
+    def test_find_by_name_cached_resource_gone(self):
+        self.manager.list.side_effect = [
+            [self._resource(FAKE_UUID, 'foo')], []]
+        utils.find_resource(self.manager, 'foo')
+
+        self.assertRaises(exceptions.CommandError,
+                          utils.find_resource, self.manager, 'foo')
+
+        self.manager.get.assert_called_once_with(FAKE_UUID)
+        self.assertEqual(2, self.manager.list.call_count)
+
+    def test_find_by_name_filter_rejected(self):
+        resource = self._resource(FAKE_UUID, 'foo')
+        self.manager.list.side_effect = [
+            exceptions.BadRequest(400), [resource]]
+
+        self.assertIs(resource, utils.find_resource(self.manager, 'foo'))
+
+        self.manager.list.assert_has_calls([
+            mock.call(search_opts={'all_tenants': 1, 'name': 'foo'}),
+            mock.call(search_opts={'all_tenants': 1}),
+        ])
+
+    def test_find_by_name_not_found(self):
+        self.manager.list.return_value = [self._resource('other', 'bar')]
+
+        self.assertRaises(exceptions.CommandError,
+                          utils.find_resource, self.manager, 'foo')
+
+    def test_find_by_name_no_unique_match(self):
+        self.manager.list.return_value = [
+            self._resource('id1', 'foo'), self._resource('id2', 'foo')]
+
+        self.assertRaises(exceptions.CommandError,
+                          utils.find_resource, self.manager, 'foo')
+
+    def test_find_by_human_id(self):
+        self.mock_object(FakeResource, 'HUMAN_ID', True)
+        resource = self._resource(FAKE_UUID, 'Foo Bar')
+        self.manager.find.return_value = resource
+
+        self.assertIs(resource, utils.find_resource(self.manager, 'foo-bar'))
+
+        self.manager.find.assert_called_once_with(human_id='foo-bar')
+        self.assertFalse(self.manager.list.called)
@@ -0,0 +1,95 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+from unittest import mock
+
+import manilaclient
+from manilaclient.common import async_httpclient
+from manilaclient import exceptions
+from manilaclient.tests.unit import fakes
+from manilaclient.tests.unit import utils
+
+
+class AsyncHTTPClientTest(utils.TestCase):
+
+    def _get_client(self, responses, retries=None):
+        self.session = fakes.FakeAsyncSession(responses)
+        return async_httpclient.AsyncHTTPClient(
+            'http://example.com/v2', 'token', 'fake-agent',
+            manilaclient.API_MAX_VERSION, retries=retries,
+            http_session=self.session)
+
+    def test_get(self):
+        client = self._get_client(
+            [fakes.FakeAsyncResponse(text='{"hi": "there"}')])
+
+        resp, body = asyncio.run(client.get('/hi'))
+
+        self.assertEqual(200, resp.status_code)
+        self.assertEqual({'hi': 'there'}, body)
+        method, url, headers, data = self.session.calls[0]
+        self.assertEqual(('GET', 'http://example.com/v2/hi'), (method, url))
+        self.assertEqual('token', headers['X-Auth-Token'])
+        self.assertEqual(
+            manilaclient.API_MAX_VERSION.get_string(),
+            headers[client.API_VERSION_HEADER])
+        self.assertIsNone(data)
+
+    def test_post(self):
+        client = self._get_client([fakes.FakeAsyncResponse(status=202)])
+
+        resp, body = asyncio.run(client.post('/hi', body={'a': 'b'}))
+
+        self.assertIsNone(body)
+        method, url, headers, data = self.session.calls[0]
+        self.assertEqual('POST', method)
+        self.assertEqual('application/json', headers['Content-Type'])
+        self.assertEqual('{"a": "b"}', data)
+        self.assertNotIn('Content-Type', client.default_headers)
+
+    def test_error_response(self):
+        client = self._get_client([fakes.FakeAsyncResponse(
+            status=404,
+            text='{"itemNotFound": {"message": "Gone"}}')])
+
+        self.assertRaises(
+            exceptions.NotFound, asyncio.run, client.get('/hi'))
+
+    @mock.patch('asyncio.sleep', new_callable=mock.AsyncMock)
+    def test_retries(self, mock_sleep):
+        client = self._get_client(
+            [fakes.FakeAsyncResponse(status=500, text='{}'),
+             fakes.FakeAsyncResponse(text='{"hi": "there"}')],
+            retries=1)
+
+        resp, body = asyncio.run(client.get('/hi'))
+
+        self.assertEqual({'hi': 'there'}, body)
+        self.assertEqual(2, len(self.session.calls))
+        self.assertEqual(1, mock_sleep.call_count)
+        self.assertTrue(0.5 <= mock_sleep.call_args[0][0] <= 1)
+
+    def test_close(self):
+        client = self._get_client([])
+
+        asyncio.run(client.close())
+
+        self.assertTrue(self.session.closed)
+        self.assertIsNone(client.http_session)
+
+    @mock.patch.object(async_httpclient, 'aiohttp', None)
+    def test_aiohttp_missing(self):
+        self.assertRaises(
+            ImportError, async_httpclient.AsyncHTTPClient,
+            'http://example.com/v2', 'token', 'fake-agent',
+            manilaclient.API_MAX_VERSION)
@@ -0,0 +1,120 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import os
+import stat
+from unittest import mock
+
+import fixtures
+from keystoneauth1 import fixture
+from keystoneclient import access
+
+from manilaclient.common import auth_cache
+from manilaclient.tests.unit import utils
+
+VERSIONS = {'v2.0': None, 'v3.0': 'http://keystone/v3'}
+
+
+def _auth_ref(expires=None):
+    token = fixture.V3Token(user_id='fake_user', project_id='fake_project',
+                            expires=expires)
+    token.add_service('sharev2').add_standard_endpoints(
+        public='http://manila/v2', region='RegionOne')
+    return access.AccessInfo.factory(body=dict(token), auth_token='token')
+
+
+class AuthCacheTest(utils.TestCase):
+
+    def setUp(self):
+        super(AuthCacheTest, self).setUp()
+        self.tmp_dir = self.useFixture(fixtures.TempDir()).path
+        self.path = os.path.join(self.tmp_dir, 'cache', 'auth.json')
+
+    def test_discovery(self):
+        cache = auth_cache.AuthCache()
+
+        self.assertIsNone(cache.get_discovery('http://keystone'))
+        cache.set_discovery('http://keystone', VERSIONS)
+
+        self.assertEqual(VERSIONS, cache.get_discovery('http://keystone'))
+
+    @mock.patch.object(auth_cache.time, 'time')
+    def test_discovery_expired(self, mock_time):
+        cache = auth_cache.AuthCache(discovery_ttl=10)
+        mock_time.return_value = 100
+        cache.set_discovery('http://keystone', VERSIONS)
+
+        mock_time.return_value = 111
+
+        self.assertIsNone(cache.get_discovery('http://keystone'))
+
+    def test_auth_ref(self):
+        cache = auth_cache.AuthCache()
+        key = cache.get_token_key(auth_url='http://keystone/v3',
+                                  username='user', password='secret')
+
+        cache.set_auth_ref(key, _auth_ref())
+        auth_ref = cache.get_auth_ref(key, stale_duration=300)
+
+        self.assertEqual('token', auth_ref.auth_token)
+        self.assertEqual('fake_project', auth_ref.project_id)
+        self.assertEqual(
+            ('http://manila/v2', ),
+            auth_ref.service_catalog.get_urls(service_type='sharev2'))
+
+    def test_auth_ref_expires_soon(self):
+        cache = auth_cache.AuthCache()
+        cache.set_auth_ref('key', _auth_ref(expires='2000-01-01T00:00:00Z'))
+
+        self.assertIsNone(cache.get_auth_ref('key', stale_duration=300))
+
+    def test_get_token_key(self):
+        key = auth_cache.AuthCache.get_token_key(
+            auth_url='http://keystone/v3', username='user', password='a')
+
+        self.assertEqual(key, auth_cache.AuthCache.get_token_key(
+            username='user', auth_url='http://keystone/v3', password='b'))
+        self.assertNotEqual(key, auth_cache.AuthCache.get_token_key(
+            auth_url='http://keystone/v3', username='other'))
+
+    def test_persisted(self):
+        cache = auth_cache.AuthCache(path=self.path)
+        cache.set_discovery('http://keystone', VERSIONS)
+        cache.set_auth_ref('key', _auth_ref())
+
+        other_cache = auth_cache.AuthCache(path=self.path)
+
+        self.assertEqual(VERSIONS,
+                         other_cache.get_discovery('http://keystone'))
+        self.assertEqual('token', other_cache.get_auth_ref('key').auth_token)
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(self.path).st_mode))
+        self.assertEqual(
+            0o700, stat.S_IMODE(os.stat(os.path.dirname(self.path)).st_mode))
+
+    def test_persisted_merge(self):
+        cache = auth_cache.AuthCache(path=self.path)
+        other_cache = auth_cache.AuthCache(path=self.path)
+
+        cache.set_discovery('http://keystone', VERSIONS)
+        other_cache.set_discovery('http://other', VERSIONS)
+
+        self.assertIsNotNone(auth_cache.AuthCache(
+            path=self.path).get_discovery('http://keystone'))
+
+    def test_clear(self):
+        cache = auth_cache.AuthCache(path=self.path)
+        cache.set_discovery('http://keystone', VERSIONS)
+
+        cache.clear()
+
+        self.assertIsNone(auth_cache.AuthCache(
+            path=self.path).get_discovery('http://keystone'))
@@ -0,0 +1,80 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+from unittest import mock
+
+import ddt
+
+from manilaclient.common import bulk
+from manilaclient.tests.unit import utils
+
+
+@ddt.ddt
+class BulkRunTest(utils.TestCase):
+
+    @ddt.data(1, 2, 10)
+    def test_run(self, max_workers):
+        error = Exception('fake')
+
+        def func(item):
+            if item == 'bad':
+                raise error
+            return item.upper()
+
+        results = bulk.run(func, ['a', 'bad', 'b', 'c'],
+                           max_workers=max_workers)
+
+        self.assertEqual(['a', 'bad', 'b', 'c'],
+                         [result.item for result in results])
+        self.assertEqual(['A', None, 'B', 'C'],
+                         [result.result for result in results])
+        self.assertEqual([None, error, None, None],
+                         [result.error for result in results])
+        self.assertEqual([False, True, False, False],
+                         [result.failed for result in results])
+
+    def test_run_empty(self):
+        func = mock.Mock()
+
+        self.assertEqual([], bulk.run(func, []))
+        self.assertFalse(func.called)
+
+    def test_run_serially(self):
+        threads = set()
+
+        def func(item):
+            threads.add(threading.current_thread())
+
+        bulk.run(func, range(5), max_workers=1)
+
+        self.assertEqual({threading.current_thread()}, threads)
+
+    def test_run_concurrency_cap(self):
+        lock = threading.Lock()
+        state = {'running': 0, 'max_running': 0}
+        barrier = threading.Barrier(3)
+
+        def func(item):
+            with lock:
+                state['running'] += 1
+                state['max_running'] = max(state['max_running'],
+                                           state['running'])
+            if item < 3:
+                barrier.wait(timeout=10)
+            with lock:
+                state['running'] -= 1
+
+        results = bulk.run(func, range(9), max_workers=3)
+
+        self.assertFalse(any(result.failed for result in results))
+        self.assertEqual(3, state['max_running'])
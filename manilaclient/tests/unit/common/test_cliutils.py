@@ -0,0 +1,108 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import collections
+import json
+
+import ddt
+import fixtures
+from six import moves
+
+from manilaclient.common import cliutils
+from manilaclient.tests.unit import utils
+
+
+class _Share(object):
+
+    def __init__(self, id, name, size, metadata=None):
+        self.id = id
+        self.name = name
+        self.size = size
+        self.metadata = metadata
+
+
+@ddt.ddt
+class OutputFormatTest(utils.TestCase):
+
+    def setUp(self):
+        super(OutputFormatTest, self).setUp()
+        self.stdout = self.useFixture(
+            fixtures.MonkeyPatch('sys.stdout', moves.StringIO())).new_value
+
+    def _print_list(self, output_format, shares):
+        cliutils.print_list(shares, ['ID', 'Name', 'Size', 'Metadata'],
+                            output_format=output_format)
+        return self.stdout.getvalue()
+
+    def _get_shares(self):
+        # NOTE: Rows are read from a generator, in its order.
+        yield _Share('s2', 'b', 2)
+        yield _Share('s1', 'a, "quoted"', 1, metadata={'k': 'v'})
+
+    def test_print_list_invalid_format(self):
+        self.assertRaises(ValueError, cliutils.print_list, [], ['ID'],
+                          output_format='yaml')
+        self.assertRaises(ValueError, cliutils.print_dict, {},
+                          output_format='yaml')
+
+    def test_print_list_json(self):
+        output = self._print_list('json', self._get_shares())
+
+        self.assertEqual(
+            [{'ID': 's2', 'Name': 'b', 'Size': 2, 'Metadata': None},
+             {'ID': 's1', 'Name': 'a, "quoted"', 'Size': 1,
+              'Metadata': {'k': 'v'}}],
+            json.loads(output))
+
+    def test_print_list_json_empty(self):
+        self.assertEqual([], json.loads(self._print_list('json', [])))
+
+    def test_print_list_jsonl(self):
+        output = self._print_list('jsonl', self._get_shares())
+
+        self.assertEqual(
+            [{'ID': 's2', 'Name': 'b', 'Size': 2, 'Metadata': None},
+             {'ID': 's1', 'Name': 'a, "quoted"', 'Size': 1,
+              'Metadata': {'k': 'v'}}],
+            [json.loads(line) for line in output.splitlines()])
+
+    def test_print_list_csv(self):
+        output = self._print_list('csv', self._get_shares())
+
+        self.assertEqual(
+            'ID,Name,Size,Metadata\n'
+            's2,b,2,\n'
+            's1,"a, ""quoted""",1,"{""k"": ""v""}"\n',
+            output)
+
+    def test_print_list_value(self):
+        output = self._print_list('value', self._get_shares())
+
+        self.assertEqual('s2 b 2 \ns1 a, "quoted" 1 {"k": "v"}\n', output)
+
+    def test_print_list_table_sorted(self):
+        output = self._print_list('table', self._get_shares())
+
+        self.assertLess(output.index('s1'), output.index('s2'))
+
+    @ddt.data(
+        ('json', '{\n    "id": "s1",\n    "size": 1\n}\n'),
+        ('jsonl', '{"id": "s1", "size": 1}\n'),
+        ('csv', 'Property,Value\nid,s1\nsize,1\n'),
+        ('value', 'id s1\nsize 1\n'),
+    )
+    @ddt.unpack
+    def test_print_dict(self, output_format, expected):
+        cliutils.print_dict(collections.OrderedDict(
+            [('id', 's1'), ('size', 1)]), output_format=output_format)
+
+        self.assertEqual(expected, self.stdout.getvalue())
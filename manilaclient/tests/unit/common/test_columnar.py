@@ -0,0 +1,91 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import sys
+from unittest import mock
+
+import ddt
+
+from manilaclient.common import columnar
+from manilaclient.tests.unit import utils
+
+ROWS = [
+    {'id': 's1', 'size': 1, 'capabilities': {'qos': True}},
+    {'id': 's2', 'status': 'error'},
+    {'id': 's3', 'size': 3, 'capabilities': {'qos': False, 'dedupe': True}},
+]
+
+
+@ddt.ddt
+class TableTest(utils.TestCase):
+
+    @ddt.data(list, iter)
+    def test_from_rows(self, rows_type):
+        table = columnar.Table.from_rows(rows_type(ROWS))
+
+        self.assertEqual(['id', 'size', 'capabilities', 'status'],
+                         list(table))
+        self.assertEqual(['s1', 's2', 's3'], table['id'])
+        self.assertEqual([1, None, 3], table['size'])
+        self.assertEqual([None, 'error', None], table['status'])
+        self.assertEqual(3, table.num_rows)
+
+    @ddt.data(list, iter)
+    def test_from_rows_flatten(self, rows_type):
+        table = columnar.Table.from_rows(
+            rows_type(ROWS), flatten=('capabilities', ))
+
+        self.assertEqual(['id', 'size', 'capabilities.qos', 'status',
+                          'capabilities.dedupe'], list(table))
+        self.assertEqual([True, None, False], table['capabilities.qos'])
+        self.assertEqual([None, None, True], table['capabilities.dedupe'])
+
+    @ddt.data(list, iter)
+    def test_from_rows_empty(self, rows_type):
+        table = columnar.Table.from_rows(rows_type([]))
+
+        self.assertEqual({}, table)
+        self.assertEqual(0, table.num_rows)
+
+    def test_rows(self):
+        rows = [{'id': 's1', 'size': 1}, {'id': 's2', 'size': None}]
+
+        self.assertEqual(rows,
+                         list(columnar.Table.from_rows(rows).rows()))
+
+    def test_to_numpy(self):
+        fake_numpy = mock.Mock()
+        table = columnar.Table.from_rows(ROWS)
+
+        with mock.patch.dict(sys.modules, {'numpy': fake_numpy}):
+            arrays = table.to_numpy()
+
+        self.assertEqual(list(table), list(arrays))
+        fake_numpy.asarray.assert_has_calls(
+            [mock.call(column) for column in table.values()])
+
+    def test_to_arrow(self):
+        fake_pyarrow = mock.Mock()
+        table = columnar.Table.from_rows(ROWS)
+
+        with mock.patch.dict(sys.modules, {'pyarrow': fake_pyarrow}):
+            result = table.to_arrow()
+
+        self.assertEqual(fake_pyarrow.Table.from_pydict.return_value, result)
+        fake_pyarrow.Table.from_pydict.assert_called_once_with(dict(table))
+
+    @ddt.data('to_numpy', 'to_arrow')
+    def test_missing_library(self, method):
+        table = columnar.Table.from_rows(ROWS)
+
+        with mock.patch.dict(sys.modules, {'numpy': None, 'pyarrow': None}):
+            self.assertRaises(ImportError, getattr(table, method))
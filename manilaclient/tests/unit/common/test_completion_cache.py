@@ -0,0 +1,114 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import os
+import threading
+from unittest import mock
+
+import fixtures
+
+from manilaclient.common.apiclient import base as common_base
+from manilaclient.common import completion_cache
+from manilaclient.tests.unit import utils
+
+
+class FakeResource(common_base.Resource):
+    pass
+
+
+class FakeHumanResource(common_base.Resource):
+    HUMAN_ID = True
+
+
+class FileCompletionCacheTest(utils.TestCase):
+
+    def setUp(self):
+        super(FileCompletionCacheTest, self).setUp()
+        self.cache_dir = self.useFixture(fixtures.TempDir()).path
+        self.path = os.path.join(self.cache_dir, 'fake', 'completion-cache')
+        self.cache = completion_cache.FileCompletionCache(self.path)
+
+    def _read(self):
+        with open(self.path) as cache_file:
+            return cache_file.read().splitlines()
+
+    def test_update(self):
+        self.cache.update('share', [
+            FakeResource(None, {'id': 'id1'}),
+            FakeHumanResource(None, {'id': 'id2', 'name': 'Fake Name'}),
+        ])
+
+        self.assertEqual(['share id1', 'share id2', 'share fake-name'],
+                         self._read())
+        self.assertEqual(['completion-cache'],
+                         os.listdir(os.path.dirname(self.path)))
+
+    def test_update_appends(self):
+        self.cache.update('share', [FakeResource(None, {'id': 'id1'})])
+        self.cache.update('snapshot', [FakeResource(None, {'id': 'id2'})])
+        self.cache.update('share', [FakeResource(None, {'id': 'id3'})])
+
+        self.assertEqual(['share id1', 'snapshot id2', 'share id3'],
+                         self._read())
+
+    def test_update_replace(self):
+        self.cache.update('share', [FakeResource(None, {'id': 'id1'})])
+        self.cache.update('snapshot', [FakeResource(None, {'id': 'id2'})])
+
+        self.cache.update('share', [FakeResource(None, {'id': 'id3'})],
+                          replace=True)
+
+        self.assertEqual(['snapshot id2', 'share id3'], self._read())
+
+    def test_update_concurrent(self):
+        threads = [
+            threading.Thread(target=self.cache.update, args=(
+                'share', [FakeResource(None, {'id': 'id%d' % i})]))
+            for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(set('share id%d' % i for i in range(20)),
+                         set(self._read()))
+
+    def test_update_unchanged(self):
+        self.cache.update('share', [FakeResource(None, {'id': 'id1'}),
+                                    FakeResource(None, {'id': 'id2'})])
+        self.mock_object(self.cache, '_write')
+
+        self.cache.update('share', [FakeResource(None, {'id': 'id2'}),
+                                    FakeResource(None, {'id': 'id1'})],
+                          replace=True)
+        self.cache.update('share', [FakeResource(None, {'id': 'id1'})])
+
+        self.assertFalse(self.cache._write.called)
+        self.assertEqual(['share id1', 'share id2'], self._read())
+
+    def test_update_write_failure(self):
+        self.mock_object(completion_cache.tempfile, 'mkstemp',
+                         mock.Mock(side_effect=OSError))
+
+        self.cache.update('share', [FakeResource(None, {'id': 'id1'})])
+
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_get_default_cache(self):
+        self.useFixture(fixtures.EnvironmentVariable(
+            'MANILACLIENT_UUID_CACHE_DIR', self.cache_dir))
+
+        cache = completion_cache.get_default_cache()
+
+        self.assertEqual(self.cache_dir, os.path.dirname(
+            os.path.dirname(cache.path)))
+        self.assertEqual('completion-cache', os.path.basename(cache.path))
@@ -14,10 +14,14 @@ import re
 from unittest import mock
 
 import ddt
+from keystoneauth1 import plugin
+from keystoneauth1 import session
 import requests
+from requests_mock.contrib import fixture as requests_mock_fixture
 
 import manilaclient
 from manilaclient.common import httpclient
+from manilaclient.common import response_cache
 from manilaclient import exceptions
 from manilaclient.tests.unit import utils
 
@@ -103,7 +107,7 @@ class ClientTest(utils.TestCase):
     def test_get(self, endpoint_url):
         cl = get_authed_client(endpoint_url)
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -134,7 +138,7 @@ class ClientTest(utils.TestCase):
             next_request = self.requests.pop(0)
             return next_request(*args, **kwargs)
 
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -151,7 +155,7 @@ class ClientTest(utils.TestCase):
             next_request = self.requests.pop(0)
             return next_request(*args, **kwargs)
 
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -168,7 +172,7 @@ class ClientTest(utils.TestCase):
             next_request = self.requests.pop(0)
             return next_request(*args, **kwargs)
 
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -176,7 +180,7 @@ class ClientTest(utils.TestCase):
         self.assertRaises(exceptions.BadRequest, test_get_call)
         self.assertEqual(self.requests, [mock_request])
 
-    def test_get_retry_400_socket(self):
+    def test_get_no_retry_400_with_retries(self):
         cl = get_authed_client(retries=1)
 
         self.requests = [bad_400_request, mock_request]
@@ -185,18 +189,45 @@ class ClientTest(utils.TestCase):
             next_request = self.requests.pop(0)
             return next_request(*args, **kwargs)
 
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
 
-        test_get_call()
-        self.assertEqual(self.requests, [])
+        self.assertRaises(exceptions.BadRequest, test_get_call)
+        self.assertEqual(self.requests, [mock_request])
+
+    @mock.patch.object(httpclient, 'sleep')
+    def test_get_retry_after(self, mock_sleep):
+        cl = get_authed_client(retries=1)
+        too_many_requests = utils.TestResponse({
+            'status_code': 429, 'text': '',
+            'headers': {'retry-after': '7'}})
+        session_request = mock.Mock(
+            side_effect=[too_many_requests, fake_response])
+
+        with mock.patch.object(cl.http_session, "request", session_request):
+            resp, body = cl.post("/hi", body={})
+
+        self.assertEqual({"hi": "there"}, body)
+        mock_sleep.assert_called_once_with(7.0)
+        self.assertEqual({'requests': 1, 'retries': 1, 'retries.429': 1},
+                         cl.retry_policy.get_stats())
+
+    @mock.patch.object(httpclient, 'sleep')
+    def test_post_no_retry_500(self, mock_sleep):
+        cl = get_authed_client(retries=1)
+
+        with mock.patch.object(cl.http_session, "request", bad_500_request):
+            self.assertRaises(exceptions.InternalServerError,
+                              cl.post, "/hi", body={})
+
+        self.assertFalse(mock_sleep.called)
 
     def test_get_with_retries_none(self):
         cl = get_authed_client(retries=None)
 
-        @mock.patch.object(requests, "request", bad_401_request)
+        @mock.patch.object(requests.Session, "request", bad_401_request)
         def test_get_call():
             resp, body = cl.get("/hi")
 
@@ -216,7 +247,7 @@ class ClientTest(utils.TestCase):
     def test_post(self, endpoint_url):
         cl = get_authed_client(endpoint_url)
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_post_call():
             cl.post("/hi", body=[1, 2, 3])
             headers = {
@@ -236,3 +267,281 @@ class ClientTest(utils.TestCase):
                                       endpoint_url)[0] + "/", cl.base_url)
 
         test_post_call()
+
+    def test_requests_reuse_session(self):
+        cl = get_authed_client()
+        session_request = mock.Mock(return_value=fake_response)
+
+        with mock.patch.object(cl.http_session, "request", session_request):
+            cl.get("/hi")
+            cl.post("/hi", body=[1, 2, 3])
+
+        self.assertIsInstance(cl.http_session, requests.Session)
+        self.assertEqual(2, session_request.call_count)
+
+    @ddt.data(
+        {},
+        {'pool_connections': 2, 'pool_maxsize': 25, 'pool_block': True},
+    )
+    def test_http_session_pool_options(self, kwargs):
+        cl = httpclient.HTTPClient(
+            "http://example.com", "token", fake_user_agent,
+            api_version=manilaclient.API_MAX_VERSION, **kwargs)
+
+        for scheme in ('http://', 'https://'):
+            adapter = cl.http_session.get_adapter(scheme + 'example.com')
+            self.assertEqual(kwargs.get('pool_connections', 10),
+                             adapter._pool_connections)
+            self.assertEqual(kwargs.get('pool_maxsize', 10),
+                             adapter._pool_maxsize)
+            self.assertEqual(kwargs.get('pool_block', False),
+                             adapter._pool_block)
+        self.assertNotIn('Connection', cl.default_headers)
+
+    def test_keep_alive_disabled(self):
+        cl = httpclient.HTTPClient(
+            "http://example.com", "token", fake_user_agent,
+            api_version=manilaclient.API_MAX_VERSION, keep_alive=False)
+
+        self.assertEqual('close', cl.default_headers['Connection'])
+
+    def test_close(self):
+        cl = get_authed_client()
+        self.mock_object(cl.http_session, 'close')
+
+        cl.close()
+
+        cl.http_session.close.assert_called_once_with()
+
+    def test_request_does_not_modify_defaults(self):
+        cl = get_authed_client()
+        default_headers = dict(cl.default_headers)
+        request_options = dict(cl.request_options)
+        session_request = mock.Mock(return_value=fake_response)
+
+        with mock.patch.object(cl.http_session, "request", session_request):
+            cl.post("/hi", body=[1, 2, 3], headers={'X-Foo': 'bar'})
+            cl.get("/hi")
+
+        self.assertEqual(default_headers, cl.default_headers)
+        self.assertEqual(request_options, cl.request_options)
+        self.assertEqual(
+            'bar', session_request.call_args_list[0][1]['headers']['X-Foo'])
+        self.assertEqual(
+            default_headers, session_request.call_args_list[1][1]['headers'])
+
+    @ddt.data((200, '{"name": "\\u00e9t\\u00e9"}', {'name': u'été'}),
+              (200, u'{"name": "été"}', {'name': u'été'}),
+              (200, 'not json', None),
+              (200, '', None),
+              (204, '{"ignored": true}', None))
+    @ddt.unpack
+    def test_response_body(self, status_code, text, expected_body):
+        cl = get_authed_client()
+        response = utils.TestResponse(
+            {'status_code': status_code, 'text': text})
+
+        with mock.patch.object(cl.http_session, "request",
+                               mock.Mock(return_value=response)):
+            resp, body = cl.get("/hi")
+
+        self.assertEqual(expected_body, body)
+
+    def test_get_stream(self):
+        cl = get_authed_client()
+        session_request = mock.Mock(return_value=fake_response)
+
+        with mock.patch.object(cl.http_session, "request", session_request):
+            resp, body = cl.get("/hi", stream=True)
+
+        self.assertIs(fake_response, resp)
+        self.assertIsNone(body)
+        self.assertTrue(session_request.call_args[1]['stream'])
+
+    def test_get_stream_error(self):
+        cl = get_authed_client()
+
+        with mock.patch.object(cl.http_session, "request", bad_401_request):
+            self.assertRaises(exceptions.Unauthorized,
+                              cl.get, "/hi", stream=True)
+
+    def _get_cached_client(self):
+        cl = get_authed_client()
+        cl.response_cache = response_cache.MemoryResponseCache()
+        return cl
+
+    def test_get_cached(self):
+        cl = self._get_cached_client()
+        session_request = mock.Mock(return_value=fake_response)
+
+        with mock.patch.object(cl.http_session, "request", session_request):
+            first = cl.get("/types")
+            second = cl.get("/types")
+
+        self.assertEqual(1, session_request.call_count)
+        self.assertEqual(first, second)
+        self.assertIsNot(first[1], second[1])
+        self.assertEqual({'hits': 1, 'misses': 1, 'revalidations': 0,
+                          'invalidations': 0, 'entries': 1},
+                         cl.response_cache.get_stats())
+
+    def test_get_not_cacheable(self):
+        cl = self._get_cached_client()
+        session_request = mock.Mock(return_value=fake_response)
+
+        with mock.patch.object(cl.http_session, "request", session_request):
+            cl.get("/shares")
+            cl.get("/shares")
+
+        self.assertEqual(2, session_request.call_count)
+        self.assertEqual(0, len(cl.response_cache))
+
+    def test_get_cached_by_headers(self):
+        cl = self._get_cached_client()
+        session_request = mock.Mock(return_value=fake_response)
+
+        with mock.patch.object(cl.http_session, "request", session_request):
+            cl.get("/types")
+            cl.default_headers['X-Auth-Token'] = 'other_token'
+            cl.get("/types")
+
+        self.assertEqual(2, session_request.call_count)
+
+    def test_mutating_request_invalidates(self):
+        cl = self._get_cached_client()
+        session_request = mock.Mock(return_value=fake_response)
+
+        with mock.patch.object(cl.http_session, "request", session_request):
+            cl.get("/types")
+            cl.post("/types", body={'share_type': {}})
+            cl.get("/types")
+
+        self.assertEqual(3, session_request.call_count)
+
+    def test_get_revalidated(self):
+        cl = self._get_cached_client()
+        response = utils.TestResponse({
+            'status_code': 200, 'text': '{"hi": "there"}',
+            'headers': {'ETag': '"v1"'}})
+        not_modified = utils.TestResponse({'status_code': 304, 'text': ''})
+        session_request = mock.Mock(side_effect=[response, not_modified])
+
+        with mock.patch.object(cl.http_session, "request", session_request):
+            cl.get("/types")
+            with mock.patch.object(response_cache.time, 'time',
+                                   mock.Mock(return_value=2e10)):
+                resp, body = cl.get("/types")
+
+        self.assertIs(response, resp)
+        self.assertEqual({'hi': 'there'}, body)
+        self.assertEqual(
+            '"v1"',
+            session_request.call_args[1]['headers']['If-None-Match'])
+        self.assertEqual(1, cl.response_cache.get_stats()['revalidations'])
+
+    def test_get_coalesced(self):
+        cl = httpclient.HTTPClient(
+            "http://example.com", "token", fake_user_agent,
+            api_version=manilaclient.API_MAX_VERSION, coalesce_requests=True)
+        shared_response = utils.TestResponse({
+            'status_code': 200, 'text': '{"hi": "there"}'})
+        self.mock_object(cl.in_flight, 'do', mock.Mock(
+            return_value=((shared_response, {'hi': 'there'}), True)))
+
+        resp, body = cl.get("/hi")
+
+        self.assertIs(shared_response, resp)
+        self.assertEqual({'hi': 'there'}, body)
+        self.assertEqual(
+            ('http://example.com/hi',
+             tuple(sorted(cl.default_headers.items()))),
+            cl.in_flight.do.call_args[0][0])
+
+    @ddt.data({'method': 'POST', 'body': {}},
+              {'method': 'GET', 'stream': True})
+    @ddt.unpack
+    def test_request_not_coalesced(self, method, **kwargs):
+        cl = httpclient.HTTPClient(
+            "http://example.com", "token", fake_user_agent,
+            api_version=manilaclient.API_MAX_VERSION, coalesce_requests=True)
+        self.mock_object(cl.in_flight, 'do')
+
+        with mock.patch.object(cl.http_session, "request", mock_request):
+            cl._cs_request("/hi", method, **kwargs)
+
+        self.assertFalse(cl.in_flight.do.called)
+
+
+class _FakeAuth(plugin.BaseAuthPlugin):
+    """Auth plugin returning a new token after each invalidation."""
+
+    def __init__(self):
+        super(_FakeAuth, self).__init__()
+        self.tokens = 0
+
+    def get_token(self, session, **kwargs):
+        return 'token-%d' % self.tokens
+
+    def invalidate(self):
+        self.tokens += 1
+        return True
+
+
+class SessionClientTest(utils.TestCase):
+
+    def setUp(self):
+        super(SessionClientTest, self).setUp()
+        self.auth = _FakeAuth()
+        self.session = session.Session(auth=self.auth)
+        self.client = httpclient.SessionClient(
+            self.session, 'http://example.com/v2', fake_user_agent,
+            manilaclient.API_MAX_VERSION)
+        self.requests_mock = self.useFixture(requests_mock_fixture.Fixture())
+
+    def test_get(self):
+        self.requests_mock.get('http://example.com/v2/shares',
+                               json={'shares': []})
+
+        resp, body = self.client.get('/shares')
+
+        self.assertEqual({'shares': []}, body)
+        headers = self.requests_mock.last_request.headers
+        self.assertEqual('token-0', headers['X-Auth-Token'])
+        self.assertEqual(fake_user_agent, headers['User-Agent'])
+        self.assertEqual(manilaclient.API_MAX_VERSION.get_string(),
+                         headers[httpclient.HTTPClient.API_VERSION_HEADER])
+
+    def test_post(self):
+        self.requests_mock.post('http://example.com/v2/shares',
+                                json={'share': {'id': '1234'}})
+
+        resp, body = self.client.post('/shares', body={'share': {}})
+
+        self.assertEqual({'share': {'id': '1234'}}, body)
+        self.assertEqual({'share': {}},
+                         self.requests_mock.last_request.json())
+
+    def test_token_renewed(self):
+        self.requests_mock.get('http://example.com/v2/shares', [
+            {'status_code': 401, 'json': {}},
+            {'json': {'shares': []}},
+        ])
+
+        resp, body = self.client.get('/shares')
+
+        self.assertEqual({'shares': []}, body)
+        self.assertEqual('token-1', self.requests_mock.last_request.headers[
+            'X-Auth-Token'])
+
+    def test_error(self):
+        self.requests_mock.get('http://example.com/v2/shares/1234',
+                               status_code=404, json={})
+
+        self.assertRaises(exceptions.NotFound,
+                          self.client.get, '/shares/1234')
+
+    def test_close_keeps_session(self):
+        with mock.patch.object(self.session.session, 'close') as mock_close:
+            self.client.close()
+
+        self.assertFalse(mock_close.called)
@@ -0,0 +1,63 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import ddt
+from oslo_serialization import jsonutils
+
+from manilaclient.common import json_stream
+from manilaclient.tests.unit import utils
+
+SHARES = [{'id': str(i), 'name': u'shäre-%d' % i, 'size': i,
+           'metadata': {'key': [1, 2.5, None, True]}} for i in range(50)]
+
+
+def _chunks(document, chunk_size):
+    data = document.encode('utf-8')
+    return [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+@ddt.ddt
+class IterItemsTest(utils.TestCase):
+
+    @ddt.data(1, 2, 7, 64, 100000)
+    def test_iter_items(self, chunk_size):
+        document = jsonutils.dumps({'count': 12345, 'shares': SHARES,
+                                    'shares_links': [{'rel': 'next'}]})
+        values = {}
+
+        items = json_stream.iter_items(
+            _chunks(document, chunk_size), 'shares', values)
+
+        self.assertEqual(SHARES, list(items))
+        self.assertEqual(
+            {'count': 12345, 'shares_links': [{'rel': 'next'}]}, values)
+
+    def test_iter_items_is_lazy(self):
+        document = jsonutils.dumps({'shares': SHARES})
+        chunks = iter(_chunks(document, 16))
+
+        items = json_stream.iter_items(chunks, 'shares')
+
+        self.assertEqual(SHARES[0], next(items))
+        self.assertNotEqual([], list(chunks))
+
+    @ddt.data('{}', '{"shares": []}', ' { "other" : 1 } ', '{"shares": null}')
+    def test_iter_items_empty(self, document):
+        self.assertEqual(
+            [], list(json_stream.iter_items(_chunks(document, 3), 'shares')))
+
+    @ddt.data('', '[]', '{"shares": [1, 2', '{"shares": [1 2]}',
+              '{"shares": [1]')
+    def test_iter_items_invalid(self, document):
+        self.assertRaises(
+            ValueError, list,
+            json_stream.iter_items(_chunks(document, 3), 'shares'))
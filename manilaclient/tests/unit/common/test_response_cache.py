@@ -0,0 +1,125 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from unittest import mock
+
+import ddt
+
+from manilaclient.common import response_cache
+from manilaclient.tests.unit import utils
+
+
+def _response(headers=None):
+    return utils.TestResponse({'status_code': 200, 'text': '{}',
+                               'headers': headers or {}})
+
+
+@ddt.ddt
+class MemoryResponseCacheTest(utils.TestCase):
+
+    def setUp(self):
+        super(MemoryResponseCacheTest, self).setUp()
+        self.cache = response_cache.MemoryResponseCache()
+        self.mock_time = self.mock_object(response_cache.time, 'time',
+                                          mock.Mock(return_value=1000))
+
+    @ddt.data(('/types', 'types'),
+              ('/types?is_public=all', 'types'),
+              ('/types/1234/extra_specs', 'types'),
+              ('/os-services', 'services'),
+              ('/quota-sets/fake/defaults', 'quota-sets'))
+    @ddt.unpack
+    def test_get_collection(self, url, collection):
+        self.assertEqual(collection, response_cache.get_collection(url))
+
+    @ddt.data(('/types?is_public=all', 300),
+              ('/availability-zones', 300),
+              ('/os-availability-zone', 300),
+              ('/limits', 10),
+              ('/quota-sets/fake/defaults', 300),
+              ('/quota-sets/fake', None),
+              ('/shares/detail', None),
+              ('/typesfoo', None))
+    @ddt.unpack
+    def test_get_ttl(self, url, ttl):
+        self.assertEqual(ttl, self.cache.get_ttl(url))
+
+    def test_lookup(self):
+        resp = _response()
+        self.cache.store('key', '/types', resp)
+
+        entry, fresh = self.cache.lookup('key')
+
+        self.assertIs(resp, entry.resp)
+        self.assertTrue(fresh)
+        self.assertEqual(1, self.cache.get_stats()['hits'])
+
+    def test_lookup_expired(self):
+        self.cache.store('key', '/types', _response())
+        self.mock_time.return_value = 1300
+
+        self.assertEqual((None, False), self.cache.lookup('key'))
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual(1, self.cache.get_stats()['misses'])
+
+    def test_lookup_expired_conditional(self):
+        resp = _response({'ETag': '"v1"'})
+        self.cache.store('key', '/types', resp)
+        self.mock_time.return_value = 1300
+
+        entry, fresh = self.cache.lookup('key')
+
+        self.assertIs(resp, entry.resp)
+        self.assertFalse(fresh)
+        self.assertEqual({'If-None-Match': '"v1"'},
+                         self.cache.get_conditional_headers(entry))
+
+        self.cache.refresh('key', '/types', entry)
+
+        self.assertEqual((entry.resp, True),
+                         (self.cache.lookup('key')[0].resp, True))
+        self.assertEqual(1, self.cache.get_stats()['revalidations'])
+
+    def test_store_not_cacheable(self):
+        self.cache.store('key', '/shares', _response())
+
+        self.assertEqual(0, len(self.cache))
+
+    def test_store_lru(self):
+        self.cache = response_cache.MemoryResponseCache(max_entries=2)
+        for key in ('a', 'b'):
+            self.cache.store(key, '/types', _response())
+        self.cache.lookup('a')
+
+        self.cache.store('c', '/types', _response())
+
+        self.assertEqual(['a', 'c'], list(self.cache._entries))
+
+    def test_invalidate(self):
+        self.cache.store('types', '/types', _response())
+        self.cache.store('services', '/os-services', _response())
+
+        self.cache.invalidate('/types/1234/action')
+
+        self.assertEqual(['services'], list(self.cache._entries))
+        self.assertEqual(1, self.cache.get_stats()['invalidations'])
+
+        self.cache.invalidate()
+
+        self.assertEqual(0, len(self.cache))
+
+    def test_custom_ttls(self):
+        self.cache = response_cache.MemoryResponseCache(
+            ttls=((r'/shares/detail', 5), ))
+
+        self.assertEqual(5, self.cache.get_ttl('/shares/detail'))
+        self.assertIsNone(self.cache.get_ttl('/types'))
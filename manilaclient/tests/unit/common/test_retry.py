@@ -0,0 +1,116 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from unittest import mock
+
+import ddt
+import requests
+
+from manilaclient.common import retry
+from manilaclient import exceptions
+from manilaclient.tests.unit import utils
+
+
+def _http_error(status, headers=None):
+    response = utils.TestResponse({'status_code': status, 'text': '',
+                                   'headers': headers or {}})
+    return exceptions.from_response(response, 'GET', '/fake')
+
+
+@ddt.ddt
+class RetryPolicyTest(utils.TestCase):
+
+    @ddt.data(('GET', 500, True),
+              ('GET', 503, True),
+              ('DELETE', 429, True),
+              ('GET', 400, False),
+              ('GET', 404, False),
+              ('PUT', 409, False),
+              ('POST', 500, False),
+              ('POST', 503, True),
+              ('POST', 429, True))
+    @ddt.unpack
+    def test_is_retryable_status(self, method, status, retryable):
+        policy = retry.RetryPolicy(retries=1)
+
+        self.assertEqual(retryable,
+                         policy.is_retryable(method, _http_error(status)))
+
+    @ddt.data(('GET', requests.exceptions.ConnectionError(), True),
+              ('POST', requests.exceptions.ReadTimeout(), False),
+              ('POST', requests.exceptions.ConnectTimeout(), True),
+              ('GET', exceptions.ClientException(), False))
+    @ddt.unpack
+    def test_is_retryable_error(self, method, error, retryable):
+        policy = retry.RetryPolicy(retries=1)
+
+        self.assertEqual(retryable, policy.is_retryable(method, error))
+
+    def test_get_retry_delay_backoff(self):
+        policy = retry.RetryPolicy(retries=10, backoff=1, max_backoff=5,
+                                   jitter=False)
+
+        delays = [policy.get_retry_delay('GET', _http_error(500), attempt)
+                  for attempt in range(1, 6)]
+
+        self.assertEqual([1, 2, 4, 5, 5], delays)
+
+    def test_get_retry_delay_jitter(self):
+        policy = retry.RetryPolicy(retries=3, backoff=4)
+
+        delay = policy.get_retry_delay('GET', _http_error(500), 2)
+
+        self.assertTrue(4 <= delay <= 8)
+
+    def test_get_retry_delay_exhausted(self):
+        policy = retry.RetryPolicy(retries=1)
+
+        self.assertIsNone(policy.get_retry_delay('GET', _http_error(500), 2))
+        self.assertEqual({'exhausted': 1}, policy.get_stats())
+
+    @ddt.data(('12', 12.0), ('Thu, 01 Jan 1970 00:01:40 GMT', 40.0))
+    @ddt.unpack
+    @mock.patch.object(retry.time, 'time', mock.Mock(return_value=60))
+    def test_get_retry_delay_retry_after(self, retry_after, expected):
+        policy = retry.RetryPolicy(retries=1)
+        error = _http_error(503, {'retry-after': retry_after})
+
+        self.assertEqual(expected, policy.get_retry_delay('GET', error, 1))
+
+    def test_get_retry_delay_retry_after_too_long(self):
+        policy = retry.RetryPolicy(retries=1, max_retry_after=10)
+        error = _http_error(503, {'retry-after': '120'})
+
+        self.assertIsNone(policy.get_retry_delay('GET', error, 1))
+
+    def test_get_retry_delay_on_retry(self):
+        on_retry = mock.Mock()
+        policy = retry.RetryPolicy(retries=1, jitter=False, on_retry=on_retry)
+        error = _http_error(502)
+
+        policy.get_retry_delay('GET', error, 1)
+
+        on_retry.assert_called_once_with('GET', error, 1, 1.0)
+        self.assertEqual({'retries': 1, 'retries.502': 1}, policy.get_stats())
+
+    def test_budget(self):
+        budget = retry.RetryBudget(ratio=0.5, reserve=1)
+        policy = retry.RetryPolicy(retries=5, budget=budget)
+        error = _http_error(500)
+
+        policy.record_request()
+        self.assertIsNotNone(policy.get_retry_delay('GET', error, 1))
+        self.assertIsNone(policy.get_retry_delay('GET', error, 2))
+        policy.record_request()
+        policy.record_request()
+        self.assertIsNotNone(policy.get_retry_delay('GET', error, 2))
+        self.assertEqual(1, policy.get_stats()['budget_exhausted'])
@@ -0,0 +1,80 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+
+from manilaclient.common import single_flight
+from manilaclient.tests.unit import utils
+
+
+class SingleFlightTest(utils.TestCase):
+
+    def setUp(self):
+        super(SingleFlightTest, self).setUp()
+        self.group = single_flight.SingleFlight()
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def _func(self, value):
+        self.calls.append(value)
+        self.started.set()
+        self.release.wait(5)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    def _run_concurrently(self, value, num_threads=3):
+        results = []
+
+        def _do():
+            try:
+                results.append(self.group.do('key', self._func, value))
+            except Exception as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=_do)]
+        threads[0].start()
+        self.started.wait(5)
+        for i in range(num_threads - 1):
+            threads.append(threading.Thread(target=_do))
+            threads[-1].start()
+        while self.group.coalesced < num_threads - 1:
+            threading.Event().wait(0.01)
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        return results
+
+    def test_do_coalesces(self):
+        results = self._run_concurrently('value')
+
+        self.assertEqual(['value'], self.calls)
+        self.assertEqual([('value', False), ('value', True), ('value', True)],
+                         sorted(results, key=lambda r: r[1]))
+        self.assertEqual(2, self.group.coalesced)
+
+    def test_do_shares_error(self):
+        error = ValueError('fake')
+
+        results = self._run_concurrently(error)
+
+        self.assertEqual([error], self.calls)
+        self.assertEqual([error] * 3, results)
+
+    def test_do_sequential(self):
+        self.release.set()
+
+        self.assertEqual(('a', False), self.group.do('key', self._func, 'a'))
+        self.assertEqual(('b', False), self.group.do('key', self._func, 'b'))
+        self.assertEqual(['a', 'b'], self.calls)
+        self.assertEqual(0, self.group.coalesced)
@@ -0,0 +1,208 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from unittest import mock
+
+from manilaclient.common import waiter
+from manilaclient import exceptions
+from manilaclient.tests.unit import utils
+
+
+SORT_OPTS = {'sort_key': 'created_at', 'sort_dir': 'desc'}
+
+
+class FakeResource(object):
+
+    def __init__(self, id, status):
+        self.id = id
+        self.status = status
+
+
+class WaitForResourcesTest(utils.TestCase):
+
+    def setUp(self):
+        super(WaitForResourcesTest, self).setUp()
+        self.mock_sleep = self.mock_object(waiter.time, 'sleep')
+        self.manager = mock.Mock(spec=['get', 'list'])
+
+    def test_wait_for_resources(self):
+        self.manager.list.side_effect = [
+            [FakeResource('r1', 'creating'), FakeResource('r2', 'creating'),
+             FakeResource('r3', 'creating'), FakeResource('other', 'error')],
+            [FakeResource('r1', 'available'), FakeResource('r2', 'error'),
+             FakeResource('r3', 'creating')],
+        ]
+        self.manager.get.return_value = FakeResource('r3', 'available')
+
+        results = waiter.wait_for_resources(
+            self.manager, ['r1', FakeResource('r2', 'creating'), 'r3'],
+            search_opts={'name': 'fake'}, get_threshold=1)
+
+        self.assertEqual(['r1', 'r2', 'r3'],
+                         [result.resource_id for result in results])
+        self.assertEqual(
+            [waiter.SUCCESS, waiter.ERROR, waiter.SUCCESS],
+            [result.outcome for result in results])
+        self.assertEqual([True, False, True],
+                         [result.succeeded for result in results])
+        self.manager.list.assert_called_with(
+            search_opts=dict(SORT_OPTS, name='fake', limit=500))
+        self.assertEqual(2, self.manager.list.call_count)
+        self.manager.get.assert_called_once_with('r3')
+        self.assertEqual(2, self.mock_sleep.call_count)
+
+    def test_wait_for_resources_deleted(self):
+        self.manager.list.return_value = [FakeResource('r2', 'deleting')]
+        self.manager.get.side_effect = exceptions.NotFound(404)
+
+        results = waiter.wait_for_resources(
+            self.manager, ['r1', 'r2'], expected_status='deleted',
+            search_opts={'name': 'fake'}, get_threshold=1)
+
+        self.assertEqual([waiter.DELETED, waiter.DELETED],
+                         [result.outcome for result in results])
+        # NOTE: Resources missing from the listing are confirmed deleted.
+        self.manager.list.assert_called_once_with(
+            search_opts=dict(SORT_OPTS, name='fake', limit=500))
+        self.assertEqual([mock.call('r1'), mock.call('r2')],
+                         self.manager.get.call_args_list)
+
+    def test_wait_for_few_resources_uses_get(self):
+        self.manager.get.side_effect = [FakeResource('r1', 'available'),
+                                        FakeResource('r2', 'available')]
+
+        results = waiter.wait_for_resources(
+            self.manager, ['r1', 'r2'], search_opts={'name': 'fake'})
+
+        self.assertEqual([waiter.SUCCESS, waiter.SUCCESS],
+                         [result.outcome for result in results])
+        self.assertFalse(self.manager.list.called)
+
+    def test_wait_for_resources_of_unknown_projects_uses_get(self):
+        self.manager.get.side_effect = [
+            FakeResource(resource_id, 'available')
+            for resource_id in ('r1', 'r2', 'r3', 'r4')]
+
+        results = waiter.wait_for_resources(
+            self.manager, ['r1', 'r2', 'r3', 'r4'])
+
+        self.assertEqual([waiter.SUCCESS] * 4,
+                         [result.outcome for result in results])
+        self.assertFalse(self.manager.list.called)
+
+    def test_wait_for_resources_lists_their_project(self):
+        resources = []
+        for resource_id in ('r1', 'r2', 'r3', 'r4'):
+            resource = FakeResource(resource_id, 'creating')
+            resource._info = {'project_id': 'fake_project'}
+            resources.append(resource)
+        self.manager.list.return_value = [
+            FakeResource(resource.id, 'available') for resource in resources]
+
+        waiter.wait_for_resources(self.manager, resources)
+
+        self.manager.list.assert_called_once_with(search_opts=dict(
+            SORT_OPTS, all_tenants=1, project_id='fake_project', limit=500))
+        self.assertFalse(self.manager.get.called)
+
+    def test_wait_for_resources_not_found(self):
+        self.manager.get.side_effect = exceptions.NotFound(404)
+
+        results = waiter.wait_for_resources(self.manager, ['r1'])
+
+        self.assertEqual(waiter.NOT_FOUND, results[0].outcome)
+        self.assertFalse(self.mock_sleep.called)
+
+    def test_wait_for_resources_uses_list_iter(self):
+        manager = mock.Mock(spec=['get', 'list', 'list_iter'])
+        listed = iter(
+            [FakeResource('r1', 'available'), FakeResource('r2', 'active'),
+             FakeResource('other', 'error')])
+        manager.list_iter.return_value = listed
+
+        results = waiter.wait_for_resources(
+            manager, ['r1', 'r2'], expected_status=['available', 'active'],
+            search_opts={}, get_threshold=1, max_pages=2)
+
+        self.assertEqual([waiter.SUCCESS, waiter.SUCCESS],
+                         [result.outcome for result in results])
+        manager.list_iter.assert_called_once_with(
+            search_opts=dict(SORT_OPTS, limit=200),
+            page_size=waiter.PAGE_SIZE)
+        # NOTE: Listing stops once all the pending resources were seen.
+        self.assertEqual('other', next(listed).id)
+        self.assertFalse(manager.list.called)
+        self.assertFalse(manager.get.called)
+
+    def test_wait_for_resources_not_covered_by_listing(self):
+        self.manager.list.return_value = [
+            FakeResource('other%d' % i, 'available')
+            for i in range(waiter.PAGE_SIZE)]
+        self.manager.get.side_effect = (
+            [FakeResource('r1', 'creating'), FakeResource('r2', 'creating')] +
+            [FakeResource('r1', 'available'), FakeResource('r2', 'available')])
+
+        results = waiter.wait_for_resources(
+            self.manager, ['r1', 'r2'], search_opts={}, get_threshold=1,
+            max_pages=1)
+
+        self.assertEqual([waiter.SUCCESS, waiter.SUCCESS],
+                         [result.outcome for result in results])
+        # NOTE: Once a full listing missed the resources, they are only
+        # requested one by one.
+        self.manager.list.assert_called_once_with(
+            search_opts=dict(SORT_OPTS, limit=waiter.PAGE_SIZE))
+        self.assertEqual(4, self.manager.get.call_count)
+
+    def test_wait_for_more_resources_than_listed_uses_get(self):
+        resource_ids = ['r%d' % i for i in range(waiter.PAGE_SIZE + 1)]
+        self.manager.get.side_effect = lambda resource_id: FakeResource(
+            resource_id, 'available')
+
+        waiter.wait_for_resources(self.manager, resource_ids, search_opts={},
+                                  max_pages=1)
+
+        self.assertFalse(self.manager.list.called)
+        self.assertEqual(len(resource_ids), self.manager.get.call_count)
+
+    def test_wait_for_resources_timeout(self):
+        self.mock_object(waiter.time, 'time',
+                         mock.Mock(side_effect=[0, 5, 11]))
+        self.manager.get.return_value = FakeResource('r1', 'creating')
+
+        results = waiter.wait_for_resources(
+            self.manager, ['r1'], timeout=10, interval=4)
+
+        self.assertEqual(waiter.TIMEOUT, results[0].outcome)
+        self.assertEqual('creating', results[0].resource.status)
+        self.assertEqual(2, self.manager.get.call_count)
+        self.assertEqual(1, self.mock_sleep.call_count)
+        delay = self.mock_sleep.call_args[0][0]
+        self.assertTrue(2 <= delay <= 4)
+
+    def test_wait_for_resources_backoff(self):
+        self.mock_object(waiter.random, 'uniform',
+                         mock.Mock(side_effect=lambda low, high: high))
+        self.manager.get.side_effect = (
+            [FakeResource('r1', 'creating')] * 5 +
+            [FakeResource('r1', 'available')])
+
+        waiter.wait_for_resources(
+            self.manager, ['r1'], interval=1, max_interval=5)
+
+        self.assertEqual([mock.call(1), mock.call(2), mock.call(4),
+                          mock.call(5), mock.call(5)],
+                         self.mock_sleep.call_args_list)
+
+    def test_wait_for_no_resources(self):
+        self.assertEqual([], waiter.wait_for_resources(self.manager, []))
+        self.assertFalse(self.manager.list.called)
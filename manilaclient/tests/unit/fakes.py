@@ -83,3 +83,44 @@ class FakeClient(object):
 
     def authenticate(self):
         pass
+
+
+class FakeAsyncResponse(object):
+    """Response of a :class:`FakeAsyncSession`, like an aiohttp one."""
+
+    def __init__(self, status=200, text='', headers=None):
+        self.status = status
+        self._text = text
+        self.headers = headers or {}
+
+    async def read(self):
+        return self._text.encode('utf-8')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+class FakeAsyncSession(object):
+    """Session with the interface of an aiohttp ClientSession.
+
+    Every request is recorded in ``calls`` and answered with the next item
+    of ``responses``, which are :class:`FakeAsyncResponse` or exceptions.
+    """
+
+    def __init__(self, responses=()):
+        self.responses = list(responses)
+        self.calls = []
+        self.closed = False
+
+    def request(self, method, url, headers=None, data=None):
+        self.calls.append((method, url, headers, data))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async def close(self):
+        self.closed = True
@@ -35,6 +35,7 @@ class FakeShareClient(object):
         self.share_type_access = mock.Mock()
         self.quotas = mock.Mock()
         self.share_snapshots = mock.Mock()
+        self.share_groups = mock.Mock()
         self.share_snapshot_export_locations = mock.Mock()
         self.shares.resource_class = osc_fakes.FakeResource(None, {})
         self.share_export_locations = mock.Mock()
@@ -24,7 +24,9 @@ from osc_lib import utils as oscutils
 from manilaclient import api_versions
 from manilaclient.api_versions import MAX_VERSION
 from manilaclient.common.apiclient import exceptions
+from manilaclient.common import bulk
 from manilaclient.common import cliutils
+from manilaclient.common import waiter
 from manilaclient.osc.v2 import share as osc_shares
 from manilaclient.tests.unit.osc import osc_utils
 from manilaclient.tests.unit.osc.v2 import fakes as manila_fakes
@@ -321,7 +323,48 @@ class TestShareDelete(TestShare):
         result = self.cmd.take_action(parsed_args)
 
         calls = [mock.call(s, None) for s in shares]
-        self.shares_mock.delete.assert_has_calls(calls)
+        self.shares_mock.delete.assert_has_calls(calls, any_order=True)
+        self.assertIsNone(result)
+
+    def test_share_delete_many_concurrency(self):
+        shares = self.setup_shares_mock(count=3)
+
+        arglist = [v.id for v in shares] + ['--concurrency', '2']
+        verifylist = [
+            ('shares', [v.id for v in shares]),
+            ('concurrency', 2),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        with mock.patch.object(bulk, 'run', wraps=bulk.run) as mock_run:
+            result = self.cmd.take_action(parsed_args)
+
+        mock_run.assert_called_once_with(
+            mock.ANY, [v.id for v in shares], max_workers=2)
+        self.assertEqual(3, self.shares_mock.delete.call_count)
+        self.assertIsNone(result)
+
+    def test_share_delete_with_share_group(self):
+        shares = self.setup_shares_mock(count=1)
+        share_group = mock.Mock(id='fake_share_group_id')
+        share_groups_mock = self.app.client_manager.share.share_groups
+        share_groups_mock.get.return_value = share_group
+
+        arglist = [
+            '--share-group', 'fake_share_group',
+            shares[0].name,
+        ]
+        verifylist = [
+            ("force", False),
+            ("share_group", 'fake_share_group'),
+            ('shares', [shares[0].name]),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        result = self.cmd.take_action(parsed_args)
+
+        self.shares_mock.delete.assert_called_once_with(
+            shares[0], 'fake_share_group_id')
         self.assertIsNone(result)
 
     def test_share_delete_with_force(self):
@@ -393,10 +436,15 @@ class TestShareDelete(TestShare):
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
 
-        with mock.patch('osc_lib.utils.wait_for_delete', return_value=True):
+        with mock.patch.object(
+                waiter, 'wait_for_resources',
+                return_value=[waiter.WaitResult('fake', waiter.DELETED)]
+        ) as mock_wait:
             result = self.cmd.take_action(parsed_args)
             self.shares_mock.delete.assert_called_with(shares[0], None)
             self.shares_mock.get.assert_called_with(shares[0].name)
+            mock_wait.assert_called_once_with(
+                self.shares_mock, [shares[0]], expected_status='deleted')
             self.assertIsNone(result)
 
     def test_share_delete_wait_error(self):
@@ -415,7 +463,9 @@ class TestShareDelete(TestShare):
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
 
-        with mock.patch('osc_lib.utils.wait_for_delete', return_value=False):
+        with mock.patch.object(
+                waiter, 'wait_for_resources',
+                return_value=[waiter.WaitResult('fake', waiter.TIMEOUT)]):
             self.assertRaises(
                 osc_exceptions.CommandError,
                 self.cmd.take_action,
@@ -1628,6 +1678,25 @@ class TestAbandonShare(TestShare):
         self.shares_mock.unmanage.assert_called_with(self._share)
         self.assertIsNone(result)
 
+    def test_share_abandon_concurrency(self):
+        arglist = [
+            self._share.id,
+            '--concurrency', '4',
+        ]
+        verifylist = [
+            ('share', [self._share.id]),
+            ('concurrency', 4),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        with mock.patch.object(bulk, 'run', wraps=bulk.run) as mock_run:
+            self.cmd.take_action(parsed_args)
+
+        mock_run.assert_called_once_with(
+            mock.ANY, [self._share.id], max_workers=4)
+        self.shares_mock.unmanage.assert_called_with(self._share)
+
     def test_share_abandon_wait(self):
         arglist = [
             self._share.id,
@@ -1640,7 +1709,9 @@ class TestAbandonShare(TestShare):
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
 
-        with mock.patch('osc_lib.utils.wait_for_delete', return_value=True):
+        with mock.patch.object(
+                waiter, 'wait_for_resources',
+                return_value=[waiter.WaitResult('fake', waiter.DELETED)]):
             result = self.cmd.take_action(parsed_args)
             self.shares_mock.unmanage.assert_called_with(self._share)
             self.assertIsNone(result)
@@ -1657,7 +1728,9 @@ class TestAbandonShare(TestShare):
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
 
-        with mock.patch('osc_lib.utils.wait_for_delete', return_value=False):
+        with mock.patch.object(
+                waiter, 'wait_for_resources',
+                return_value=[waiter.WaitResult('fake', waiter.TIMEOUT)]):
             self.assertRaises(
                 osc_exceptions.CommandError,
                 self.cmd.take_action,
@@ -142,6 +142,12 @@ class APIVersionTestCase(utils.TestCase):
         v_latest = api_versions.APIVersion(api_versions.MAX_VERSION)
         self.assertTrue(v_latest.is_latest())
 
+    def test_hash(self):
+        self.assertEqual(hash(api_versions.APIVersion("2.36")),
+                         hash(api_versions.APIVersion("2.36")))
+        self.assertEqual(1, len({api_versions.APIVersion("2.36"),
+                                 api_versions.APIVersion("2.36")}))
+
 
 class GetAPIVersionTestCase(utils.TestCase):
 
@@ -261,6 +267,40 @@ class WrapsTestCase(utils.TestCase):
                   (('action_2',), {'help': 'Some action'})]
         self.assertEqual(args_2, some_func_2.arguments)
 
+    def test_dispatch_is_cached(self):
+        checker = mock.MagicMock()
+
+        @api_versions.wraps("2.2", "2.6")
+        def cached_func(*args, **kwargs):
+            checker(*args, **kwargs)
+
+        obj = self._get_obj_with_vers("2.4")
+        with mock.patch.object(api_versions, 'get_versioned_methods',
+                               wraps=api_versions.get_versioned_methods
+                               ) as mock_get_methods:
+            cached_func(obj)
+            cached_func(self._get_obj_with_vers("2.4"))
+            cached_func(self._get_obj_with_vers("2.5"))
+
+        self.assertEqual(3, checker.call_count)
+        self.assertEqual(2, mock_get_methods.call_count)
+
+    def test_dispatch_cache_cleared_by_new_versions(self):
+
+        @api_versions.wraps("2.2", "2.3")
+        def replaced_func(obj):
+            return 'old'
+
+        obj = self._get_obj_with_vers("2.4")
+        self.assertRaises(exceptions.UnsupportedVersion, replaced_func, obj)
+
+        @api_versions.wraps("2.4")  # noqa
+        def replaced_func(obj):  # noqa
+            return 'new'
+
+        self.assertEqual('new', replaced_func(obj))
+        self.assertEqual('old', replaced_func(self._get_obj_with_vers("2.2")))
+
 
 class DiscoverVersionTestCase(utils.TestCase):
     def setUp(self):
@@ -379,3 +419,44 @@ class DiscoverVersionTestCase(utils.TestCase):
                                api_versions.discover_version,
                                self.fake_client,
                                api_versions.APIVersion("1.0"))
+
+    def test_server_version_range_cached_per_endpoint(self):
+        self.addCleanup(api_versions.clear_server_version_cache)
+        self._mock_returned_server_version('2.7', '2.4')
+        self.fake_client.client.endpoint_url = 'http://fake.endpoint/v2'
+        other_client = mock.MagicMock()
+        other_client.client.endpoint_url = 'http://fake.endpoint/v2'
+
+        api_versions.discover_version(
+            self.fake_client, api_versions.APIVersion('2.5'))
+        discovered_version = api_versions.discover_version(
+            other_client, api_versions.APIVersion('2.7'))
+
+        self.assertEqual('2.7', discovered_version.get_string())
+        self.assertEqual(
+            1, self.fake_client.services.server_api_version.call_count)
+        self.assertFalse(other_client.services.server_api_version.called)
+
+    def test_server_version_range_cache_expired(self):
+        self.addCleanup(api_versions.clear_server_version_cache)
+        self.mock_object(api_versions, 'SERVER_VERSION_CACHE_TTL', -1)
+        self._mock_returned_server_version('2.7', '2.4')
+        self.fake_client.client.endpoint_url = 'http://fake.endpoint/v2'
+
+        for i in range(2):
+            api_versions.discover_version(
+                self.fake_client, api_versions.APIVersion('2.5'))
+
+        self.assertEqual(
+            2, self.fake_client.services.server_api_version.call_count)
+
+    def test_discover_version_with_server_version_range(self):
+        manilaclient.API_MAX_VERSION = api_versions.APIVersion("2.11")
+        manilaclient.API_MIN_VERSION = api_versions.APIVersion("2.1")
+
+        discovered_version = api_versions.discover_version(
+            None, api_versions.APIVersion('2.11'),
+            server_version_range=(api_versions.APIVersion('2.0'),
+                                  api_versions.APIVersion('2.9')))
+
+        self.assertEqual('2.9', discovered_version.get_string())
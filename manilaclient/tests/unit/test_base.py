@@ -12,16 +12,21 @@
 
 from unittest import mock
 
+import ddt
+
+from manilaclient import base
 from manilaclient.common.apiclient import base as common_base
 from manilaclient import exceptions
 from manilaclient.tests.unit import utils
 from manilaclient.tests.unit.v2 import fakes
+from manilaclient.v2 import share_networks
 from manilaclient.v2 import shares
 
 
 cs = fakes.FakeClient()
 
 
+@ddt.ddt
 class BaseTest(utils.TestCase):
 
     def test_resource_repr(self):
@@ -64,6 +69,214 @@ class BaseTest(utils.TestCase):
                           vegetable='carrot')
 
     def test_findall_with_all_tenants(self):
-        cs.shares.list = mock.Mock(return_value=[])
+        self.mock_object(cs.shares, 'list', mock.Mock(return_value=[]))
         cs.shares.findall()
-        cs.shares.list.assert_called_once_with(search_opts={'all_tenants': 1})
+        cs.shares.list.assert_called_once_with(
+            search_opts={'all_tenants': 1, 'offset': 0,
+                         'limit': base.DEFAULT_PAGE_SIZE},
+            detailed=True, sort_key=None, sort_dir=None)
+
+    def test_findall_server_side_filters(self):
+        share_network = share_networks.ShareNetwork(
+            None, {'id': 'fake_id', 'name': 'fake_name', 'mtu': 1500})
+        self.mock_object(cs.share_networks, 'list',
+                         mock.Mock(return_value=[share_network]))
+
+        result = cs.share_networks.findall(name='fake_name', mtu=1500)
+
+        self.assertEqual([share_network], result)
+        cs.share_networks.list.assert_called_once_with(
+            search_opts={'all_tenants': 1, 'name': 'fake_name'})
+
+    def test_findall_filters_on_client_side(self):
+        matching = share_networks.ShareNetwork(
+            None, {'id': 'id1', 'name': 'fake', 'mtu': 1500})
+        other = share_networks.ShareNetwork(
+            None, {'id': 'id2', 'name': 'fake', 'mtu': 9000})
+        self.mock_object(cs.share_networks, 'list',
+                         mock.Mock(return_value=[matching, other]))
+
+        self.assertEqual([matching],
+                         cs.share_networks.findall(name='fake', mtu=1500))
+
+    def test_list_updates_completion_cache(self):
+        api = mock.Mock()
+        api.client.get.return_value = (None, {'shares': [{'id': 'fake'}]})
+        manager = base.Manager(api)
+
+        result = manager._list('/shares', 'shares', obj_class=shares.Share)
+
+        api.completion_cache.update.assert_called_once_with(
+            'share', result, replace=True)
+
+    def test_create_updates_completion_cache(self):
+        api = mock.Mock()
+        api.client.post.return_value = (None, {'share': {'id': 'fake'}})
+        manager = shares.ShareManager(api)
+
+        result = manager._create('/shares', {}, 'share')
+
+        api.completion_cache.update.assert_called_once_with(
+            'share', [result], replace=False)
+
+    def test_list_without_completion_cache(self):
+        api = mock.Mock(completion_cache=None)
+        api.client.get.return_value = (None, {'shares': [{'id': 'fake'}]})
+        manager = base.Manager(api)
+
+        self.assertEqual(
+            1, len(manager._list('/shares', 'shares', obj_class=shares.Share)))
+
+    def test_deprecated_completion_cache(self):
+        api = mock.Mock()
+        manager = base.Manager(api)
+
+        with mock.patch('warnings.warn') as mock_warn:
+            with manager.completion_cache('uuid', shares.Share, mode='w'):
+                manager.write_to_completion_cache('uuid', 'fake_id')
+            manager.write_to_completion_cache('uuid', 'ignored_id')
+
+        api.completion_cache.add_values.assert_called_once_with(
+            'share', ['fake_id'])
+        self.assertEqual(3, mock_warn.call_count)
+        self.assertEqual(DeprecationWarning, mock_warn.call_args[0][1])
+
+    def test_list_compact(self):
+        api = mock.Mock()
+        api.client.get.return_value = (None, {'shares': [{'id': 'fake'}]})
+        manager = base.Manager(api)
+
+        result = manager._list('/shares', 'shares', obj_class=shares.Share,
+                               compact=True)
+
+        self.assertIsInstance(result[0], common_base.CompactResource)
+        self.assertIsInstance(result[0], shares.Share)
+        self.assertEqual('fake', result[0].id)
+        api.completion_cache.update.assert_called_once_with(
+            'share', result, replace=True)
+
+    def test_list_load_details(self):
+        api = mock.Mock()
+        api.client.get.return_value = (None, {'shares': [{'id': 'fake'}]})
+        manager = base.Manager(api)
+        load_details = mock.Mock(return_value=[
+            shares.Share(manager, {'id': 'fake', 'size': 1})])
+
+        result = manager._list('/shares', 'shares', obj_class=shares.Share,
+                               load_details=load_details)
+
+        self.assertFalse(result[0].is_loaded())
+        self.assertEqual(1, result[0].size)
+        load_details.assert_called_once_with()
+
+    def test_list_columnar(self):
+        api = mock.Mock()
+        api.client.get.return_value = (None, {
+            'shares': [{'id': 's1', 'size': 1}, {'id': 's2', 'size': 2}],
+            'count': 2})
+        manager = base.Manager(api)
+
+        table, count = manager._list('/shares', 'shares', columnar=True)
+
+        self.assertEqual({'id': ['s1', 's2'], 'size': [1, 2]}, table)
+        self.assertEqual(2, count)
+        self.assertFalse(api.completion_cache.update.called)
+
+    def test_list_stream_columnar(self):
+        api = mock.Mock()
+        resp = mock.Mock()
+        resp.iter_content.return_value = [
+            b'{"shares": [{"id": "s1"}, {"id": "s2", "size": 2}]}']
+        api.client.get.return_value = (resp, None)
+        manager = base.Manager(api)
+
+        table = manager._list('/shares', 'shares', stream=True,
+                              columnar=True)
+
+        self.assertEqual({'id': ['s1', 's2'], 'size': [None, 2]}, table)
+        resp.close.assert_called_once_with()
+
+    def test_list_stream(self):
+        api = mock.Mock()
+        resp = mock.Mock()
+        resp.iter_content.return_value = [
+            b'{"shares": [{"id": "s1"}, {"i', b'd": "s2"}]}']
+        api.client.get.return_value = (resp, None)
+        manager = base.Manager(api)
+
+        result = manager._list('/shares', 'shares', obj_class=shares.Share,
+                               stream=True)
+
+        api.client.get.assert_called_once_with('/shares', stream=True)
+        self.assertFalse(resp.iter_content.called)
+        self.assertEqual(['s1', 's2'], [share.id for share in result])
+        resp.iter_content.assert_called_once_with(
+            chunk_size=base.STREAM_CHUNK_SIZE)
+        resp.close.assert_called_once_with()
+        self.assertFalse(api.completion_cache.update.called)
+
+    @ddt.data(True, False)
+    def test_list_iter(self, prefetch):
+        manager = base.Manager(mock.Mock())
+        pages = [['s1', 's2'], ['s3', 's4'], ['s5']]
+        list_func = mock.Mock(side_effect=pages)
+
+        result = manager._list_iter(
+            list_func, search_opts={'name': 'fake', 'with_count': True},
+            page_size=2, prefetch=prefetch, detailed=False)
+
+        self.assertFalse(list_func.called)
+        self.assertEqual(['s1', 's2', 's3', 's4', 's5'], list(result))
+        list_func.assert_has_calls([
+            mock.call(search_opts={'name': 'fake', 'offset': offset,
+                                   'limit': 2},
+                      detailed=False)
+            for offset in (0, 2, 4)])
+        self.assertEqual(3, list_func.call_count)
+
+    def test_list_iter_offset_and_limit(self):
+        manager = base.Manager(mock.Mock())
+        list_func = mock.Mock(side_effect=[['s1', 's2'], ['s3']])
+
+        result = list(manager._list_iter(
+            list_func, search_opts={'offset': 10, 'limit': 3}, page_size=2))
+
+        self.assertEqual(['s1', 's2', 's3'], result)
+        list_func.assert_has_calls([
+            mock.call(search_opts={'offset': 10, 'limit': 2}),
+            mock.call(search_opts={'offset': 12, 'limit': 1}),
+        ])
+        self.assertEqual(2, list_func.call_count)
+
+    @ddt.data(True, False)
+    def test_list_iter_offset_ignored(self, prefetch):
+        manager = base.Manager(mock.Mock())
+        list_func = mock.Mock(return_value=['s1', 's2'])
+
+        result = list(manager._list_iter(list_func, page_size=2,
+                                         prefetch=prefetch))
+
+        # NOTE: The listing ends once the same page is returned again.
+        self.assertEqual(['s1', 's2'], result)
+        self.assertEqual(2, list_func.call_count)
+
+    @ddt.data((None, ['s1', 's2', 's3']), (2, ['s1', 's2']))
+    @ddt.unpack
+    def test_list_iter_limit_ignored(self, limit, expected):
+        manager = base.Manager(mock.Mock())
+        list_func = mock.Mock(return_value=['s1', 's2', 's3'])
+
+        result = list(manager._list_iter(
+            list_func, search_opts={'limit': limit}, page_size=2))
+
+        self.assertEqual(expected, result)
+        list_func.assert_called_once_with(
+            search_opts={'offset': 0, 'limit': 2})
+
+    def test_list_iter_empty(self):
+        manager = base.Manager(mock.Mock())
+        list_func = mock.Mock(return_value=[])
+
+        self.assertEqual([], list(manager._list_iter(list_func)))
+        list_func.assert_called_once_with(
+            search_opts={'offset': 0, 'limit': base.DEFAULT_PAGE_SIZE})
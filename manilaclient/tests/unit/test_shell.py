@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import os
 import re
 import sys
 from unittest import mock
@@ -21,6 +22,7 @@ from tempest.lib.cli import output_parser
 from testtools import matchers
 
 import manilaclient
+from manilaclient import api_versions
 from manilaclient.common import cliutils
 from manilaclient.common import constants
 from manilaclient import exceptions
@@ -134,8 +136,71 @@ class OpenstackManilaShellTest(utils.TestCase):
                 cert=env_vars['OS_CERT'],
                 input_auth_token='',
                 service_catalog_url='',
+                completion_cache=mock.ANY,
             )
 
+    def test_main_with_version_cache(self):
+        cache_dir = self.useFixture(fixtures.TempDir()).path
+        self.set_env_vars(dict(self.FAKE_ENV,
+                               MANILACLIENT_UUID_CACHE_DIR=cache_dir,
+                               MANILACLIENT_VERSION_CACHE_TTL='60'))
+        server_version_range = (api_versions.APIVersion('2.0'),
+                                manilaclient.API_MAX_VERSION)
+        self.mock_object(api_versions, 'get_server_version_range',
+                         mock.Mock(return_value=server_version_range))
+
+        with mock.patch.object(shell, 'client') as mock_client:
+            self.shell('list')
+            self.assertEqual(1, mock_client.Client.call_count)
+
+        # The cached version range is used, no client is needed to
+        # discover it.
+        with mock.patch.object(shell, 'client') as mock_client:
+            self.shell('list')
+            self.assertEqual(1, mock_client.Client.call_count)
+            args, kwargs = mock_client.Client.call_args
+            self.assertEqual((manilaclient.API_MAX_VERSION, ), args)
+            self.assertEqual(manilaclient.API_MAX_VERSION, kwargs['version'])
+            self.assertEqual(constants.V2_SERVICE_TYPE,
+                             kwargs['service_type'])
+        self.assertEqual(
+            1, api_versions.get_server_version_range.call_count)
+
+    def test_main_with_version_cache_of_another_endpoint(self):
+        cache_dir = self.useFixture(fixtures.TempDir()).path
+        self.set_env_vars(dict(self.FAKE_ENV,
+                               MANILACLIENT_UUID_CACHE_DIR=cache_dir,
+                               MANILACLIENT_VERSION_CACHE_TTL='60'))
+        server_version_range = (api_versions.APIVersion('2.0'),
+                                manilaclient.API_MAX_VERSION)
+        self.mock_object(api_versions, 'get_server_version_range',
+                         mock.Mock(return_value=server_version_range))
+
+        with mock.patch.object(shell, 'client') as mock_client:
+            mock_client.Client.return_value.client.endpoint_url = (
+                'http://foo.url/v2')
+            self.shell('list')
+
+        # The cache is replaced atomically, no temporary file is left.
+        self.assertEqual([shell.VERSION_CACHE_FILE], os.listdir(cache_dir))
+
+        # The endpoint changed, the version range is discovered again with
+        # the client built from the cache.
+        with mock.patch.object(shell, 'client') as mock_client:
+            mock_client.Client.return_value.client.endpoint_url = (
+                'http://bar.url/v2')
+            self.shell('list')
+            self.assertEqual(1, mock_client.Client.call_count)
+        self.assertEqual(
+            2, api_versions.get_server_version_range.call_count)
+
+        with mock.patch.object(shell, 'client') as mock_client:
+            mock_client.Client.return_value.client.endpoint_url = (
+                'http://bar.url/v2')
+            self.shell('list')
+        self.assertEqual(
+            2, api_versions.get_server_version_range.call_count)
+
     @ddt.data(
         {"env_vars": {"OS_MANILA_BYPASS_URL": "http://foo.url",
                       "OS_TOKEN": "foo_token"},
@@ -206,6 +271,7 @@ class OpenstackManilaShellTest(utils.TestCase):
                 cert="",
                 input_auth_token=expected["input_auth_token"],
                 service_catalog_url=expected["service_catalog_url"],
+                completion_cache=mock.ANY,
             )
 
     @ddt.data(
@@ -285,6 +351,7 @@ class OpenstackManilaShellTest(utils.TestCase):
                 cert="",
                 input_auth_token=expected["input_auth_token"],
                 service_catalog_url=expected["service_catalog_url"],
+                completion_cache=mock.ANY,
             )
 
     def test_help_unknown_command(self):
@@ -301,6 +368,48 @@ class OpenstackManilaShellTest(utils.TestCase):
             self.assertThat(help_text,
                             matchers.MatchesRegex(r, re.DOTALL | re.MULTILINE))
 
+    @ddt.data(
+        ('list', ['list']),
+        ('--debug list --name fake', ['list']),
+        ('help list', ['help', 'list']),
+        ('help', None),
+        ('--help', None),
+        ('bash-completion', None),
+        ('', None),
+    )
+    @ddt.unpack
+    def test_get_invoked_commands(self, cmd, expected):
+        _shell = shell.OpenStackManilaShell()
+        options, args = _shell.get_base_parser().parse_known_args(cmd.split())
+
+        self.assertEqual(expected, _shell._get_invoked_commands(options, args))
+
+    def test_get_subcommand_parser_only_builds_invoked_commands(self):
+        _shell = shell.OpenStackManilaShell()
+        _shell.extensions = []
+
+        _shell.get_subcommand_parser('2', commands=['help', 'list'])
+
+        self.assertEqual({'help', 'list', 'bash_completion'},
+                         set(_shell.subcommands))
+
+    def test_get_subcommand_parser_unknown_command(self):
+        _shell = shell.OpenStackManilaShell()
+        _shell.extensions = []
+
+        _shell.get_subcommand_parser('2', commands=['foofoo'])
+
+        self.assertIn('list', _shell.subcommands)
+        self.assertIn('delete', _shell.subcommands)
+
+    def test_help_lists_all_commands(self):
+        help_text = self.shell('help')
+
+        for command in ('list', 'create', 'delete', 'snapshot-list'):
+            self.assertThat(help_text,
+                            matchers.MatchesRegex(
+                                r'.*\n\s+%s\s' % command, re.DOTALL))
+
     def test_common_args_in_help_message(self):
         expected_args = (
             '--version', '', '--debug', '--os-cache', '--os-reset-cache',
@@ -460,3 +569,145 @@ class AllowOnlyOneAliasAtATimeActionTest(utils.TestCase):
     def test_quuz_error(self, options_str):
         self.assertRaises(
             matchers.MismatchError, self.shell, 'quuz %s' % options_str)
+
+
+@ddt.ddt
+class BatchTest(utils.TestCase):
+    FAKE_ENV = {
+        'OS_USERNAME': 'username',
+        'OS_PASSWORD': 'password',
+        'OS_TENANT_NAME': 'tenant_name',
+        'OS_AUTH_URL': 'http://no.where',
+    }
+
+    def setUp(self):
+        super(BatchTest, self).setUp()
+        for k, v in self.FAKE_ENV.items():
+            self.useFixture(fixtures.EnvironmentVariable(k, v))
+        self.mock_object(
+            shell.client, 'get_client_class',
+            mock.Mock(return_value=fakes.FakeClient))
+        self.shell = shell.OpenStackManilaShell()
+        self.shell._discover_client = mock.Mock(
+            side_effect=lambda current_client, *args: (
+                current_client, manilaclient.API_MAX_VERSION))
+        self.stdout = self.useFixture(
+            fixtures.MonkeyPatch('sys.stdout', moves.StringIO())).new_value
+        self.stderr = self.useFixture(
+            fixtures.MonkeyPatch('sys.stderr', moves.StringIO())).new_value
+
+    def _write_batch(self, lines):
+        path = self.useFixture(fixtures.TempDir()).join('batch')
+        with open(path, 'w') as batch_file:
+            batch_file.write('\n'.join(lines))
+        return path
+
+    def _get_calls(self):
+        return [call[0:2] for call in self.shell.cs.client.callstack]
+
+    def test_batch(self):
+        path = self._write_batch([
+            '# Comment',
+            'availability-zone-list',
+            '',
+            'show 1234  # trailing comment',
+            'quota-show --tenant 1234 --share-type foo',
+            'quota-show --tenant 1234 --share_type "bar"',
+        ])
+
+        self.assertEqual(0, self.shell.main(['batch', path]))
+
+        self.shell._discover_client.assert_called_once_with(
+            mock.ANY, mock.ANY, mock.ANY, mock.ANY, mock.ANY)
+        self.assertEqual(
+            [('GET', '/availability-zones'),
+             ('GET', '/shares/1234'),
+             ('GET', '/shares/1234/export_locations'),
+             ('GET', '/quota-sets/1234?share_type=foo'),
+             ('GET', '/quota-sets/1234?share_type=bar')],
+            self._get_calls())
+        self.assertEqual('', self.stderr.getvalue())
+
+    def test_batch_stdin(self):
+        stdin_path = self._write_batch(['availability-zone-list'])
+        with open(stdin_path) as stdin:
+            self.useFixture(fixtures.MonkeyPatch('sys.stdin', stdin))
+
+            self.assertEqual(0, self.shell.main(['batch']))
+
+        self.assertEqual([('GET', '/availability-zones')], self._get_calls())
+
+    @ddt.data(
+        (False, [('GET', '/availability-zones'), ('GET', '/types')]),
+        (True, [('GET', '/availability-zones')]),
+    )
+    @ddt.unpack
+    def test_batch_failures(self, stop_on_error, expected_calls):
+        path = self._write_batch([
+            'availability-zone-list',
+            'unknown-command',
+            'batch other',
+            'type-list',
+        ])
+        argv = ['batch', path]
+        if stop_on_error:
+            argv.append('--stop-on-error')
+
+        self.assertRaises(exceptions.CommandError, self.shell.main, argv)
+
+        self.assertEqual(expected_calls, self._get_calls())
+        self.assertIn(
+            "ERROR (line 2): 'unknown-command' is not a valid subcommand",
+            self.stderr.getvalue())
+        self.assertEqual(
+            not stop_on_error,
+            'ERROR (line 3): ' in self.stderr.getvalue())
+
+    @ddt.data(
+        ('list --os-share-api-version 2.5',
+         'Global option --os-share-api-version is not allowed in a batch, '
+         'pass it to the batch command.'),
+        ('list --debug',
+         'Global option --debug is not allowed in a batch, pass it to the '
+         'batch command.'),
+        ('--format=json list',
+         'Global option --format is not allowed in a batch, pass it to the '
+         'batch command.'),
+        ('show',
+         'the following arguments are required: <share>'),
+        ('list --unknown-option',
+         'unrecognized arguments: --unknown-option'),
+    )
+    @ddt.unpack
+    def test_batch_invalid_line(self, line, error):
+        path = self._write_batch(['availability-zone-list', line])
+
+        self.assertRaises(exceptions.CommandError,
+                          self.shell.main, ['batch', path])
+
+        self.assertEqual([('GET', '/availability-zones')], self._get_calls())
+        self.assertEqual('ERROR (line 2): %s' % error,
+                         self.stderr.getvalue().splitlines()[0])
+
+    def test_batch_output_format(self):
+        path = self._write_batch([
+            'availability-zone-list --columns id',
+            'availability-zone-list --columns id --format value',
+            'availability-zone-list --columns id',
+        ])
+
+        self.assertEqual(
+            0, self.shell.main(['--format', 'csv', 'batch', path]))
+
+        # NOTE: The format of a subcommand only applies to its own line.
+        zone_ids = ['368c5780-ad72-4bcf-a8b6-19e45f4fafoo',
+                    '368c5780-ad72-4bcf-a8b6-19e45f4fabar']
+        self.assertEqual(['Id'] + zone_ids + zone_ids + ['Id'] + zone_ids,
+                         self.stdout.getvalue().splitlines())
+
+    def test_batch_missing_file(self):
+        path = self.useFixture(fixtures.TempDir()).join('missing')
+
+        self.assertRaises(exceptions.CommandError,
+                          self.shell.main, ['batch', path])
+        self.assertFalse(self.shell._discover_client.called)
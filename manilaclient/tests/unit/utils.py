@@ -76,3 +76,9 @@ class TestResponse(requests.Response):
     @property
     def text(self):
         return self._text
+
+    @property
+    def content(self):
+        if self._text is None:
+            return None
+        return self._text.encode('utf-8')
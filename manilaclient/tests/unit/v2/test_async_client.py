@@ -0,0 +1,255 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+from unittest import mock
+
+from oslo_serialization import jsonutils
+
+from manilaclient import api_versions
+from manilaclient.common import constants
+from manilaclient import exceptions
+from manilaclient.tests.unit import fakes
+from manilaclient.tests.unit import utils
+from manilaclient.v2 import async_client
+from manilaclient.v2 import share_snapshots
+from manilaclient.v2 import shares
+
+ENDPOINT = 'http://example.com/v2'
+
+
+def _response(body=None, status=200):
+    text = jsonutils.dumps(body) if body is not None else ''
+    return fakes.FakeAsyncResponse(status=status, text=text)
+
+
+class AsyncClientTest(utils.TestCase):
+
+    def _get_client(self, responses, version='2.57'):
+        self.session = fakes.FakeAsyncSession(responses)
+        return async_client.AsyncClient(
+            api_version=api_versions.APIVersion(version),
+            input_auth_token='token', service_catalog_url=ENDPOINT,
+            http_session=self.session)
+
+    def _assert_called(self, method, path, body=None, pos=-1):
+        call = self.session.calls[pos]
+        self.assertEqual((method, ENDPOINT + path), call[:2])
+        if body is not None:
+            self.assertEqual(body, jsonutils.loads(call[3]))
+
+    def test_list(self):
+        client = self._get_client([_response(
+            {'shares': [{'id': '1234', 'name': 'foo'}]})])
+
+        result = asyncio.run(client.shares.list(search_opts={'name': 'foo'}))
+
+        self.assertEqual(1, len(result))
+        self.assertIsInstance(result[0], shares.Share)
+        self.assertEqual('foo', result[0].name)
+        self.assertTrue(result[0].is_loaded())
+        self._assert_called('GET', '/shares/detail?is_public=True&name=foo')
+
+    def test_list_stream_rejected(self):
+        client = self._get_client([])
+
+        self.assertRaises(ValueError, client.shares.list, stream=True)
+        self.assertRaises(ValueError, client.share_snapshots.list,
+                          stream=True)
+        self.assertEqual([], self.session.calls)
+
+    def test_get(self):
+        client = self._get_client([_response(
+            {'snapshot': {'id': '1234', 'status': 'available'}})])
+
+        snapshot = asyncio.run(client.share_snapshots.get('1234'))
+
+        self.assertIsInstance(snapshot, share_snapshots.ShareSnapshot)
+        self.assertEqual('available', snapshot.status)
+        self._assert_called('GET', '/snapshots/1234')
+
+    def test_create(self):
+        client = self._get_client([_response(
+            {'share_network': {'id': '1234', 'name': 'net'}})])
+
+        share_network = asyncio.run(client.share_networks.create(name='net'))
+
+        self.assertEqual('1234', share_network.id)
+        self.assertTrue(share_network.is_loaded())
+        self._assert_called('POST', '/share-networks',
+                            {'share_network': {'name': 'net'}})
+
+    def test_update(self):
+        client = self._get_client([_response(
+            {'share': {'id': '1234', 'display_name': 'bar'}})])
+
+        share = asyncio.run(client.shares.update('1234', display_name='bar'))
+
+        self.assertIsInstance(share, shares.Share)
+        self._assert_called('PUT', '/shares/1234',
+                            {'share': {'display_name': 'bar'}})
+
+    def test_update_without_changes(self):
+        client = self._get_client([])
+
+        self.assertIsNone(asyncio.run(client.shares.update('1234')))
+        self.assertEqual([], self.session.calls)
+
+    def test_delete(self):
+        client = self._get_client([_response(status=202)])
+
+        self.assertIsNone(asyncio.run(client.shares.delete('1234')))
+
+        self._assert_called('DELETE', '/shares/1234')
+
+    def test_versioned_action(self):
+        client = self._get_client([_response(
+            {'access': {'id': 'a1', 'access_to': '10.0.0.1'}})])
+
+        access = asyncio.run(
+            client.shares.allow('1234', 'ip', '10.0.0.1', 'rw'))
+
+        self.assertEqual('a1', access['id'])
+        self._assert_called(
+            'POST', '/shares/1234/action',
+            {'allow_access': {'access_type': 'ip', 'access_to': '10.0.0.1',
+                              'access_level': 'rw'}})
+
+    def test_unsupported_version(self):
+        client = self._get_client([], version='2.44')
+
+        self.assertRaises(exceptions.UnsupportedVersion,
+                          client.share_access_rules.unset_metadata,
+                          'a1', ['foo'])
+
+    def test_experimental_delete(self):
+        client = self._get_client([_response(status=202)], version='2.11')
+
+        asyncio.run(client.share_replicas.delete('1234'))
+
+        self._assert_called('DELETE', '/share-replicas/1234')
+        headers = self.session.calls[-1][2]
+        self.assertEqual('true', headers[constants.EXPERIMENTAL_HTTP_HEADER])
+
+    def test_delete_metadata(self):
+        client = self._get_client([_response(), _response()])
+
+        asyncio.run(client.shares.delete_metadata('1234', ['a', 'b']))
+
+        self._assert_called('DELETE', '/shares/1234/metadata/a', pos=0)
+        self._assert_called('DELETE', '/shares/1234/metadata/b', pos=1)
+
+    def test_list_iter(self):
+        client = self._get_client([
+            _response({'messages': [{'id': '1'}, {'id': '2'}]}),
+            _response({'messages': [{'id': '3'}]}),
+        ])
+
+        async def _list():
+            return [message.id async for message in
+                    client.messages.list_iter(page_size=2, prefetch=True)]
+
+        self.assertEqual(['1', '2', '3'], asyncio.run(_list()))
+        self._assert_called('GET', '/messages?limit=2', pos=0)
+        self._assert_called('GET', '/messages?limit=2&offset=2', pos=1)
+
+    def test_list_iter_offset_ignored(self):
+        client = self._get_client([
+            _response({'messages': [{'id': '1'}, {'id': '2'}]}),
+            _response({'messages': [{'id': '1'}, {'id': '2'}]}),
+        ])
+
+        async def _list():
+            return [message.id async for message in
+                    client.messages.list_iter(page_size=2)]
+
+        self.assertEqual(['1', '2'], asyncio.run(_list()))
+        self.assertEqual(2, len(self.session.calls))
+
+    def test_export_locations_list_bulk(self):
+        client = self._get_client([
+            _response({'export_locations': [{'id': 'el1'}]}),
+            _response({'export_locations': [{'id': 'el2'}]}),
+        ])
+        manager = client.share_export_locations
+
+        async def _list_bulk():
+            first = await manager.list_bulk(['s1', 's2', 's1'], max_workers=1)
+            cached = await manager.list_bulk(['s2'], use_cache=True)
+            return first, cached
+
+        first, cached = asyncio.run(_list_bulk())
+
+        self.assertEqual({'s1': ['el1'], 's2': ['el2']},
+                         dict((share_id, [el.id for el in export_locations])
+                              for share_id, export_locations in first.items()))
+        self.assertIs(first['s2'], cached['s2'])
+        self.assertEqual(2, len(self.session.calls))
+        self._assert_called('GET', '/shares/s1/export_locations', pos=0)
+        self._assert_called('GET', '/shares/s2/export_locations', pos=1)
+
+    def test_export_locations_list_bulk_error(self):
+        client = self._get_client([
+            _response({'export_locations': []}),
+            _response({'itemNotFound': {'message': 'not found'}}, status=404),
+        ])
+
+        self.assertRaises(
+            exceptions.NotFound, asyncio.run,
+            client.share_export_locations.list_bulk(['s1', 's2']))
+        # NOTE: Nothing is cached when a request failed.
+        self.assertEqual({}, dict(client.share_export_locations._cache))
+
+    def test_find(self):
+        client = self._get_client([_response(
+            {'shares': [{'id': '1', 'name': 'foo'},
+                        {'id': '2', 'name': 'foobar'}]})])
+
+        share = asyncio.run(client.shares.find(name='foo'))
+
+        self.assertEqual('1', share.id)
+
+    def test_close(self):
+        client = self._get_client([])
+
+        async def _use_client():
+            async with client:
+                pass
+
+        asyncio.run(_use_client())
+
+        self.assertTrue(self.session.closed)
+
+    def test_session_auth(self):
+        session = mock.Mock()
+        session.get_token.return_value = 'token'
+        session.get_endpoint.return_value = ENDPOINT
+
+        client = async_client.AsyncClient(
+            session=session, region_name='region',
+            http_session=fakes.FakeAsyncSession())
+
+        self.assertEqual('token',
+                         client.client.default_headers['X-Auth-Token'])
+        self.assertEqual(ENDPOINT, client.client.endpoint_url)
+        session.get_endpoint.assert_called_once_with(
+            None, interface='publicURL',
+            service_type=constants.V2_SERVICE_TYPE, service_name=None,
+            region_name='region')
+
+    def test_token_without_endpoint(self):
+        self.assertRaises(exceptions.ClientException,
+                          async_client.AsyncClient, input_auth_token='token')
+
+    def test_no_credentials(self):
+        self.assertRaises(exceptions.ClientException,
+                          async_client.AsyncClient)
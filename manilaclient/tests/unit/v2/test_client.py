@@ -10,15 +10,19 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import threading
+import time
 from unittest import mock
 
 import ddt
 from oslo_utils import uuidutils
 
 import manilaclient
+from manilaclient.common import httpclient
 from manilaclient import exceptions
 from manilaclient.tests.unit import utils
 from manilaclient.v2 import client
+from manilaclient.v2 import shares as shares_module
 
 
 @ddt.ddt
@@ -45,6 +49,20 @@ class ClientTest(utils.TestCase):
         self.assertEqual(base_url, c.client.endpoint_url)
         self.assertEqual(retries, c.client.retries)
 
+    def test_session_transport(self):
+        s = client.session.Session()
+        base_url = uuidutils.generate_uuid(dashed=False)
+        self.mock_object(s, 'get_token')
+
+        c = client.Client(session=s, service_catalog_url=base_url,
+                          api_version=manilaclient.API_MAX_VERSION,
+                          session_transport=True)
+
+        self.assertIsInstance(c.client, httpclient.SessionClient)
+        self.assertIs(s, c.client.adapter.session)
+        self.assertEqual(base_url, c.client.endpoint_url)
+        self.assertFalse(s.get_token.called)
+
     def test_auth_via_token_invalid(self):
         self.assertRaises(exceptions.ClientException, client.Client,
                           api_version=manilaclient.API_MAX_VERSION,
@@ -71,6 +89,57 @@ class ClientTest(utils.TestCase):
         self.assertIsNotNone(c.client)
         self.assertIsNone(c.keystone_client)
 
+    def test_managers_created_lazily(self):
+        c = client.Client(input_auth_token='token',
+                          service_catalog_url='http://1.2.3.4',
+                          api_version=manilaclient.API_MAX_VERSION)
+
+        self.assertNotIn('shares', vars(c))
+        shares = c.shares
+        self.assertIsInstance(shares, shares_module.ShareManager)
+        self.assertIs(c, shares.api)
+        self.assertIs(shares, c.shares)
+        self.assertIn('shares', vars(c))
+
+    def test_managers_created_once_by_concurrent_threads(self):
+        c = client.Client(input_auth_token='token',
+                          service_catalog_url='http://1.2.3.4',
+                          api_version=manilaclient.API_MAX_VERSION)
+        share_manager_class = shares_module.ShareManager
+
+        def _create_manager(api):
+            time.sleep(0.01)
+            return share_manager_class(api)
+
+        managers = []
+        with mock.patch.object(shares_module, 'ShareManager',
+                               side_effect=_create_manager) as mock_class:
+            threads = [threading.Thread(target=lambda: managers.append(
+                c.shares)) for i in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(1, mock_class.call_count)
+        self.assertEqual(5, len(managers))
+        self.assertTrue(all(manager is c.shares for manager in managers))
+
+    @ddt.data(*sorted(client.MANAGERS))
+    def test_manager_classes(self, name):
+        c = client.Client(input_auth_token='token',
+                          service_catalog_url='http://1.2.3.4',
+                          api_version=manilaclient.API_MAX_VERSION)
+
+        self.assertIs(c, getattr(c, name).api)
+
+    def test_unknown_attribute(self):
+        c = client.Client(input_auth_token='token',
+                          service_catalog_url='http://1.2.3.4',
+                          api_version=manilaclient.API_MAX_VERSION)
+
+        self.assertRaises(AttributeError, getattr, c, 'fake_manager')
+
     @mock.patch.object(client.Client, '_get_keystone_client', mock.Mock())
     def test_valid_region_name_v1(self):
         self.mock_object(client.httpclient, 'HTTPClient')
@@ -91,7 +160,14 @@ class ClientTest(utils.TestCase):
             timeout=None,
             retries=None,
             http_log_debug=False,
-            api_version=manilaclient.API_DEPRECATED_VERSION)
+            api_version=manilaclient.API_DEPRECATED_VERSION,
+            pool_connections=None,
+            pool_maxsize=None,
+            pool_block=False,
+            keep_alive=True,
+            response_cache=None,
+            coalesce_requests=False,
+            retry_policy=None)
         self.assertIsNotNone(c.client)
 
     @mock.patch.object(client.Client, '_get_keystone_client', mock.Mock())
@@ -132,7 +208,14 @@ class ClientTest(utils.TestCase):
             timeout=None,
             retries=None,
             http_log_debug=False,
-            api_version=manilaclient.API_MIN_VERSION)
+            api_version=manilaclient.API_MIN_VERSION,
+            pool_connections=None,
+            pool_maxsize=None,
+            pool_block=False,
+            keep_alive=True,
+            response_cache=None,
+            coalesce_requests=False,
+            retry_policy=None)
         self.assertIsNotNone(c.client)
 
     def _get_client_args(self, **kwargs):
@@ -210,7 +293,11 @@ class ClientTest(utils.TestCase):
         client.httpclient.HTTPClient.assert_called_with(
             'http://3.3.3.3', mock.ANY, 'python-manilaclient', insecure=False,
             cacert=None, timeout=None, retries=None, http_log_debug=False,
-            api_version=manilaclient.API_MIN_VERSION)
+            api_version=manilaclient.API_MIN_VERSION, pool_connections=None,
+            pool_maxsize=None, pool_block=False, keep_alive=True,
+            response_cache=None,
+            coalesce_requests=False,
+            retry_policy=None)
 
         client.ks_client.Client.assert_called_with(
             session=mock.ANY, version=(3, 0), auth_url='url_v3.0',
@@ -225,6 +312,7 @@ class ClientTest(utils.TestCase):
             project_domain_name=client_args['project_domain_name'],
             project_domain_id=client_args['project_domain_id'],
             region_name=client_args['region_name'],
+            use_keyring=False, force_new_token=False, stale_duration=300,
         )
         mocked_ks_client.service_catalog.get_endpoints.assert_called_with(
             client_args['service_type'])
@@ -265,7 +353,11 @@ class ClientTest(utils.TestCase):
         client.httpclient.HTTPClient.assert_called_with(
             'http://3.3.3.3', mock.ANY, 'python-manilaclient', insecure=False,
             cacert=None, timeout=None, retries=None, http_log_debug=False,
-            api_version=manilaclient.API_MIN_VERSION)
+            api_version=manilaclient.API_MIN_VERSION, pool_connections=None,
+            pool_maxsize=None, pool_block=False, keep_alive=True,
+            response_cache=None,
+            coalesce_requests=False,
+            retry_policy=None)
         client.ks_client.Client.assert_called_with(
             session=mock.ANY, version=(2, 0), auth_url='url_v2.0',
             username=client_args['username'],
@@ -279,6 +371,49 @@ class ClientTest(utils.TestCase):
             client_args['service_type'])
         mocked_ks_client.authenticate.assert_called_with()
 
+    @ddt.data(True, False)
+    def test_client_init_no_session_auth_cache(self, force_new_token):
+        self.mock_object(client.httpclient, 'HTTPClient')
+        self.mock_object(client.ks_client, 'Client')
+        self.mock_object(client.session.discover, 'Discover')
+        self.mock_object(client.session, 'Session')
+        client.session.discover.Discover.return_value.url_for.side_effect = (
+            lambda v: 'url_v3.0' if v == 'v3.0' else None)
+        mocked_ks_client = client.ks_client.Client.return_value
+        mocked_ks_client.service_catalog.get_endpoints.return_value = {
+            'sharev2': [{'region': 'SecondRegion', 'interface': 'public',
+                         'url': 'http://3.3.3.3'}]}
+        cache = mock.Mock()
+        cache.get_discovery.return_value = None
+        cache.get_auth_ref.return_value = None
+        client_args = self._get_client_args(
+            password='foo', auth_cache=cache, force_new_token=force_new_token,
+            api_version=manilaclient.API_MIN_VERSION)
+
+        client.Client(**client_args)
+
+        cache.set_discovery.assert_called_once_with(
+            'both', {'v2.0': None, 'v3.0': 'url_v3.0'})
+        mocked_ks_client.authenticate.assert_called_once_with()
+        cache.set_auth_ref.assert_called_once_with(
+            cache.get_token_key.return_value, mocked_ks_client.auth_ref)
+
+        # NOTE: A second client finds everything in the cache.
+        cache.get_discovery.return_value = {'v2.0': None,
+                                            'v3.0': 'url_v3.0'}
+        cache.get_auth_ref.return_value = mock.sentinel.auth_ref
+
+        client.Client(**client_args)
+
+        self.assertEqual(1, client.session.discover.Discover.call_count)
+        self.assertEqual(2 if force_new_token else 1,
+                         mocked_ks_client.authenticate.call_count)
+        if not force_new_token:
+            self.assertEqual(mock.sentinel.auth_ref,
+                             mocked_ks_client.auth_ref)
+            mocked_ks_client.process_token.assert_called_once_with(
+                region_name='SecondRegion')
+
     @mock.patch.object(client.ks_client, 'Client', mock.Mock())
     @mock.patch.object(client.session.discover, 'Discover', mock.Mock())
     @mock.patch.object(client.session, 'Session', mock.Mock())
@@ -76,6 +76,24 @@ class MessageManagerTest(utils.TestCase):
             messages.RESOURCES_PATH,
             messages.RESOURCES_NAME)
 
+    def test_list_iter(self):
+        fake_messages = [fake.Message() for i in range(3)]
+        for i, fake_message in enumerate(fake_messages):
+            fake_message.id = 'fake message id %d' % i
+        mock_list = self.mock_object(
+            self.manager, '_list',
+            mock.Mock(side_effect=[fake_messages[:2], fake_messages[2:]]))
+
+        result = self.manager.list_iter(page_size=2)
+
+        self.assertEqual(fake_messages, list(result))
+        mock_list.assert_has_calls([
+            mock.call(messages.RESOURCES_PATH + '?limit=2',
+                      messages.RESOURCES_NAME),
+            mock.call(messages.RESOURCES_PATH + '?limit=2&offset=2',
+                      messages.RESOURCES_NAME),
+        ])
+
     @ddt.data(
         ({'action_id': 1, 'resource_type': 'share'},
          '?action_id=1&resource_type=share'),
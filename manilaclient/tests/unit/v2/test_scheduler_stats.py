@@ -48,14 +48,14 @@ class PoolManagerTest(utils.TestCase):
         self.manager.list(detailed=False)
         self.manager._list.assert_called_once_with(
             scheduler_stats.RESOURCES_PATH,
-            scheduler_stats.RESOURCES_NAME)
+            scheduler_stats.RESOURCES_NAME, compact=False, columnar=False)
 
     @mock.patch.object(scheduler_stats.PoolManager, '_list', mock.Mock())
     def test_list_detail(self):
         self.manager.list()
         self.manager._list.assert_called_once_with(
             scheduler_stats.RESOURCES_PATH + '/detail',
-            scheduler_stats.RESOURCES_NAME)
+            scheduler_stats.RESOURCES_NAME, compact=False, columnar=False)
 
     @mock.patch.object(scheduler_stats.PoolManager, '_list', mock.Mock())
     def test_list_with_one_search_opt(self):
@@ -66,7 +66,7 @@ class PoolManagerTest(utils.TestCase):
 
         self.manager._list.assert_called_once_with(
             scheduler_stats.RESOURCES_PATH + query_string,
-            scheduler_stats.RESOURCES_NAME)
+            scheduler_stats.RESOURCES_NAME, compact=False, columnar=False)
 
     @mock.patch.object(scheduler_stats.PoolManager, '_list', mock.Mock())
     def test_list_detail_with_two_search_opts(self):
@@ -78,4 +78,18 @@ class PoolManagerTest(utils.TestCase):
 
         self.manager._list.assert_called_once_with(
             scheduler_stats.RESOURCES_PATH + '/detail' + query_string,
-            scheduler_stats.RESOURCES_NAME)
+            scheduler_stats.RESOURCES_NAME, compact=False, columnar=False)
+
+    @mock.patch.object(scheduler_stats.PoolManager, '_list', mock.Mock())
+    def test_list_compact(self):
+        self.manager.list(compact=True)
+        self.manager._list.assert_called_once_with(
+            scheduler_stats.RESOURCES_PATH + '/detail',
+            scheduler_stats.RESOURCES_NAME, compact=True, columnar=False)
+
+    def test_list_columnar(self):
+        pools = self.manager.list(columnar=True)
+
+        self.assertEqual(['pool1', 'pool2'], pools['pool'])
+        self.assertEqual([True, False], pools['capabilities.qos'])
+        self.assertNotIn('capabilities', pools)
@@ -18,6 +18,7 @@ from unittest import mock
 import ddt
 
 from manilaclient import api_versions
+from manilaclient import exceptions
 from manilaclient import extension
 from manilaclient.tests.unit import utils
 from manilaclient.tests.unit.v2 import fakes
@@ -56,3 +57,72 @@ class ShareExportLocationsTest(utils.TestCase):
             ('/shares/%(share_id)s/export_locations/'
              '%(el_uuid)s') % {
                  'share_id': share_id, 'el_uuid': el_uuid})
+
+    def test_list_bulk(self):
+        manager = self._get_manager('2.9')
+        export_location = share_export_locations.ShareExportLocation(
+            manager, {'id': 'fake_el_uuid', 'path': '/fake_path'})
+        self.mock_object(manager, '_list',
+                         mock.Mock(return_value=[export_location]))
+
+        result = manager.list_bulk(['1234', '5678', '1234'], max_workers=2)
+
+        self.assertEqual({'1234': [export_location],
+                          '5678': [export_location]}, result)
+        manager._list.assert_has_calls([
+            mock.call('/shares/1234/export_locations', 'export_locations'),
+            mock.call('/shares/5678/export_locations', 'export_locations'),
+        ], any_order=True)
+        self.assertEqual(2, manager._list.call_count)
+
+    @ddt.data(True, False)
+    def test_list_bulk_cache(self, use_cache):
+        manager = self._get_manager('2.9')
+        self.mock_object(manager, '_list', mock.Mock(return_value=[]))
+
+        manager.list_bulk(['1234'])
+        manager.list_bulk(['1234'], use_cache=use_cache)
+
+        self.assertEqual(1 if use_cache else 2, manager._list.call_count)
+
+    def test_list_bulk_cache_expired(self):
+        manager = self._get_manager('2.9')
+        self.mock_object(manager, '_list', mock.Mock(return_value=[]))
+        self.mock_object(share_export_locations.time, 'time',
+                         mock.Mock(side_effect=[0, 0, 61, 61]))
+
+        manager.list_bulk(['1234'], use_cache=True)
+        manager.list_bulk(['1234'], use_cache=True)
+
+        self.assertEqual(2, manager._list.call_count)
+
+    def test_list_bulk_cache_bounded(self):
+        manager = self._get_manager('2.9')
+        manager.cache_max_entries = 2
+        self.mock_object(manager, '_list', mock.Mock(return_value=[]))
+
+        manager.list_bulk(['1', '2'])
+        manager.list_bulk(['1'], use_cache=True)
+        manager.list_bulk(['3'])
+
+        self.assertEqual(['1', '3'], list(manager._cache))
+
+    def test_list_bulk_clear_cache(self):
+        manager = self._get_manager('2.9')
+        self.mock_object(manager, '_list', mock.Mock(return_value=[]))
+
+        manager.list_bulk(['1234', '5678'])
+        manager.clear_cache('1234')
+        manager.list_bulk(['1234', '5678'], use_cache=True)
+
+        self.assertEqual(3, manager._list.call_count)
+        manager._list.assert_called_with('/shares/1234/export_locations',
+                                         'export_locations')
+
+    def test_list_bulk_error(self):
+        manager = self._get_manager('2.9')
+        self.mock_object(manager, '_list', mock.Mock(
+            side_effect=exceptions.NotFound(404)))
+
+        self.assertRaises(exceptions.NotFound, manager.list_bulk, ['1234'])
+        self.assertEqual({}, manager._cache)
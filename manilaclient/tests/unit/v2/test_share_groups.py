@@ -198,6 +198,23 @@ class ShareGroupManagerTest(utils.TestCase):
             share_groups.RESOURCES_PATH + '/detail',
             share_groups.RESOURCES_NAME)
 
+    def test_list_iter(self):
+        fake_share_group = fake.ShareGroup()
+        mock_list = self.mock_object(
+            self.manager, '_list',
+            mock.Mock(side_effect=[[fake_share_group] * 2, []]))
+
+        result = self.manager.list_iter(page_size=2, prefetch=True)
+
+        self.assertEqual([fake_share_group] * 2, list(result))
+        mock_list.assert_has_calls([
+            mock.call(share_groups.RESOURCES_PATH + '/detail?limit=2',
+                      share_groups.RESOURCES_NAME),
+            mock.call(share_groups.RESOURCES_PATH +
+                      '/detail?limit=2&offset=2',
+                      share_groups.RESOURCES_NAME),
+        ])
+
     def test_list_no_detail(self):
         fake_share_group = fake.ShareGroup()
         mock_list = self.mock_object(
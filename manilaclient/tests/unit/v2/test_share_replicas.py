@@ -102,6 +102,25 @@ class ShareReplicasTest(utils.TestCase):
                 (share_replicas.RESOURCES_PATH + '/detail' + share_uri),
                 share_replicas.RESOURCES_NAME)
 
+    def test_list_with_search_opts(self):
+        with mock.patch.object(self.manager, '_list', mock.Mock()):
+            self.manager.list('share_id', search_opts={'limit': 5})
+            self.manager._list.assert_called_once_with(
+                (share_replicas.RESOURCES_PATH +
+                 '/detail?limit=5&share_id=share_id'),
+                share_replicas.RESOURCES_NAME)
+
+    def test_list_iter(self):
+        with mock.patch.object(self.manager, '_list',
+                               mock.Mock(return_value=[FAKE_REPLICA])):
+            result = list(self.manager.list_iter('share_id', page_size=2))
+
+            self.assertEqual([FAKE_REPLICA], result)
+            self.manager._list.assert_called_once_with(
+                (share_replicas.RESOURCES_PATH +
+                 '/detail?limit=2&share_id=share_id'),
+                share_replicas.RESOURCES_NAME)
+
     def test_resync(self):
         with mock.patch.object(self.manager, '_action', mock.Mock()):
             self.manager.resync(FAKE_REPLICA)
@@ -140,6 +140,14 @@ class ShareSnapshotsTest(utils.TestCase):
         cs.share_snapshots.list(detailed=True)
         cs.assert_called('GET', '/snapshots/detail')
 
+    def test_list_share_snapshots_iter(self):
+        snapshots = list(cs.share_snapshots.list_iter(
+            detailed=True, sort_key='status', page_size=2))
+
+        self.assertEqual(1, len(snapshots))
+        cs.assert_called(
+            'GET', '/snapshots/detail?limit=2&sort_key=status')
+
     def test_manage_snapshot(self):
         share_id = "1234"
         provider_location = "fake_location"
@@ -338,6 +338,45 @@ class SharesTest(utils.TestCase):
         self.assertEqual(2, count)
         self.assertEqual(1, len(shares))
 
+    def test_list_shares_stream(self):
+        manager = shares.ShareManager(fakes.FakeClient())
+        self.mock_object(manager, '_list')
+
+        result = manager.list(detailed=True, stream=True)
+
+        self.assertEqual(manager._list.return_value, result)
+        manager._list.assert_called_once_with(
+            '/shares/detail?is_public=True', 'shares', stream=True,
+            compact=False, columnar=False, load_details=None)
+
+    def test_list_shares_summary_loaded(self):
+        shares_list = cs.shares.list(detailed=False)
+        cs.assert_called('GET', '/shares?is_public=True')
+
+        self.assertTrue(shares_list[0].is_loaded())
+        self.assertIsNone(getattr(shares_list[0], 'size', None))
+        cs.assert_called('GET', '/shares?is_public=True')
+
+    def test_list_shares_summary_batch_lazy_load(self):
+        shares_list = cs.shares.list(detailed=False, lazy_details=True)
+        cs.assert_called('GET', '/shares?is_public=True')
+
+        self.assertIsNone(getattr(shares_list[0], '__deepcopy__', None))
+        cs.assert_called('GET', '/shares?is_public=True')
+
+        self.assertFalse(shares_list[0].is_loaded())
+        self.assertEqual(1, shares_list[0].size)
+        cs.assert_called('GET', '/shares/detail?is_public=True')
+        self.assertTrue(all(share.is_loaded() for share in shares_list))
+
+    def test_list_shares_iter(self):
+        shares = list(cs.shares.list_iter(
+            detailed=True, search_opts={'with_count': 'True'}, page_size=2))
+
+        self.assertEqual(1, len(shares))
+        cs.assert_called(
+            'GET', '/shares/detail?is_public=True&limit=2')
+
     def test_list_shares_detailed_with_count(self):
         cs.shares.list(detailed=True)
         cs.assert_called('GET', '/shares/detail?is_public=True')
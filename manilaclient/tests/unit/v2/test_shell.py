@@ -16,6 +16,7 @@
 #    under the License.
 
 import itertools
+import json
 from unittest import mock
 
 import ddt
@@ -53,6 +54,7 @@ class ShellTest(test_utils.TestCase):
         'MANILA_PASSWORD': 'password',
         'MANILA_PROJECT_ID': 'project_id',
         'MANILA_URL': 'http://no.where',
+        'MANILACLIENT_BULK_CONCURRENCY': '1',
     }
 
     # Patch os.environ to avoid required auth info.
@@ -124,7 +126,7 @@ class ShellTest(test_utils.TestCase):
         self.run_command('availability-zone-list --columns id,name')
         self.assert_called('GET', '/availability-zones')
         cliutils.print_list.assert_called_once_with(
-            mock.ANY, fields=['Id', 'Name'])
+            mock.ANY, fields=['Id', 'Name'], output_format='table')
 
     def test_service_list(self):
         self.run_command('service-list')
@@ -135,7 +137,7 @@ class ShellTest(test_utils.TestCase):
         self.run_command('service-list --columns id,host')
         self.assert_called('GET', '/services')
         cliutils.print_list.assert_called_once_with(
-            mock.ANY, fields=['Id', 'Host'])
+            mock.ANY, fields=['Id', 'Host'], output_format='table')
 
     def test_service_enable(self):
         self.run_command('service-enable foo_host@bar_backend manila-share')
@@ -162,7 +164,33 @@ class ShellTest(test_utils.TestCase):
         self.assert_called('GET', '/shares/detail')
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            ['Id', 'Name'], sortby_index=None)
+            ['Id', 'Name'], sortby_index=None, output_format='table')
+
+    @ddt.data('json', 'jsonl', 'csv', 'value')
+    def test_list_streamed_format(self, output_format):
+        share = shares.Share(None, {'id': 'fake_id', 'name': 'fake_name'})
+        self.mock_object(shares.ShareManager, 'list',
+                         mock.Mock(return_value=iter([share])))
+        self.mock_object(cliutils, '_print_rows')
+
+        self.shell.main(['--format', output_format, 'list',
+                         '--columns', 'id,name'])
+
+        shares.ShareManager.list.assert_called_once_with(
+            search_opts=mock.ANY, sort_key=None, sort_dir=None, stream=True)
+        cliutils._print_rows.assert_called_once_with(['Id', 'Name'],
+                                                     mock.ANY, output_format)
+        rows = cliutils._print_rows.call_args[0][1]
+        self.assertEqual([['fake_id', 'fake_name']], list(rows))
+
+    def test_list_table_format_not_streamed(self):
+        self.mock_object(shares.ShareManager, 'list',
+                         mock.Mock(return_value=[]))
+
+        self.shell.main(['--format', 'table', 'list'])
+
+        shares.ShareManager.list.assert_called_once_with(
+            search_opts=mock.ANY, sort_key=None, sort_dir=None)
 
     def test_list_sort_by_name(self):
         self.run_command('list --sort_key name')
@@ -186,7 +214,19 @@ class ShellTest(test_utils.TestCase):
             mock.ANY,
             ['ID', 'Name', 'Size', 'Share Proto', 'Status', 'Is Public',
              'Share Type Name', 'Host', 'Availability Zone', 'Project ID'],
-            sortby_index=None)
+            sortby_index=None, output_format='table')
+
+    @mock.patch.object(cliutils, 'print_list', mock.Mock())
+    def test_list_select_export_location_column(self):
+        self.mock_object(
+            fakes.FakeHTTPClient, 'get_shares_detail',
+            mock.Mock(return_value=(200, {}, {'shares': [{'id': '1234'}]})))
+
+        self.run_command('list --columns id,export_location')
+
+        self.assert_called('GET', '/shares/1234/export_locations')
+        shares = cliutils.print_list.call_args[0][0]
+        self.assertEqual('/foo/el/path', shares[0].export_location)
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_list_select_column_and_all_tenants(self):
@@ -194,7 +234,7 @@ class ShellTest(test_utils.TestCase):
         self.assert_called('GET', '/shares/detail?all_tenants=1')
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            ['Id', 'Name'], sortby_index=None)
+            ['Id', 'Name'], sortby_index=None, output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_list_select_column_and_public(self):
@@ -202,7 +242,7 @@ class ShellTest(test_utils.TestCase):
         self.assert_called('GET', '/shares/detail?is_public=True')
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            ['Id', 'Name'], sortby_index=None)
+            ['Id', 'Name'], sortby_index=None, output_format='table')
 
     def test_list_all_tenants_key_and_value_1(self):
         for separator in self.separators:
@@ -294,7 +334,9 @@ class ShellTest(test_utils.TestCase):
                 self.run_command,
                 'list --share-type' + separator + 'not_found_expected',
             )
-            self.assert_called('GET', '/types?all_tenants=1&is_public=all')
+            self.assert_called(
+                'GET',
+                '/types?all_tenants=1&is_public=all&name=not_found_expected')
 
     def test_list_with_limit(self):
         for separator in self.separators:
@@ -358,7 +400,8 @@ class ShellTest(test_utils.TestCase):
             self.run_command,
             'list --snapshot not_found_expected',
         )
-        self.assert_called('GET', '/snapshots/detail?all_tenants=1')
+        self.assert_called(
+            'GET', '/snapshots/detail?all_tenants=1&name=not_found_expected')
 
     def test_list_filter_by_host(self):
         for separator in self.separators:
@@ -404,7 +447,9 @@ class ShellTest(test_utils.TestCase):
             self.run_command,
             'list --share-network not_found_expected',
         )
-        self.assert_called('GET', '/share-networks/detail?all_tenants=1')
+        self.assert_called(
+            'GET',
+            '/share-networks/detail?all_tenants=1&name=not_found_expected')
 
     @ddt.data('True', 'False')
     def test_list_filter_with_count(self, value):
@@ -416,6 +461,17 @@ class ShellTest(test_utils.TestCase):
             self.run_command('list --count' + separator + value)
             self.assert_called('GET', except_url)
 
+    def test_list_with_count_json(self):
+        stdout = self.useFixture(
+            fixtures.MonkeyPatch('sys.stdout', six.StringIO())).new_value
+        stderr = self.useFixture(
+            fixtures.MonkeyPatch('sys.stderr', six.StringIO())).new_value
+
+        self.run_command('list --count True --columns id --format json')
+
+        self.assertEqual([{'Id': '1234'}], json.loads(stdout.getvalue()))
+        self.assertEqual('Shares in total: 2\n', stderr.getvalue())
+
     @ddt.data('True', 'False')
     def test_list_filter_with_count_invalid_version(self, value):
         self.assertRaises(
@@ -433,7 +489,8 @@ class ShellTest(test_utils.TestCase):
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
             ['ID', 'Share ID', 'Host', 'Status', 'Availability Zone',
-             'Share Network ID', 'Share Server ID', 'Share Type ID'])
+             'Share Network ID', 'Share Server ID', 'Share Type ID'],
+            output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_instance_list_select_column(self):
@@ -442,7 +499,7 @@ class ShellTest(test_utils.TestCase):
         self.assert_called('GET', '/share_instances')
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            ['Id', 'Host', 'Status'])
+            ['Id', 'Host', 'Status'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     @ddt.data(('id', 'b4991315-eb7d-43ec-979e-5715d4399827'),
@@ -488,7 +545,8 @@ class ShellTest(test_utils.TestCase):
 
         self.assert_called_anytime(
             'GET', '/share_instances/1234/export_locations')
-        cliutils.print_list.assert_called_once_with(mock.ANY, ['Uuid', 'Path'])
+        cliutils.print_list.assert_called_once_with(mock.ANY, ['Uuid', 'Path'],
+                                                    output_format='table')
 
     def test_share_instance_export_location_show(self):
         self.run_command(
@@ -541,7 +599,7 @@ class ShellTest(test_utils.TestCase):
             self.assert_called('GET', '/types')
 
         cliutils.print_list.assert_called_with(
-            mock.ANY, columns_requested, mock.ANY)
+            mock.ANY, columns_requested, mock.ANY, output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_type_list_select_column(self):
@@ -551,7 +609,7 @@ class ShellTest(test_utils.TestCase):
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
             ['id', 'name'],
-            mock.ANY)
+            mock.ANY, output_format='table')
 
     def test_type_list_all(self):
         self.run_command('type-list --all')
@@ -611,7 +669,8 @@ class ShellTest(test_utils.TestCase):
         self.run_command('list --public')
         self.assert_called('GET', '/shares/detail?is_public=True')
         cliutils.print_list.assert_called_with(mock.ANY, listed_fields,
-                                               sortby_index=None)
+                                               sortby_index=None,
+                                               output_format='table')
 
     def test_show(self):
         self.run_command('show 1234')
@@ -628,7 +687,8 @@ class ShellTest(test_utils.TestCase):
 
         self.assert_called_anytime(
             'GET', '/shares/1234/export_locations')
-        cliutils.print_list.assert_called_once_with(mock.ANY, ['Uuid', 'Path'])
+        cliutils.print_list.assert_called_once_with(mock.ANY, ['Uuid', 'Path'],
+                                                    output_format='table')
 
     def test_share_export_location_show(self):
         self.run_command('share-export-location-show 1234 fake_el_uuid')
@@ -924,6 +984,27 @@ class ShellTest(test_utils.TestCase):
         self.assert_called('DELETE', '/shares/1234?share_group_id=sg1313')
         self.assertTrue(shell_v2._find_share_group.called)
 
+    def test_delete_bulk_concurrency(self):
+        self.mock_object(shell_v2.bulk, 'run',
+                         mock.Mock(wraps=shell_v2.bulk.run))
+
+        fake_shares = [
+            shares.Share('fake', {'id': share_id})
+            for share_id in ('share_abc', 'share_xyz')
+        ]
+        self.mock_object(
+            shell_v2, '_find_share',
+            mock.Mock(side_effect=lambda cs, share_id: next(
+                share for share in fake_shares if share.id == share_id)))
+
+        self.run_command('--bulk-concurrency 5 delete share_abc share_xyz')
+
+        shell_v2.bulk.run.assert_called_once_with(
+            mock.ANY, ['share_abc', 'share_xyz'], max_workers=5)
+        for share in fake_shares:
+            self.assert_called_anytime('DELETE', '/shares/%s' % share.id,
+                                       clear_callstack=False)
+
     def test_delete_not_found(self):
         self.assertRaises(
             exceptions.CommandError,
@@ -937,15 +1018,13 @@ class ShellTest(test_utils.TestCase):
             shares.Share('fake', {'id': share})
             for share in shares_to_delete
         ]
-        share_not_found_error = ("Delete for share %s failed: No share with "
-                                 "a name or ID of '%s' exists.")
-        shares_are_not_found_errors = [
-            exceptions.CommandError(share_not_found_error % (share, share))
-            for share in shares_to_delete
-        ]
         self.mock_object(
-            shell_v2, '_find_share',
-            mock.Mock(side_effect=(fake_shares + shares_are_not_found_errors)))
+            shell_v2, '_find_share', mock.Mock(side_effect=fake_shares))
+        self.mock_object(
+            shell_v2.waiter, 'wait_for_resources',
+            mock.Mock(return_value=[
+                shell_v2.waiter.WaitResult(share, shell_v2.waiter.DELETED)
+                for share in shares_to_delete]))
 
         self.run_command('delete %s --wait' % ' '.join(shares_to_delete))
 
@@ -955,18 +1034,55 @@ class ShellTest(test_utils.TestCase):
         for share in fake_shares:
             uri = '/shares/%s' % share.id
             self.assert_called_anytime('DELETE', uri, clear_callstack=False)
+        shell_v2.waiter.wait_for_resources.assert_called_once_with(
+            self.shell.cs.shares, fake_shares, expected_status='deleted',
+            timeout=900)
+
+    @ddt.data(
+        (shell_v2.waiter.SUCCESS, 'has been successfully deleted.', False),
+        (shell_v2.waiter.DELETED, 'has been successfully deleted.', False),
+        (shell_v2.waiter.NOT_FOUND, 'could not be found.', True),
+        (shell_v2.waiter.ERROR, 'has reached a failed state.', True),
+        (shell_v2.waiter.TIMEOUT, 'did not reach', True),
+    )
+    @ddt.unpack
+    def test_wait_for_resources_deletion(self, outcome, message, is_error):
+        stdout = self.useFixture(
+            fixtures.MonkeyPatch('sys.stdout', six.StringIO())).new_value
+        stderr = self.useFixture(
+            fixtures.MonkeyPatch('sys.stderr', six.StringIO())).new_value
+        self.mock_object(
+            shell_v2.waiter, 'wait_for_resources',
+            mock.Mock(return_value=[
+                shell_v2.waiter.WaitResult('share_xyz', outcome)]))
+
+        shell_v2._wait_for_resources_deletion(mock.Mock(), ['share_xyz'])
+
+        output = (stderr if is_error else stdout).getvalue()
+        self.assertIn('Share share_xyz %s' % message, output)
 
     def test_list_snapshots(self):
         self.run_command('snapshot-list')
         self.assert_called('GET', '/snapshots/detail')
 
+    def test_list_snapshots_streamed_format(self):
+        self.mock_object(share_snapshots.ShareSnapshotManager, 'list',
+                         mock.Mock(return_value=iter([])))
+
+        # NOTE: The format of a command overrides the global one.
+        self.shell.main(['--format', 'csv', 'snapshot-list',
+                         '--format', 'json'])
+
+        share_snapshots.ShareSnapshotManager.list.assert_called_once_with(
+            search_opts=mock.ANY, sort_key=None, sort_dir=None, stream=True)
+
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_snapshot_list_select_column(self):
         self.run_command('snapshot-list --columns id,name')
         self.assert_called('GET', '/snapshots/detail')
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            ['Id', 'Name'], sortby_index=None)
+            ['Id', 'Name'], sortby_index=None, output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_list_snapshots_all_tenants_only_key(self):
@@ -975,7 +1091,7 @@ class ShellTest(test_utils.TestCase):
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
             ['ID', 'Share ID', 'Status', 'Name', 'Share Size', 'Project ID'],
-            sortby_index=None)
+            sortby_index=None, output_format='table')
 
     def test_list_snapshots_all_tenants_key_and_value_1(self):
         for separator in self.separators:
@@ -1109,7 +1225,8 @@ class ShellTest(test_utils.TestCase):
 
         self.assert_called('GET', '/types?is_public=all')
         cliutils.print_list.assert_called_once_with(
-            mock.ANY, ['ID', 'Name', 'all_extra_specs'], mock.ANY)
+            mock.ANY, ['ID', 'Name', 'all_extra_specs'], mock.ANY,
+            output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_extra_specs_list_select_column(self):
@@ -1117,7 +1234,7 @@ class ShellTest(test_utils.TestCase):
 
         self.assert_called('GET', '/types?is_public=all')
         cliutils.print_list.assert_called_once_with(
-            mock.ANY, ['id', 'name'], mock.ANY)
+            mock.ANY, ['id', 'name'], mock.ANY, output_format='table')
 
     @ddt.data('fake', 'FFFalse', 'trueee')
     def test_type_create_invalid_dhss_value(self, value):
@@ -1602,7 +1719,7 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            fields=['id', 'name'])
+            fields=['id', 'name'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_network_list_select_column(self):
@@ -1613,7 +1730,7 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            fields=['Id'])
+            fields=['Id'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_network_list_all_tenants(self):
@@ -1624,7 +1741,7 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            fields=['id', 'name'])
+            fields=['id', 'name'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     @mock.patch.object(shell_v2, '_find_security_service', mock.Mock())
@@ -1642,7 +1759,7 @@ class ShellTest(test_utils.TestCase):
             shell_v2._find_security_service.assert_called_with(mock.ANY, ss.id)
             cliutils.print_list.assert_called_with(
                 mock.ANY,
-                fields=['id', 'name'])
+                fields=['id', 'name'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_network_list_project_id_aliases(self):
@@ -1654,7 +1771,7 @@ class ShellTest(test_utils.TestCase):
             )
             cliutils.print_list.assert_called_with(
                 mock.ANY,
-                fields=['id', 'name'])
+                fields=['id', 'name'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_network_list_created_before_aliases(self):
@@ -1666,7 +1783,7 @@ class ShellTest(test_utils.TestCase):
             )
             cliutils.print_list.assert_called_with(
                 mock.ANY,
-                fields=['id', 'name'])
+                fields=['id', 'name'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_network_list_created_since_aliases(self):
@@ -1678,7 +1795,7 @@ class ShellTest(test_utils.TestCase):
             )
             cliutils.print_list.assert_called_with(
                 mock.ANY,
-                fields=['id', 'name'])
+                fields=['id', 'name'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_network_list_neutron_net_id_aliases(self):
@@ -1691,7 +1808,7 @@ class ShellTest(test_utils.TestCase):
             )
             cliutils.print_list.assert_called_with(
                 mock.ANY,
-                fields=['id', 'name'])
+                fields=['id', 'name'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_network_list_neutron_subnet_id_aliases(self):
@@ -1704,7 +1821,7 @@ class ShellTest(test_utils.TestCase):
             )
             cliutils.print_list.assert_called_with(
                 mock.ANY,
-                fields=['id', 'name'])
+                fields=['id', 'name'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_network_list_network_type_aliases(self):
@@ -1716,7 +1833,7 @@ class ShellTest(test_utils.TestCase):
             )
             cliutils.print_list.assert_called_with(
                 mock.ANY,
-                fields=['id', 'name'])
+                fields=['id', 'name'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_network_list_segmentation_id_aliases(self):
@@ -1728,7 +1845,7 @@ class ShellTest(test_utils.TestCase):
             )
             cliutils.print_list.assert_called_with(
                 mock.ANY,
-                fields=['id', 'name'])
+                fields=['id', 'name'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_network_list_ip_version_aliases(self):
@@ -1740,7 +1857,7 @@ class ShellTest(test_utils.TestCase):
             )
             cliutils.print_list.assert_called_with(
                 mock.ANY,
-                fields=['id', 'name'])
+                fields=['id', 'name'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_network_list_all_filters(self):
@@ -1771,7 +1888,7 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            fields=['id', 'name'])
+            fields=['id', 'name'], output_format='table')
 
     def test_share_network_list_filter_by_inexact_name(self):
         for separator in self.separators:
@@ -1831,7 +1948,7 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            fields=['Id', 'Name'])
+            fields=['Id', 'Name'], output_format='table')
 
     def test_share_network_security_service_list_by_name(self):
         self.run_command('share-network-security-service-list fake_share_nw')
@@ -1985,7 +2102,8 @@ class ShellTest(test_utils.TestCase):
             'GET',
             '/share-networks/%(share_net_id)s/subnets/%(subnet_id)s' % args,
         )
-        cliutils.print_dict.assert_called_once_with(mock.ANY)
+        cliutils.print_dict.assert_called_once_with(mock.ANY,
+                                                    output_format='table')
 
     def test_share_network_subnet_show_invalid_share_network(self):
         command = 'share-network-subnet-show %(net_id)s %(subnet_id)s' % {
@@ -2004,7 +2122,7 @@ class ShellTest(test_utils.TestCase):
         self.assert_called('GET', '/share-servers')
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            fields=['Id', 'Host', 'Status'])
+            fields=['Id', 'Host', 'Status'], output_format='table')
 
     def test_create_share(self):
         # Use only required fields
@@ -2162,7 +2280,7 @@ class ShellTest(test_utils.TestCase):
         cliutils.print_list.assert_called_with(
             mock.ANY,
             ['id', 'access_type', 'access_to', 'access_level', 'state',
-             'access_key', 'created_at', 'updated_at'])
+             'access_key', 'created_at', 'updated_at'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     @ddt.data(*set(["2.44", "2.45", api_versions.MAX_VERSION]))
@@ -2171,7 +2289,7 @@ class ShellTest(test_utils.TestCase):
                          version=version)
         cliutils.print_list.assert_called_with(
             mock.ANY,
-            ['Id', 'Access_Type'])
+            ['Id', 'Access_Type'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_snapshot_access_list(self):
@@ -2179,7 +2297,8 @@ class ShellTest(test_utils.TestCase):
 
         self.assert_called('GET', '/snapshots/1234/access-list')
         cliutils.print_list.assert_called_with(
-            mock.ANY, ['id', 'access_type', 'access_to', 'state'])
+            mock.ANY, ['id', 'access_type', 'access_to', 'state'],
+            output_format='table')
 
     @mock.patch.object(cliutils, 'print_dict', mock.Mock())
     def test_snapshot_access_allow(self):
@@ -2187,7 +2306,8 @@ class ShellTest(test_utils.TestCase):
 
         self.assert_called('POST', '/snapshots/1234/action')
         cliutils.print_dict.assert_called_with(
-            {'access_type': 'ip', 'access_to': '1.1.1.1'})
+            {'access_type': 'ip', 'access_to': '1.1.1.1'},
+            output_format='table')
 
     def test_snapshot_access_deny(self):
         self.run_command("snapshot-access-deny 1234 fake_id")
@@ -2216,7 +2336,7 @@ class ShellTest(test_utils.TestCase):
         self.assert_called(
             'GET', '/snapshot-instances/1234/export-locations/fake_el_id')
         cliutils.print_dict.assert_called_once_with(
-            {'path': '/fake_path', 'id': 'fake_id'})
+            {'path': '/fake_path', 'id': 'fake_id'}, output_format='table')
 
     @mock.patch.object(cliutils, 'print_dict', mock.Mock())
     def test_snapshot_export_location_show(self):
@@ -2225,7 +2345,7 @@ class ShellTest(test_utils.TestCase):
         self.assert_called('GET',
                            '/snapshots/1234/export-locations/fake_el_id')
         cliutils.print_dict.assert_called_once_with(
-            {'path': '/fake_path', 'id': 'fake_id'})
+            {'path': '/fake_path', 'id': 'fake_id'}, output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_security_service_list(self):
@@ -2236,7 +2356,7 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            fields=['id', 'name', 'status', 'type'])
+            fields=['id', 'name', 'status', 'type'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_security_service_list_select_column(self):
@@ -2247,7 +2367,7 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            fields=['Name', 'Type'])
+            fields=['Name', 'Type'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     @mock.patch.object(shell_v2, '_find_share_network', mock.Mock())
@@ -2267,7 +2387,7 @@ class ShellTest(test_utils.TestCase):
             shell_v2._find_share_network.assert_called_with(mock.ANY, sn.id)
             cliutils.print_list.assert_called_with(
                 mock.ANY,
-                fields=['id', 'name', 'status', 'type'])
+                fields=['id', 'name', 'status', 'type'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_security_service_list_detailed(self):
@@ -2278,7 +2398,8 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            fields=['id', 'name', 'status', 'type', 'share_networks'])
+            fields=['id', 'name', 'status', 'type', 'share_networks'],
+            output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_security_service_list_all_tenants(self):
@@ -2289,7 +2410,7 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            fields=['id', 'name', 'status', 'type'])
+            fields=['id', 'name', 'status', 'type'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_security_service_list_all_filters(self):
@@ -2318,7 +2439,7 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            fields=['id', 'name', 'status', 'type'])
+            fields=['id', 'name', 'status', 'type'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_security_service_list_filter_by_dns_ip_alias(self):
@@ -2329,7 +2450,7 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            fields=['id', 'name', 'status', 'type'])
+            fields=['id', 'name', 'status', 'type'], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_security_service_list_filter_by_ou_alias(self):
@@ -2340,7 +2461,7 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_once_with(
             mock.ANY,
-            fields=['id', 'name', 'status', 'type'])
+            fields=['id', 'name', 'status', 'type'], output_format='table')
 
     @ddt.data(
         {'--name': 'fake_name'},
@@ -2396,7 +2517,7 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_with(
             mock.ANY,
-            fields=["Name", "Host", "Backend", "Pool"])
+            fields=["Name", "Host", "Backend", "Pool"], output_format='table')
 
     @mock.patch.object(cliutils, 'print_dict', mock.Mock())
     def test_quota_show(self):
@@ -2405,7 +2526,8 @@ class ShellTest(test_utils.TestCase):
             'GET',
             '/quota-sets/1234',
         )
-        cliutils.print_dict.assert_called_once_with(mock.ANY)
+        cliutils.print_dict.assert_called_once_with(mock.ANY,
+                                                    output_format='table')
 
     @mock.patch.object(cliutils, 'print_dict', mock.Mock())
     def test_quota_show_with_detail(self):
@@ -2414,7 +2536,8 @@ class ShellTest(test_utils.TestCase):
             'GET',
             '/quota-sets/1234/detail',
         )
-        cliutils.print_dict.assert_called_once_with(mock.ANY)
+        cliutils.print_dict.assert_called_once_with(mock.ANY,
+                                                    output_format='table')
 
     @mock.patch.object(cliutils, 'print_dict', mock.Mock())
     def test_quota_show_with_user_id(self):
@@ -2423,7 +2546,8 @@ class ShellTest(test_utils.TestCase):
             'GET',
             '/quota-sets/1234?user_id=1111',
         )
-        cliutils.print_dict.assert_called_once_with(mock.ANY)
+        cliutils.print_dict.assert_called_once_with(mock.ANY,
+                                                    output_format='table')
 
     @ddt.data('1111', '0')
     @mock.patch('manilaclient.common.cliutils.print_dict')
@@ -2435,7 +2559,8 @@ class ShellTest(test_utils.TestCase):
             'GET',
             '/quota-sets/1234?share_type=%s' % share_type_id,
         )
-        mock_print_dict.assert_called_once_with(mock.ANY)
+        mock_print_dict.assert_called_once_with(mock.ANY,
+                                                output_format='table')
 
     @ddt.data(
         ('--shares 13', {'shares': 13}),
@@ -2479,7 +2604,54 @@ class ShellTest(test_utils.TestCase):
             '/scheduler-stats/pools/detail?backend=.%2A&host=.%2A&pool=.%2A',
         )
         cliutils.print_dict.assert_called_with(
-            {'name': 'host1@backend1#pool2', 'qos': False})
+            {'name': 'host1@backend1#pool2', 'qos': False},
+            output_format='table')
+
+    def test_pool_list_with_detail_json(self):
+        stdout = self.useFixture(
+            fixtures.MonkeyPatch('sys.stdout', six.StringIO())).new_value
+
+        self.run_command('pool-list --detail --format json')
+
+        self.assertEqual(
+            {'host1@backend1#pool1': {'name': 'host1@backend1#pool1',
+                                      'qos': True},
+             'host1@backend1#pool2': {'name': 'host1@backend1#pool2',
+                                      'qos': False}},
+            json.loads(stdout.getvalue()))
+
+    @ddt.data('v2.0', 'v3')
+    def test_credentials_json(self, version):
+        stdout = self.useFixture(
+            fixtures.MonkeyPatch('sys.stdout', six.StringIO())).new_value
+        cs = mock.Mock()
+        cs.keystone_client.service_catalog.catalog = {
+            'version': version, 'user': {'id': 'fake_user'},
+            'token': {'id': 'fake_token'}, 'issued_at': 'fake_issued_at',
+            'expires_at': 'fake_expires_at', 'auth_token': 'fake_token',
+            'audit_ids': ['fake_audit_id'], 'project': {'id': 'fake'},
+        }
+
+        shell_v2.do_credentials(cs, mock.Mock(output_format='json'))
+
+        output = json.loads(stdout.getvalue())
+        self.assertEqual({'id': 'fake_user'}, output['user'])
+        self.assertEqual('fake_token', output['token']['id'])
+
+    def test_endpoints_json(self):
+        stdout = self.useFixture(
+            fixtures.MonkeyPatch('sys.stdout', six.StringIO())).new_value
+        cs = mock.Mock()
+        cs.keystone_client.service_catalog.catalog = {'catalog': [
+            {'name': 'manila', 'endpoints': [{'url': 'http://manila'}]},
+            {'name': 'nova', 'endpoints': [{'url': 'http://nova'}]},
+        ]}
+
+        shell_v2.do_endpoints(cs, mock.Mock(output_format='json'))
+
+        self.assertEqual({'manila': {'url': 'http://manila'},
+                          'nova': {'url': 'http://nova'}},
+                         json.loads(stdout.getvalue()))
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_pool_list_select_column(self):
@@ -2490,7 +2662,7 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_with(
             mock.ANY,
-            fields=["Name", "Host"])
+            fields=["Name", "Host"], output_format='table')
 
     @ddt.data(({"key1": "value1",
                "key2": "value2"},
@@ -2507,7 +2679,7 @@ class ShellTest(test_utils.TestCase):
         fake_quota_set = fakes.FakeQuotaSet(value)
 
         shell_v2._quota_set_pretty_show(fake_quota_set)
-        cliutils.print_dict.assert_called_with(expected)
+        cliutils.print_dict.assert_called_with(expected, output_format='table')
 
     @ddt.data('--share-type test_type', '--share_type test_type',
               '--share-type-id 0123456789', '--share_type_id 0123456789')
@@ -2523,7 +2695,7 @@ class ShellTest(test_utils.TestCase):
         )
         cliutils.print_list.assert_called_with(
             mock.ANY,
-            fields=["Name", "Host", "Backend", "Pool"])
+            fields=["Name", "Host", "Backend", "Pool"], output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_api_version(self):
@@ -2532,7 +2704,8 @@ class ShellTest(test_utils.TestCase):
         cliutils.print_list.assert_called_with(
             mock.ANY,
             ['ID', 'Status', 'Version', 'Min_version'],
-            field_labels=['ID', 'Status', 'Version', 'Minimum Version'])
+            field_labels=['ID', 'Status', 'Version', 'Minimum Version'],
+            output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_group_list(self):
@@ -2541,7 +2714,7 @@ class ShellTest(test_utils.TestCase):
         self.assert_called('GET', '/share-groups/detail')
         cliutils.print_list.assert_called_once_with(
             mock.ANY, fields=('ID', 'Name', 'Status', 'Description'),
-            sortby_index=None)
+            sortby_index=None, output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_group_list_select_column(self):
@@ -2549,7 +2722,8 @@ class ShellTest(test_utils.TestCase):
 
         self.assert_called('GET', '/share-groups/detail')
         cliutils.print_list.assert_called_once_with(
-            mock.ANY, fields=['Id', 'Name', 'Description'], sortby_index=None)
+            mock.ANY, fields=['Id', 'Name', 'Description'], sortby_index=None,
+            output_format='table')
 
     def test_share_group_list_filter_by_inexact_name(self):
         for separator in self.separators:
@@ -2740,7 +2914,7 @@ class ShellTest(test_utils.TestCase):
         self.assert_called('GET', '/share-group-snapshots/detail')
         cliutils.print_list.assert_called_once_with(
             mock.ANY, fields=('id', 'name', 'status', 'description'),
-            sortby_index=None)
+            sortby_index=None, output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_group_snapshot_list_select_column(self):
@@ -2748,7 +2922,8 @@ class ShellTest(test_utils.TestCase):
 
         self.assert_called('GET', '/share-group-snapshots/detail')
         cliutils.print_list.assert_called_once_with(
-            mock.ANY, fields=['Id', 'Name'], sortby_index=None)
+            mock.ANY, fields=['Id', 'Name'], sortby_index=None,
+            output_format='table')
 
     def test_share_group_snapshot_list_all_tenants_only_key(self):
         self.run_command('share-group-snapshot-list --all-tenants')
@@ -2788,7 +2963,7 @@ class ShellTest(test_utils.TestCase):
 
         self.assert_called('GET', '/share-group-snapshots/1234')
         cliutils.print_list.assert_called_once_with(
-            mock.ANY, fields=['Id', 'Size'])
+            mock.ANY, fields=['Id', 'Size'], output_format='table')
 
     @mock.patch.object(shell_v2, '_find_share_group_snapshot', mock.Mock())
     def test_share_group_snapshot_reset_state(self):
@@ -2885,7 +3060,7 @@ class ShellTest(test_utils.TestCase):
 
         shell_v2._print_share_group_type_list.assert_called_once_with(
             mock.ANY, default_share_group_type=mock.ANY,
-            columns=columns_requested)
+            columns=columns_requested, output_format='table')
 
     def test_share_group_type_list_select_column(self):
         self.mock_object(shell_v2, '_print_share_group_type_list')
@@ -2894,7 +3069,8 @@ class ShellTest(test_utils.TestCase):
 
         self.assert_called('GET', '/share-group-types')
         shell_v2._print_share_group_type_list.assert_called_once_with(
-            mock.ANY, default_share_group_type=mock.ANY, columns='id,name')
+            mock.ANY, default_share_group_type=mock.ANY, columns='id,name',
+            output_format='table')
 
     def test_share_group_type_list_all(self):
         self.run_command('share-group-type-list --all')
@@ -2910,7 +3086,7 @@ class ShellTest(test_utils.TestCase):
 
         self.assert_called('GET', '/share-group-types?is_public=all')
         shell_v2._print_type_and_extra_specs_list.assert_called_once_with(
-            mock.ANY, columns=mock.ANY)
+            mock.ANY, columns=mock.ANY, output_format='table')
 
     @ddt.data(True, False)
     def test_share_group_type_create_with_access_and_group_specs(self, public):
@@ -3128,7 +3304,7 @@ class ShellTest(test_utils.TestCase):
         self.assert_called('GET', '/share-replicas/detail')
 
         cliutils.print_list.assert_called_once_with(
-            mock.ANY, ['Id', 'Status'])
+            mock.ANY, ['Id', 'Status'], output_format='table')
 
     @ddt.data(
         'fake-share-id --az fake-az',
@@ -3187,7 +3363,8 @@ class ShellTest(test_utils.TestCase):
 
         self.assert_called(
             'GET', '/share-replicas/1234/export-locations')
-        cliutils.print_list.assert_called_with(mock.ANY, expected_columns)
+        cliutils.print_list.assert_called_with(mock.ANY, expected_columns,
+                                               output_format='table')
 
     @mock.patch.object(shell_v2, '_find_share_replica', mock.Mock())
     def test_share_replica_export_location_show(self):
@@ -3231,7 +3408,7 @@ class ShellTest(test_utils.TestCase):
         self.run_command('snapshot-instance-list --columns id,status')
         self.assert_called('GET', '/snapshot-instances')
         cliutils.print_list.assert_called_once_with(
-            mock.ANY, ['Id', 'Status'])
+            mock.ANY, ['Id', 'Status'], output_format='table')
 
     @mock.patch.object(shell_v2, '_find_share_snapshot', mock.Mock())
     def test_snapshot_instance_list_for_snapshot(self):
@@ -3422,7 +3599,8 @@ class ShellTest(test_utils.TestCase):
         cliutils.print_list.assert_called_once_with(
             mock.ANY, fields=['ID', 'Resource Type', 'Resource ID',
                               'Action ID', 'User Message', 'Detail ID',
-                              'Created At'], sortby_index=None)
+                              'Created At'], sortby_index=None,
+            output_format='table')
 
     @mock.patch.object(cliutils, 'print_list', mock.Mock())
     def test_share_message_list_created_before_aliases(self):
@@ -3446,7 +3624,8 @@ class ShellTest(test_utils.TestCase):
 
         self.assert_called('GET', '/messages')
         cliutils.print_list.assert_called_once_with(
-            mock.ANY, fields=['Id', 'Resource_Type'], sortby_index=None)
+            mock.ANY, fields=['Id', 'Resource_Type'], sortby_index=None,
+            output_format='table')
 
     def test_message_list_with_filters(self):
         self.run_command('message-list --limit 10 --offset 0')
@@ -0,0 +1,291 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Client of the Manila API v2 for asyncio applications."""
+
+import asyncio
+import collections
+
+import manilaclient
+from manilaclient import api_versions
+from manilaclient import base
+from manilaclient.common.apiclient import base as common_base
+from manilaclient.common import async_httpclient
+from manilaclient.common import bulk
+from manilaclient.common import constants
+from manilaclient import exceptions
+from manilaclient.v2 import messages
+from manilaclient.v2 import share_access_rules
+from manilaclient.v2 import share_export_locations
+from manilaclient.v2 import share_networks
+from manilaclient.v2 import share_replicas
+from manilaclient.v2 import share_snapshots
+from manilaclient.v2 import shares
+
+
+class AsyncShareManager(base.AsyncManagerMixin, shares.ShareManager):
+    """Awaitable version of :class:`manilaclient.v2.shares.ShareManager`."""
+
+    def do_list(self, detailed=True, search_opts=None, sort_key=None,
+                sort_dir=None, stream=False, compact=False, columnar=False,
+                lazy_details=False):
+        self._check_not_streamed(stream)
+        return super(AsyncShareManager, self).do_list(
+            detailed=detailed, search_opts=search_opts, sort_key=sort_key,
+            sort_dir=sort_dir, compact=compact, columnar=columnar)
+
+    async def update(self, share, **kwargs):
+        if not kwargs:
+            return
+
+        body = {'share': kwargs, }
+        share_id = common_base.getid(share)
+        return await self._update("/shares/%s" % share_id, body)
+
+    async def delete(self, share, share_group_id=None):
+        url = "/shares/%s" % common_base.getid(share)
+        if share_group_id:
+            url += "?share_group_id=%s" % share_group_id
+        await self._delete(url)
+
+    async def _do_allow(self, share, access_type, access, access_level,
+                        action_name, metadata=None):
+        access_params = {
+            'access_type': access_type,
+            'access_to': access,
+        }
+        if access_level:
+            access_params['access_level'] = access_level
+        if metadata:
+            access_params['metadata'] = metadata
+        resp, body = await self._action(action_name, share, access_params)
+        return body["access"]
+
+    async def _do_access_list(self, share, action_name):
+        resp, body = await self._action(action_name, share)
+        access_list = body["access_list"]
+        if access_list:
+            t = collections.namedtuple('Access', list(access_list[0]))
+            return [t(*value.values()) for value in access_list]
+        else:
+            return []
+
+    async def delete_metadata(self, share, keys):
+        share_id = common_base.getid(share)
+        for key in keys:
+            await self._delete("/shares/%(share_id)s/metadata/%(key)s" % {
+                'share_id': share_id, 'key': key})
+
+
+class AsyncShareSnapshotManager(base.AsyncManagerMixin,
+                                share_snapshots.ShareSnapshotManager):
+    """Awaitable version of :class:`ShareSnapshotManager`."""
+
+    def list(self, detailed=True, search_opts=None, sort_key=None,
+             sort_dir=None, stream=False, compact=False, columnar=False,
+             lazy_details=False):
+        self._check_not_streamed(stream)
+        return super(AsyncShareSnapshotManager, self).list(
+            detailed=detailed, search_opts=search_opts, sort_key=sort_key,
+            sort_dir=sort_dir, compact=compact, columnar=columnar)
+
+    async def delete(self, snapshot):
+        await self._delete("/snapshots/%s" % common_base.getid(snapshot))
+
+    async def update(self, snapshot, **kwargs):
+        if not kwargs:
+            return
+
+        body = {'snapshot': kwargs, }
+        snapshot_id = common_base.getid(snapshot)
+        return await self._update("/snapshots/%s" % snapshot_id, body)
+
+    async def _do_allow(self, snapshot, access_type, access_to):
+        access_params = {
+            'access_type': access_type,
+            'access_to': access_to,
+        }
+        resp, body = await self._action('allow_access', snapshot,
+                                        access_params)
+        return body['snapshot_access']
+
+
+class AsyncShareReplicaManager(base.AsyncManagerMixin,
+                               share_replicas.ShareReplicaManager):
+    """Awaitable version of :class:`ShareReplicaManager`."""
+
+    @api_versions.wraps("2.11", constants.REPLICA_PRE_GRADUATION_VERSION)
+    @api_versions.experimental_api
+    async def delete(self, replica, force=False):
+        await self._do_delete(replica, force=force)
+
+    @api_versions.wraps(constants.REPLICA_GRADUATION_VERSION)  # noqa
+    async def delete(self, replica, force=False):  # noqa F811
+        await self._do_delete(replica, force=force)
+
+    async def _do_delete(self, replica, force=False):
+        replica_id = common_base.getid(replica)
+        if force:
+            await self._do_force_delete(replica_id)
+        else:
+            await self._delete(share_replicas.RESOURCE_PATH % replica_id)
+
+
+class AsyncShareAccessRuleManager(base.AsyncManagerMixin,
+                                  share_access_rules.ShareAccessRuleManager):
+    """Awaitable version of :class:`ShareAccessRuleManager`."""
+
+    @api_versions.wraps("2.45")
+    async def unset_metadata(self, access, keys):
+        for k in keys:
+            url = share_access_rules.RESOURCE_METADATA_PATH % (
+                common_base.getid(access), k)
+            await self._delete(url)
+
+
+class AsyncShareExportLocationManager(
+        base.AsyncManagerMixin,
+        share_export_locations.ShareExportLocationManager):
+    """Awaitable version of :class:`ShareExportLocationManager`."""
+
+    @api_versions.wraps("2.9")
+    async def list_bulk(self, shares, max_workers=bulk.DEFAULT_MAX_WORKERS,
+                        use_cache=False):
+        """List the export locations of several shares.
+
+        It works like :meth:`ShareExportLocationManager.list_bulk`, the
+        requests being sent from the running event loop instead of threads.
+        """
+        share_ids = self._get_share_ids(shares)
+        result = self._get_cached(share_ids) if use_cache else {}
+        missing = [share_id for share_id in share_ids
+                   if share_id not in result]
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def _list(share_id):
+            async with semaphore:
+                return await self.list(share_id)
+
+        outcomes = await asyncio.gather(
+            *[_list(share_id) for share_id in missing],
+            return_exceptions=True)
+        for share_id, outcome in zip(missing, outcomes):
+            if isinstance(outcome, BaseException):
+                raise outcome
+            result[share_id] = outcome
+
+        self._cache_export_locations(missing, result)
+        return result
+
+
+class AsyncShareNetworkManager(base.AsyncManagerMixin,
+                               share_networks.ShareNetworkManager):
+    """Awaitable version of :class:`ShareNetworkManager`."""
+
+    async def delete(self, share_network):
+        await self._delete(
+            share_networks.RESOURCE_PATH % common_base.getid(share_network))
+
+
+class AsyncMessageManager(base.AsyncManagerMixin, messages.MessageManager):
+    """Awaitable version of :class:`MessageManager`."""
+
+
+class AsyncClient(object):
+    """Top-level object to access the OpenStack Manila API from asyncio.
+
+    Create an instance with a token and the Manila endpoint::
+
+        >>> client = AsyncClient(api_version=api_versions.APIVersion('2.57'),
+                                 input_auth_token=TOKEN,
+                                 service_catalog_url=MANILA_URL)
+
+    Or with a keystoneauth1 session, which is only used once, to get a token
+    and the endpoint, when the client is created::
+
+        >>> client = AsyncClient(api_version=api_versions.APIVersion('2.57'),
+                                 session=sess)
+
+    Then await the methods of its managers, and close the client when done::
+
+        >>> async with client:
+        ...     shares = await client.shares.list()
+        ...     async for snapshot in client.share_snapshots.list_iter():
+        ...         ...
+
+    The managers of the core resources (shares, share_snapshots,
+    share_replicas, share_access_rules, share_export_locations,
+    share_networks and messages) are available. They accept the same
+    arguments and return the same resource classes as the managers of
+    :class:`manilaclient.v2.client.Client`, but resources are never lazy
+    loaded.
+
+    Requests use a pool of up to ``pool_maxsize`` keep-alive connections
+    to the Manila endpoint. The ``aiohttp`` library is required, it is
+    installed by the ``async`` extra of python-manilaclient.
+    """
+
+    def __init__(self, api_version=manilaclient.API_MIN_VERSION,
+                 input_auth_token=None, service_catalog_url=None,
+                 session=None, auth=None, endpoint_type='publicURL',
+                 service_type=constants.V2_SERVICE_TYPE, service_name=None,
+                 region_name=None, insecure=False, cacert=None, timeout=None,
+                 retries=None, http_log_debug=False,
+                 user_agent='python-manilaclient', pool_maxsize=None,
+                 keep_alive=True, http_session=None):
+        if input_auth_token and not service_catalog_url:
+            msg = ("For token-based authentication you should "
+                   "provide 'input_auth_token' and 'service_catalog_url'.")
+            raise exceptions.ClientException(msg)
+
+        if not input_auth_token:
+            if not session:
+                raise exceptions.ClientException(
+                    "Either 'input_auth_token' and 'service_catalog_url' or "
+                    "'session' must be provided.")
+            input_auth_token = session.get_token(auth)
+
+        if not service_catalog_url:
+            service_catalog_url = session.get_endpoint(
+                auth, interface=endpoint_type, service_type=service_type,
+                service_name=service_name, region_name=region_name)
+
+        if not service_catalog_url:
+            raise RuntimeError("Could not find Manila endpoint in catalog")
+
+        self.api_version = api_version
+        self.completion_cache = None
+        self.client = async_httpclient.AsyncHTTPClient(
+            service_catalog_url, input_auth_token, user_agent, api_version,
+            insecure=insecure, cacert=cacert, timeout=timeout,
+            retries=retries, http_log_debug=http_log_debug,
+            pool_maxsize=pool_maxsize, keep_alive=keep_alive,
+            http_session=http_session)
+
+        self.shares = AsyncShareManager(self)
+        self.share_snapshots = AsyncShareSnapshotManager(self)
+        self.share_replicas = AsyncShareReplicaManager(self)
+        self.share_access_rules = AsyncShareAccessRuleManager(self)
+        self.share_export_locations = AsyncShareExportLocationManager(self)
+        self.share_networks = AsyncShareNetworkManager(self)
+        self.messages = AsyncMessageManager(self)
+
+    async def close(self):
+        """Closes all the pooled connections of this client."""
+        await self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
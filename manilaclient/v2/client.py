@@ -10,8 +10,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from debtcollector import removals
+import importlib
+import threading
 
+from debtcollector import removals
 from keystoneauth1 import adapter
 from keystoneauth1 import session
 from keystoneclient import client as ks_client
@@ -20,34 +22,55 @@ import manilaclient
 from manilaclient.common import constants
 from manilaclient.common import httpclient
 from manilaclient import exceptions
-from manilaclient.v2 import availability_zones
-from manilaclient.v2 import limits
-from manilaclient.v2 import messages
-from manilaclient.v2 import quota_classes
-from manilaclient.v2 import quotas
-from manilaclient.v2 import scheduler_stats
-from manilaclient.v2 import security_services
-from manilaclient.v2 import services
-from manilaclient.v2 import share_access_rules
-from manilaclient.v2 import share_export_locations
-from manilaclient.v2 import share_group_snapshots
-from manilaclient.v2 import share_group_type_access
-from manilaclient.v2 import share_group_types
-from manilaclient.v2 import share_groups
-from manilaclient.v2 import share_instance_export_locations
-from manilaclient.v2 import share_instances
-from manilaclient.v2 import share_network_subnets
-from manilaclient.v2 import share_networks
-from manilaclient.v2 import share_replica_export_locations
-from manilaclient.v2 import share_replicas
-from manilaclient.v2 import share_servers
-from manilaclient.v2 import share_snapshot_export_locations
-from manilaclient.v2 import share_snapshot_instance_export_locations
-from manilaclient.v2 import share_snapshot_instances
-from manilaclient.v2 import share_snapshots
-from manilaclient.v2 import share_type_access
-from manilaclient.v2 import share_types
-from manilaclient.v2 import shares
+
+# NOTE: Managers are only imported and created when they are first used, so
+# short-lived processes only pay for the ones they need.
+MANAGERS = {
+    'availability_zones': ('availability_zones', 'AvailabilityZoneManager'),
+    'limits': ('limits', 'LimitsManager'),
+    'messages': ('messages', 'MessageManager'),
+    'services': ('services', 'ServiceManager'),
+    'security_services': ('security_services', 'SecurityServiceManager'),
+    'share_networks': ('share_networks', 'ShareNetworkManager'),
+    'share_network_subnets': ('share_network_subnets',
+                              'ShareNetworkSubnetManager'),
+    'quota_classes': ('quota_classes', 'QuotaClassSetManager'),
+    'quotas': ('quotas', 'QuotaSetManager'),
+    'shares': ('shares', 'ShareManager'),
+    'share_export_locations': ('share_export_locations',
+                               'ShareExportLocationManager'),
+    'share_groups': ('share_groups', 'ShareGroupManager'),
+    'share_group_snapshots': ('share_group_snapshots',
+                              'ShareGroupSnapshotManager'),
+    'share_group_type_access': ('share_group_type_access',
+                                'ShareGroupTypeAccessManager'),
+    'share_group_types': ('share_group_types', 'ShareGroupTypeManager'),
+    'share_instances': ('share_instances', 'ShareInstanceManager'),
+    'share_instance_export_locations': (
+        'share_instance_export_locations',
+        'ShareInstanceExportLocationManager'),
+    'share_snapshots': ('share_snapshots', 'ShareSnapshotManager'),
+    'share_snapshot_instances': ('share_snapshot_instances',
+                                 'ShareSnapshotInstanceManager'),
+    'share_snapshot_export_locations': (
+        'share_snapshot_export_locations',
+        'ShareSnapshotExportLocationManager'),
+    'share_snapshot_instance_export_locations': (
+        'share_snapshot_instance_export_locations',
+        'ShareSnapshotInstanceExportLocationManager'),
+    'share_types': ('share_types', 'ShareTypeManager'),
+    'share_type_access': ('share_type_access', 'ShareTypeAccessManager'),
+    'share_servers': ('share_servers', 'ShareServerManager'),
+    'share_replicas': ('share_replicas', 'ShareReplicaManager'),
+    'share_replica_export_locations': ('share_replica_export_locations',
+                                       'ShareReplicaExportLocationManager'),
+    'pools': ('scheduler_stats', 'PoolManager'),
+    'share_access_rules': ('share_access_rules', 'ShareAccessRuleManager'),
+}
+
+# NOTE: Serializes the creation of managers, it is reentrant since a manager
+# may use another one of the client when it is created.
+_MANAGERS_LOCK = threading.RLock()
 
 
 class Client(object):
@@ -74,6 +97,47 @@ class Client(object):
 
         >>> client.shares.list()
         ...
+
+    Managers are created the first time they are accessed.
+
+    All the managers share a single pool of keep-alive HTTP connections to
+    the Manila endpoint. Its size can be tuned with the ``pool_connections``
+    (number of per-host pools), ``pool_maxsize`` (connections kept per host)
+    and ``pool_block`` (wait for a free connection instead of opening a new
+    one once ``pool_maxsize`` is reached) arguments. Pass
+    ``keep_alive=False`` to close connections after every request.
+
+    IDs of the listed and created resources are only stored for bash
+    autocompletion when a cache, such as
+    :class:`manilaclient.common.completion_cache.FileCompletionCache`, is
+    passed as ``completion_cache``.
+
+    Responses of read-mostly resources, such as share types, availability
+    zones or quota defaults, are reused instead of requested again when a
+    cache, such as
+    :class:`manilaclient.common.response_cache.MemoryResponseCache`, is
+    passed as ``response_cache``.
+
+    When the client is shared by several threads, pass
+    ``coalesce_requests=True`` so that identical GET requests made at the
+    same time are sent once, the threads sharing the response.
+
+    Failed requests are retried up to ``retries`` times, a
+    :class:`manilaclient.common.retry.RetryPolicy` passed as
+    ``retry_policy`` gives more control on the requests that are retried
+    and on the delays between attempts.
+
+    With ``session_transport=True``, requests are sent through the
+    keystoneauth ``session``, instead of with the token obtained when the
+    client is created: they reuse the connections of the session and the
+    token is renewed when it expires, so that long running processes can
+    keep using the same client.
+
+    Clients authenticating with a password look up Keystone discovery
+    results and their token in the cache passed as ``auth_cache``, such as
+    a :class:`manilaclient.common.auth_cache.AuthCache` shared by the
+    clients of the process, and only ask Keystone when they are missing or
+    about to expire.
     """
     @removals.removed_kwarg(
         'share_service_name', message="Please use 'service_name' instead",
@@ -108,6 +172,16 @@ class Client(object):
                  project_domain_name=None,
                  cert=None,
                  password=None,
+                 pool_connections=None,
+                 pool_maxsize=None,
+                 pool_block=False,
+                 keep_alive=True,
+                 completion_cache=None,
+                 response_cache=None,
+                 coalesce_requests=False,
+                 retry_policy=None,
+                 session_transport=False,
+                 auth_cache=None,
                  **kwargs):
 
         self.username = username
@@ -134,6 +208,8 @@ class Client(object):
         self.use_keyring = use_keyring
         self.force_new_token = force_new_token
         self.cached_token_lifetime = cached_token_lifetime
+        self.completion_cache = completion_cache
+        self.auth_cache = auth_cache
 
         service_name = kwargs.get("share_service_name", service_name)
 
@@ -158,13 +234,16 @@ class Client(object):
                     service_type=service_type,
                     service_name=service_name,
                     region_name=region_name)
-                input_auth_token = self.keystone_client.session.get_token(auth)
+                if not session_transport:
+                    input_auth_token = self.keystone_client.session.get_token(
+                        auth)
 
             else:
                 self.keystone_client = self._get_keystone_client()
                 input_auth_token = self.keystone_client.auth_token
 
-        if not input_auth_token:
+        session_transport = session_transport and session is not None
+        if not (input_auth_token or session_transport):
             raise RuntimeError("Not Authorized")
 
         if session and not service_catalog_url:
@@ -191,65 +270,54 @@ class Client(object):
             raise RuntimeError("Could not find Manila endpoint in catalog")
 
         self.api_version = api_version
-        self.client = httpclient.HTTPClient(service_catalog_url,
-                                            input_auth_token,
-                                            user_agent,
-                                            insecure=insecure,
-                                            cacert=cacert,
-                                            timeout=timeout,
-                                            retries=retries,
-                                            http_log_debug=http_log_debug,
-                                            api_version=self.api_version)
-
-        self.availability_zones = availability_zones.AvailabilityZoneManager(
-            self)
-        self.limits = limits.LimitsManager(self)
-        self.messages = messages.MessageManager(self)
-        self.services = services.ServiceManager(self)
-        self.security_services = security_services.SecurityServiceManager(self)
-        self.share_networks = share_networks.ShareNetworkManager(self)
-        self.share_network_subnets = (
-            share_network_subnets.ShareNetworkSubnetManager(self))
-
-        self.quota_classes = quota_classes.QuotaClassSetManager(self)
-        self.quotas = quotas.QuotaSetManager(self)
-
-        self.shares = shares.ShareManager(self)
-        self.share_export_locations = (
-            share_export_locations.ShareExportLocationManager(self))
-        self.share_groups = share_groups.ShareGroupManager(self)
-        self.share_group_snapshots = (
-            share_group_snapshots.ShareGroupSnapshotManager(self))
-        self.share_group_type_access = (
-            share_group_type_access.ShareGroupTypeAccessManager(self))
-        self.share_group_types = share_group_types.ShareGroupTypeManager(self)
-        self.share_instances = share_instances.ShareInstanceManager(self)
-        self.share_instance_export_locations = (
-            share_instance_export_locations.ShareInstanceExportLocationManager(
-                self))
-        self.share_snapshots = share_snapshots.ShareSnapshotManager(self)
-        self.share_snapshot_instances = (
-            share_snapshot_instances.ShareSnapshotInstanceManager(self))
-        self.share_snapshot_export_locations = (
-            share_snapshot_export_locations.ShareSnapshotExportLocationManager(
-                self))
-        self.share_snapshot_instance_export_locations = (
-            share_snapshot_instance_export_locations.
-            ShareSnapshotInstanceExportLocationManager(self))
-
-        self.share_types = share_types.ShareTypeManager(self)
-        self.share_type_access = share_type_access.ShareTypeAccessManager(self)
-        self.share_servers = share_servers.ShareServerManager(self)
-        self.share_replicas = share_replicas.ShareReplicaManager(self)
-        self.share_replica_export_locations = (
-            share_replica_export_locations.ShareReplicaExportLocationManager(
-                self))
-        self.pools = scheduler_stats.PoolManager(self)
-        self.share_access_rules = (
-            share_access_rules.ShareAccessRuleManager(self))
+        if session_transport and not input_auth_token:
+            self.client = httpclient.SessionClient(
+                session, service_catalog_url, user_agent, self.api_version,
+                auth=auth, timeout=timeout, retries=retries,
+                http_log_debug=http_log_debug,
+                response_cache=response_cache,
+                coalesce_requests=coalesce_requests,
+                retry_policy=retry_policy)
+        else:
+            self.client = httpclient.HTTPClient(
+                service_catalog_url,
+                input_auth_token,
+                user_agent,
+                insecure=insecure,
+                cacert=cacert,
+                timeout=timeout,
+                retries=retries,
+                http_log_debug=http_log_debug,
+                api_version=self.api_version,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+                response_cache=response_cache,
+                coalesce_requests=coalesce_requests,
+                retry_policy=retry_policy)
 
         self._load_extensions(extensions)
 
+    def __getattr__(self, name):
+        # NOTE: Only called for attributes that are not set yet, the manager
+        # is stored on the instance so this runs once per manager.
+        if name not in MANAGERS:
+            raise AttributeError(
+                "'%s' object has no attribute '%s'" % (
+                    self.__class__.__name__, name))
+        with _MANAGERS_LOCK:
+            # NOTE: Another thread may have created the manager meanwhile,
+            # all threads must share it along with its caches.
+            manager = self.__dict__.get(name)
+            if manager is None:
+                module_name, class_name = MANAGERS[name]
+                module = importlib.import_module(
+                    'manilaclient.v2.' + module_name)
+                manager = getattr(module, class_name)(self)
+                setattr(self, name, manager)
+        return manager
+
     def _load_extensions(self, extensions):
         if not extensions:
             return
@@ -282,17 +350,22 @@ class Client(object):
         ks_session = session.Session(verify=verify, cert=self.cert)
 
         # Discover the supported keystone versions using the given url
-        ks_discover = session.discover.Discover(ks_session, self.auth_url)
-
-        # Inspect the auth_url to see the supported version. If both v3 and v2
-        # are supported, then use the highest version if possible.
-        v2_auth_url = ks_discover.url_for('v2.0')
-        v3_auth_url = ks_discover.url_for('v3.0')
+        versions = (self.auth_cache.get_discovery(self.auth_url)
+                    if self.auth_cache else None)
+        if versions is None:
+            ks_discover = session.discover.Discover(ks_session, self.auth_url)
+
+            # Inspect the auth_url to see the supported version. If both v3
+            # and v2 are supported, then use the highest version if possible.
+            versions = {'v2.0': ks_discover.url_for('v2.0'),
+                        'v3.0': ks_discover.url_for('v3.0')}
+            if self.auth_cache and (versions['v2.0'] or versions['v3.0']):
+                self.auth_cache.set_discovery(self.auth_url, versions)
+        v2_auth_url = versions['v2.0']
+        v3_auth_url = versions['v3.0']
 
         if v3_auth_url:
-            keystone_client = ks_client.Client(
-                session=ks_session,
-                version=(3, 0),
+            auth_params = dict(
                 auth_url=v3_auth_url,
                 username=self.username,
                 password=self.password,
@@ -302,25 +375,51 @@ class Client(object):
                 project_id=self.project_id or self.tenant_id,
                 project_name=self.project_name,
                 project_domain_name=self.project_domain_name,
-                project_domain_id=self.project_domain_id,
-                region_name=self.region_name)
-        elif v2_auth_url:
+                project_domain_id=self.project_domain_id)
             keystone_client = ks_client.Client(
                 session=ks_session,
-                version=(2, 0),
+                version=(3, 0),
+                region_name=self.region_name,
+                use_keyring=self.use_keyring,
+                force_new_token=self.force_new_token,
+                stale_duration=self.cached_token_lifetime,
+                **auth_params)
+        elif v2_auth_url:
+            auth_params = dict(
                 auth_url=v2_auth_url,
                 username=self.username,
                 password=self.password,
                 tenant_id=self.tenant_id,
-                tenant_name=self.tenant_name,
+                tenant_name=self.tenant_name)
+            keystone_client = ks_client.Client(
+                session=ks_session,
+                version=(2, 0),
                 region_name=self.region_name,
                 cert=self.cert,
                 use_keyring=self.use_keyring,
                 force_new_token=self.force_new_token,
-                stale_duration=self.cached_token_lifetime)
+                stale_duration=self.cached_token_lifetime,
+                **auth_params)
         else:
             raise exceptions.CommandError(
                 'Unable to determine the Keystone version to authenticate '
                 'with using the given auth_url.')
-        keystone_client.authenticate()
+
+        if not self.auth_cache:
+            keystone_client.authenticate()
+            return keystone_client
+
+        token_key = self.auth_cache.get_token_key(**auth_params)
+        auth_ref = None
+        if not self.force_new_token:
+            auth_ref = self.auth_cache.get_auth_ref(
+                token_key, stale_duration=self.cached_token_lifetime)
+        if auth_ref is not None:
+            # NOTE: This is what keystoneclient does with tokens found in
+            # the keyring.
+            keystone_client.auth_ref = auth_ref
+            keystone_client.process_token(region_name=self.region_name)
+        else:
+            keystone_client.authenticate()
+            self.auth_cache.set_auth_ref(token_key, keystone_client.auth_ref)
         return keystone_client
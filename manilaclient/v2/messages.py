@@ -75,6 +75,22 @@ class MessageManager(base.ManagerWithFind):
         path = RESOURCES_PATH + query_string
         return self._list(path, RESOURCES_NAME)
 
+    @api_versions.wraps('2.37')
+    def list_iter(self, search_opts=None, sort_key=None, sort_dir=None,
+                  page_size=None, prefetch=False):
+        """Iterate over all messages, requesting them page by page.
+
+        Accepts the same arguments as :meth:`list` and additionally:
+
+        :param page_size: number of messages requested per API call.
+        :param prefetch: whether to request the next page in background
+            while the current one is being consumed.
+        :rtype: generator of :class:`Message`
+        """
+        return self._list_iter(
+            self.list, search_opts=search_opts, page_size=page_size,
+            prefetch=prefetch, sort_key=sort_key, sort_dir=sort_dir)
+
     @api_versions.wraps('2.37')
     def delete(self, message):
         """Delete a message."""
@@ -28,10 +28,18 @@ class Pool(common_base.Resource):
 class PoolManager(base.Manager):
     """Manage :class:`Pool` resources."""
     resource_class = Pool
+    columnar_flatten = ('capabilities', )
 
-    def list(self, detailed=True, search_opts=None):
+    def list(self, detailed=True, search_opts=None, compact=False,
+             columnar=False):
         """Get a list of pools.
 
+        :param compact: whether to return read-only pools, which are
+            cheaper to build and use less memory.
+        :param columnar: whether to return the pools as a
+            :class:`manilaclient.common.columnar.Table` instead of a list.
+            Each pool capability is stored in a 'capabilities.<name>'
+            column.
         :rtype: list of :class:`Pool`
         """
         query_string = self._build_query_string(search_opts)
@@ -46,4 +54,5 @@ class PoolManager(base.Manager):
                 'query': query_string
             }
 
-        return self._list(path, RESOURCES_NAME)
+        return self._list(path, RESOURCES_NAME, compact=compact,
+                          columnar=columnar)
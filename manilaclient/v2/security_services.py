@@ -41,6 +41,8 @@ class SecurityServiceManager(base.ManagerWithFind):
     """Manage :class:`SecurityService` resources."""
 
     resource_class = SecurityService
+    server_side_filters = (
+        'name', 'type', 'status', 'user', 'server', 'dns_ip', 'domain')
 
     def create(self, type, dns_ip=None, ou=None, server=None, domain=None,
                user=None, password=None, name=None,
@@ -13,9 +13,14 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
+import threading
+import time
+
 from manilaclient import api_versions
 from manilaclient import base
 from manilaclient.common.apiclient import base as common_base
+from manilaclient.common import bulk
 
 
 class ShareExportLocation(common_base.Resource):
@@ -32,6 +37,16 @@ class ShareExportLocationManager(base.ManagerWithFind):
     """Manage :class:`ShareExportLocation` resources."""
     resource_class = ShareExportLocation
 
+    # Number of seconds export locations cached by list_bulk are reused for,
+    # and maximum number of shares they are cached for.
+    cache_ttl = 60
+    cache_max_entries = 1024
+
+    def __init__(self, api):
+        super(ShareExportLocationManager, self).__init__(api)
+        self._cache = collections.OrderedDict()
+        self._cache_lock = threading.Lock()
+
     @api_versions.wraps("2.9")
     def list(self, share, search_opts=None):
         """List all share export locations."""
@@ -48,3 +63,79 @@ class ShareExportLocationManager(base.ManagerWithFind):
             "/shares/%(share_id)s/export_locations/%(export_location_id)s" % {
                 "share_id": share_id,
                 "export_location_id": export_location_id}, "export_location")
+
+    @api_versions.wraps("2.9")
+    def list_bulk(self, shares, max_workers=bulk.DEFAULT_MAX_WORKERS,
+                  use_cache=False):
+        """List the export locations of several shares.
+
+        The export locations of each share are retrieved concurrently, with
+        at most ``max_workers`` requests in flight, and cached by share ID
+        for ``cache_ttl`` seconds, see :meth:`clear_cache`. The cache holds
+        the export locations of at most ``cache_max_entries`` shares, the
+        least recently used ones are dropped first.
+
+        :param shares: list of shares or share IDs.
+        :param max_workers: maximum number of concurrent requests.
+        :param use_cache: whether export locations cached by a previous call
+            less than ``cache_ttl`` seconds ago can be returned, they are
+            cached in any case.
+        :returns: dict mapping the share IDs to the list of their export
+            locations.
+        :raises: the first error raised retrieving the export locations of
+            a share, after all the requests completed.
+        """
+        share_ids = self._get_share_ids(shares)
+        result = self._get_cached(share_ids) if use_cache else {}
+        missing = [share_id for share_id in share_ids
+                   if share_id not in result]
+
+        for outcome in bulk.run(self.list, missing, max_workers=max_workers):
+            if outcome.failed:
+                raise outcome.error
+            result[outcome.item] = outcome.result
+
+        self._cache_export_locations(missing, result)
+        return result
+
+    @staticmethod
+    def _get_share_ids(shares):
+        share_ids = []
+        for share in shares:
+            share_id = common_base.getid(share)
+            if share_id not in share_ids:
+                share_ids.append(share_id)
+        return share_ids
+
+    def _get_cached(self, share_ids):
+        """Returns the unexpired cached export locations of the shares."""
+        result = {}
+        now = time.time()
+        with self._cache_lock:
+            for share_id in share_ids:
+                entry = self._cache.get(share_id)
+                if entry is None:
+                    continue
+                if entry[0] <= now:
+                    del self._cache[share_id]
+                    continue
+                self._cache.move_to_end(share_id)
+                result[share_id] = entry[1]
+        return result
+
+    def _cache_export_locations(self, share_ids, result):
+        expires_at = time.time() + self.cache_ttl
+        with self._cache_lock:
+            for share_id in share_ids:
+                self._cache[share_id] = (expires_at, result[share_id])
+                self._cache.move_to_end(share_id)
+            while len(self._cache) > self.cache_max_entries:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self, share=None):
+        """Forget the cached export locations of a share, or of all shares."""
+        with self._cache_lock:
+            if share is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(common_base.getid(share), None)
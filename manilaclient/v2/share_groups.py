@@ -211,6 +211,22 @@ class ShareGroupManager(base.ManagerWithFind):
             detailed=detailed, search_opts=search_opts, sort_key=sort_key,
             sort_dir=sort_dir)
 
+    def list_iter(self, detailed=True, search_opts=None, sort_key=None,
+                  sort_dir=None, page_size=None, prefetch=False):
+        """Iterate over all share groups, requesting them page by page.
+
+        Accepts the same arguments as :meth:`list` and additionally:
+
+        :param page_size: number of share groups requested per API call.
+        :param prefetch: whether to request the next page in background
+            while the current one is being consumed.
+        :rtype: generator of :class:`ShareGroup`
+        """
+        return self._list_iter(
+            self.list, search_opts=search_opts, page_size=page_size,
+            prefetch=prefetch, detailed=detailed, sort_key=sort_key,
+            sort_dir=sort_dir)
+
     def _update_share_group(self, share_group, **kwargs):
         """Updates a share group.
 
@@ -41,6 +41,7 @@ class ShareNetwork(common_base.Resource):
 class ShareNetworkManager(base.ManagerWithFind):
     """Manage :class:`ShareNetwork` resources."""
     resource_class = ShareNetwork
+    server_side_filters = ('name', 'description', 'project_id')
 
     @api_versions.wraps("1.0", "2.25")
     def create(self, neutron_net_id=None, neutron_subnet_id=None,
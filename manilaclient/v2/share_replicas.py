@@ -82,16 +82,32 @@ class ShareReplicaManager(base.ManagerWithFind):
         """List all share replicas or list replicas belonging to a share.
 
         :param share: either share object or its UUID.
-        :param search_opts: default None
+        :param search_opts: dict with search options to filter out replicas,
+            e.g. 'limit' and 'offset'. Default None
         :rtype: list of :class:`ShareReplica`
         """
-
+        search_opts = dict(search_opts or {})
         if share:
-            share_id = '?share_id=' + common_base.getid(share)
-            url = RESOURCES_PATH + '/detail' + share_id
-            return self._list(url, RESOURCES_NAME)
-        else:
-            return self._list(RESOURCES_PATH + '/detail', RESOURCES_NAME)
+            search_opts['share_id'] = common_base.getid(share)
+
+        query_string = self._build_query_string(search_opts)
+        return self._list(RESOURCES_PATH + '/detail' + query_string,
+                          RESOURCES_NAME)
+
+    def list_iter(self, share=None, search_opts=None, page_size=None,
+                  prefetch=False):
+        """Iterate over all share replicas, requesting them page by page.
+
+        Accepts the same arguments as :meth:`list` and additionally:
+
+        :param page_size: number of replicas requested per API call.
+        :param prefetch: whether to request the next page in background
+            while the current one is being consumed.
+        :rtype: generator of :class:`ShareReplica`
+        """
+        return self._list_iter(
+            self.list, search_opts=search_opts, page_size=page_size,
+            prefetch=prefetch, share=share)
 
     @api_versions.wraps("2.11", constants.REPLICA_PRE_GRADUATION_VERSION)
     @api_versions.experimental_api
@@ -14,6 +14,8 @@
 #    under the License.
 """Interface for shares extension."""
 
+import functools
+
 from manilaclient import api_versions
 from manilaclient import base
 from manilaclient.common.apiclient import base as common_base
@@ -61,6 +63,8 @@ class ShareSnapshot(common_base.Resource):
 class ShareSnapshotManager(base.ManagerWithFind):
     """Manage :class:`ShareSnapshot` resources."""
     resource_class = ShareSnapshot
+    server_side_filters = (
+        'name', 'description', 'status', 'share_id', 'project_id')
 
     def create(self, share, force=False, name=None, description=None):
         """Create a snapshot of the given share.
@@ -121,12 +125,22 @@ class ShareSnapshotManager(base.ManagerWithFind):
         return self._get('/snapshots/%s' % snapshot_id, 'snapshot')
 
     def list(self, detailed=True, search_opts=None, sort_key=None,
-             sort_dir=None):
+             sort_dir=None, stream=False, compact=False, columnar=False,
+             lazy_details=False):
         """Get a list of snapshots of shares.
 
         :param search_opts: Search options to filter out shares.
         :param sort_key: Key to be sorted.
         :param sort_dir: Sort direction, should be 'desc' or 'asc'.
+        :param stream: whether to return a generator building the snapshots
+            while the response is received, instead of a list.
+        :param compact: whether to return read-only snapshots, which are
+            cheaper to build and use less memory.
+        :param columnar: whether to return the snapshots as a
+            :class:`manilaclient.common.columnar.Table` instead of a list.
+        :param lazy_details: whether snapshots listed with
+            ``detailed=False`` load their missing attributes on first access,
+            all of them with a single detailed listing.
         :rtype: list of :class:`ShareSnapshot`
         """
         search_opts = search_opts or {}
@@ -149,12 +163,35 @@ class ShareSnapshotManager(base.ManagerWithFind):
 
         query_string = self._build_query_string(search_opts)
 
+        detail_path = "/snapshots/detail%s" % (query_string,)
+        load_details = None
         if detailed:
-            path = "/snapshots/detail%s" % (query_string,)
+            path = detail_path
         else:
             path = "/snapshots%s" % (query_string,)
+            if lazy_details:
+                load_details = functools.partial(self._list, detail_path,
+                                                 'snapshots')
+
+        return self._list(path, 'snapshots', stream=stream,
+                          compact=compact, columnar=columnar,
+                          load_details=load_details)
+
+    def list_iter(self, detailed=True, search_opts=None, sort_key=None,
+                  sort_dir=None, page_size=None, prefetch=False):
+        """Iterate over all snapshots, requesting them page by page.
 
-        return self._list(path, 'snapshots')
+        Accepts the same arguments as :meth:`list` and additionally:
+
+        :param page_size: number of snapshots requested per API call.
+        :param prefetch: whether to request the next page in background
+            while the current one is being consumed.
+        :rtype: generator of :class:`ShareSnapshot`
+        """
+        return self._list_iter(
+            self.list, search_opts=search_opts, page_size=page_size,
+            prefetch=prefetch, detailed=detailed, sort_key=sort_key,
+            sort_dir=sort_dir)
 
     def delete(self, snapshot):
         """Delete a snapshot of a share.
@@ -15,6 +15,7 @@
 """Interface for shares extension."""
 
 import collections
+import functools
 import ipaddress
 from oslo_utils import uuidutils
 import re
@@ -117,6 +118,10 @@ class Share(common_base.Resource):
 class ShareManager(base.ManagerWithFind):
     """Manage :class:`Share` resources."""
     resource_class = Share
+    server_side_filters = (
+        'name', 'description', 'status', 'host', 'project_id',
+        'share_network_id', 'share_server_id', 'share_type_id',
+        'snapshot_id', 'share_group_id')
 
     def create(self, share_proto, size, snapshot_id=None, name=None,
                description=None, metadata=None, share_network=None,
@@ -333,22 +338,29 @@ class ShareManager(base.ManagerWithFind):
 
     @api_versions.wraps("1.0", "2.34")
     def list(self, detailed=True, search_opts=None,
-             sort_key=None, sort_dir=None):
+             sort_key=None, sort_dir=None, stream=False, compact=False,
+             columnar=False, lazy_details=False):
         """Get a list of all shares."""
         search_opts = search_opts or {}
         search_opts.pop("export_location", None)
         return self.do_list(detailed=detailed, search_opts=search_opts,
-                            sort_key=sort_key, sort_dir=sort_dir)
+                            sort_key=sort_key, sort_dir=sort_dir,
+                            stream=stream, compact=compact,
+                            columnar=columnar, lazy_details=lazy_details)
 
     @api_versions.wraps("2.35")   # noqa
     def list(self, detailed=True, search_opts=None,   # noqa
-             sort_key=None, sort_dir=None):
+             sort_key=None, sort_dir=None, stream=False, compact=False,
+             columnar=False, lazy_details=False):
         """Get a list of all shares."""
         return self.do_list(detailed=detailed, search_opts=search_opts,
-                            sort_key=sort_key, sort_dir=sort_dir)
+                            sort_key=sort_key, sort_dir=sort_dir,
+                            stream=stream, compact=compact,
+                            columnar=columnar, lazy_details=lazy_details)
 
     def do_list(self, detailed=True, search_opts=None,
-                sort_key=None, sort_dir=None):
+                sort_key=None, sort_dir=None, stream=False, compact=False,
+                columnar=False, lazy_details=False):
         """Get a list of all shares.
 
         :param detailed: Whether to return detailed share info or not.
@@ -373,6 +385,17 @@ class ShareManager(base.ManagerWithFind):
             admin context.
         :param sort_key: Key to be sorted (i.e. 'created_at' or 'status').
         :param sort_dir: Sort direction, should be 'desc' or 'asc'.
+        :param stream: whether to return a generator building the shares
+            while the response is received, instead of a list. It keeps the
+            memory usage low when listing a very large number of shares.
+        :param compact: whether to return read-only shares, which are
+            cheaper to build and use less memory.
+        :param columnar: whether to return the shares as a
+            :class:`manilaclient.common.columnar.Table`, with one column per
+            share attribute, instead of a list.
+        :param lazy_details: whether shares listed with ``detailed=False``
+            load their missing attributes on first access, all of them with
+            a single detailed listing, instead of raising AttributeError.
         :rtype: list of :class:`Share`
         """
         if search_opts is None:
@@ -411,12 +434,36 @@ class ShareManager(base.ManagerWithFind):
 
         query_string = self._build_query_string(search_opts)
 
+        detail_path = "/shares/detail%s" % (query_string,)
+        load_details = None
         if detailed:
-            path = "/shares/detail%s" % (query_string,)
+            path = detail_path
         else:
             path = "/shares%s" % (query_string,)
+            if lazy_details:
+                # NOTE: Missing details of the listed shares are loaded with
+                # a single detailed listing.
+                load_details = functools.partial(self._list, detail_path,
+                                                 'shares')
 
-        return self._list(path, 'shares')
+        return self._list(path, 'shares', stream=stream, compact=compact,
+                          columnar=columnar, load_details=load_details)
+
+    def list_iter(self, detailed=True, search_opts=None, sort_key=None,
+                  sort_dir=None, page_size=None, prefetch=False):
+        """Iterate over all shares, requesting them page by page.
+
+        Accepts the same arguments as :meth:`list` and additionally:
+
+        :param page_size: number of shares requested per API call.
+        :param prefetch: whether to request the next page in background
+            while the current one is being consumed.
+        :rtype: generator of :class:`Share`
+        """
+        return self._list_iter(
+            self.list, search_opts=search_opts, page_size=page_size,
+            prefetch=prefetch, detailed=detailed, sort_key=sort_key,
+            sort_dir=sort_dir)
 
     def delete(self, share, share_group_id=None):
         """Delete a share.
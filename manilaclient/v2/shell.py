@@ -25,8 +25,10 @@ import six
 
 from manilaclient import api_versions
 from manilaclient.common.apiclient import utils as apiclient_utils
+from manilaclient.common import bulk
 from manilaclient.common import cliutils
 from manilaclient.common import constants
+from manilaclient.common import waiter
 from manilaclient import exceptions
 
 
@@ -110,13 +112,68 @@ def _wait_for_resource_status(cs,
     return resource
 
 
+def _run_bulk(args, func, items, error_msg):
+    """Run ``func`` concurrently for each of ``items``, reporting failures.
+
+    :param args: parsed command line arguments, 'bulk_concurrency' caps the
+       number of concurrent calls
+    :param func: callable accepting a single item
+    :param items: list of items to process
+    :param error_msg: message printed to stderr for each failed item, it is
+       formatted with the item and the error raised for it
+    :returns: list of :class:`manilaclient.common.bulk.BulkResult` in the
+       same order as ``items``
+    """
+    results = bulk.run(
+        func, items,
+        max_workers=getattr(args, 'bulk_concurrency',
+                            bulk.DEFAULT_MAX_WORKERS))
+    for result in results:
+        if result.failed:
+            print(error_msg % (result.item, result.error), file=sys.stderr)
+    return results
+
+
+def _wait_for_resources_deletion(manager, resources, resource_type='share',
+                                 poll_timeout=900):
+    """Waits for several resources to be deleted, reporting the outcomes.
+
+    :param manager: manager of the resources to wait for
+    :param resources: list of resources being deleted
+    :param resource_type: name of the resource type, used in messages
+    :param poll_timeout: how long to wait for in seconds
+    """
+    deleted = ("%(resource_type)s %(resource)s has been successfully "
+               "deleted.")
+    messages = {
+        waiter.SUCCESS: deleted,
+        waiter.DELETED: deleted,
+        waiter.NOT_FOUND: "%(resource_type)s %(resource)s could not be "
+                          "found.",
+        waiter.ERROR: "%(resource_type)s %(resource)s has reached a failed "
+                      "state.",
+        waiter.TIMEOUT: "%(resource_type)s %(resource)s did not reach "
+                        "['deleted'] within %(seconds)d seconds.",
+    }
+    results = waiter.wait_for_resources(
+        manager, resources, expected_status='deleted', timeout=poll_timeout)
+    for result in results:
+        message = messages[result.outcome] % {
+            'resource_type': resource_type.capitalize(),
+            'resource': result.resource_id,
+            'seconds': poll_timeout,
+        }
+        print(message, file=None if result.succeeded else sys.stderr)
+    return results
+
+
 def _find_share(cs, share):
     """Get a share by ID."""
     return apiclient_utils.find_resource(cs.shares, share)
 
 
 @api_versions.wraps("1.0", "2.8")
-def _print_share(cs, share):
+def _print_share(cs, share, output_format='table'):
     info = share._info.copy()
     info.pop('links', None)
 
@@ -143,11 +200,11 @@ def _print_share(cs, share):
     if 'volume_type' in info and 'share_type' in info:
         info.pop('volume_type', None)
 
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=output_format)
 
 
 @api_versions.wraps("2.9")  # noqa
-def _print_share(cs, share):  # noqa
+def _print_share(cs, share, output_format='table'):  # noqa
     info = share._info.copy()
     info.pop('links', None)
 
@@ -179,7 +236,7 @@ def _print_share(cs, share):  # noqa
     if 'volume_type' in info and 'share_type' in info:
         info.pop('volume_type', None)
 
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=output_format)
 
 
 def _wait_for_share_status(cs, share, expected_status='available'):
@@ -192,7 +249,7 @@ def _find_share_instance(cs, instance):
     return apiclient_utils.find_resource(cs.share_instances, instance)
 
 
-def _print_type_show(stype, default_share_type=None):
+def _print_type_show(stype, default_share_type=None, output_format='table'):
 
     if hasattr(stype, 'is_default'):
         is_default = 'YES' if stype.is_default else 'NO'
@@ -210,25 +267,25 @@ def _print_type_show(stype, default_share_type=None):
         'required_extra_specs': _print_type_required_extra_specs(stype),
         'optional_extra_specs': _print_type_optional_extra_specs(stype),
     }
-    cliutils.print_dict(stype_dict)
+    cliutils.print_dict(stype_dict, output_format=output_format)
 
 
 @api_versions.wraps("1.0", "2.8")
-def _print_share_instance(cs, instance):
+def _print_share_instance(cs, instance, output_format='table'):
     info = instance._info.copy()
     info.pop('links', None)
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=output_format)
 
 
 @api_versions.wraps("2.9")  # noqa
-def _print_share_instance(cs, instance):  # noqa
+def _print_share_instance(cs, instance, output_format='table'):  # noqa
     info = instance._info.copy()
     info.pop('links', None)
     if info.get('export_locations'):
         info['export_locations'] = (
             cliutils.transform_export_locations_to_string_view(
                 info['export_locations']))
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=output_format)
 
 
 def _find_share_replica(cs, replica):
@@ -237,21 +294,21 @@ def _find_share_replica(cs, replica):
 
 
 @api_versions.wraps("2.11", "2.46")
-def _print_share_replica(cs, replica):
+def _print_share_replica(cs, replica, output_format='table'):
     info = replica._info.copy()
     info.pop('links', None)
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=output_format)
 
 
 @api_versions.wraps("2.47")  # noqa
-def _print_share_replica(cs, replica):  # noqa
+def _print_share_replica(cs, replica, output_format='table'):  # noqa
     info = replica._info.copy()
     info.pop('links', None)
     if info.get('export_locations'):
         info['export_locations'] = (
             cliutils.transform_export_locations_to_string_view(
                 info['export_locations']))
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=output_format)
 
 
 @api_versions.wraps("2.31")
@@ -260,14 +317,14 @@ def _find_share_group(cs, share_group):
     return apiclient_utils.find_resource(cs.share_groups, share_group)
 
 
-def _print_share_group(cs, share_group):
+def _print_share_group(cs, share_group, output_format='table'):
     info = share_group._info.copy()
     info.pop('links', None)
 
     if info.get('share_types'):
         info['share_types'] = "\n".join(info['share_types'])
 
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=output_format)
 
 
 @api_versions.wraps("2.31")
@@ -277,16 +334,18 @@ def _find_share_group_snapshot(cs, share_group_snapshot):
         cs.share_group_snapshots, share_group_snapshot)
 
 
-def _print_share_group_snapshot(cs, share_group_snapshot):
+def _print_share_group_snapshot(cs, share_group_snapshot,
+                                output_format='table'):
     info = share_group_snapshot._info.copy()
     info.pop('links', None)
     info.pop('members', None)
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=output_format)
 
 
-def _print_share_group_snapshot_members(cs, share_group_snapshot):
+def _print_share_group_snapshot_members(cs, share_group_snapshot,
+                                        output_format='table'):
     info = share_group_snapshot._info.copy()
-    cliutils.print_dict(info.get('members', {}))
+    cliutils.print_dict(info.get('members', {}), output_format=output_format)
 
 
 def _find_share_snapshot(cs, snapshot):
@@ -294,7 +353,7 @@ def _find_share_snapshot(cs, snapshot):
     return apiclient_utils.find_resource(cs.share_snapshots, snapshot)
 
 
-def _print_share_snapshot(cs, snapshot):
+def _print_share_snapshot(cs, snapshot, output_format='table'):
     info = snapshot._info.copy()
     info.pop('links', None)
 
@@ -303,10 +362,10 @@ def _print_share_snapshot(cs, snapshot):
             cliutils.transform_export_locations_to_string_view(
                 info['export_locations']))
 
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=output_format)
 
 
-def _quota_set_pretty_show(quotas):
+def _quota_set_pretty_show(quotas, output_format='table'):
     """Convert quotas object to dict and display."""
 
     new_quotas = {}
@@ -316,7 +375,7 @@ def _quota_set_pretty_show(quotas):
                 ['%s = %s' % (k, v) for k, v in sorted(quota_v.items())])
         new_quotas[quota_k] = quota_v
 
-    cliutils.print_dict(new_quotas)
+    cliutils.print_dict(new_quotas, output_format=output_format)
 
 
 def _find_share_snapshot_instance(cs, snapshot_instance):
@@ -409,20 +468,27 @@ def do_api_version(cs, args):
     columns = ['ID', 'Status', 'Version', 'Min_version']
     column_labels = ['ID', 'Status', 'Version', 'Minimum Version']
     response = cs.services.server_api_version()
-    cliutils.print_list(response, columns, field_labels=column_labels)
+    cliutils.print_list(response, columns, field_labels=column_labels,
+                        output_format=args.output_format)
 
 
 def do_endpoints(cs, args):
     """Discover endpoints that get returned from the authenticate services."""
     catalog = cs.keystone_client.service_catalog.catalog
-    for e in catalog.get('serviceCatalog', catalog.get('catalog')):
+    services = catalog.get('serviceCatalog', catalog.get('catalog'))
+    if args.output_format != 'table':
+        # NOTE: Machine-readable formats print a single document.
+        cliutils.print_dict(
+            dict((e['name'], e['endpoints'][0]) for e in services),
+            'Service', output_format=args.output_format)
+        return
+    for e in services:
         cliutils.print_dict(e['endpoints'][0], e['name'])
 
 
 def do_credentials(cs, args):
     """Show user credentials returned from auth."""
     catalog = cs.keystone_client.service_catalog.catalog
-    cliutils.print_dict(catalog['user'], "User Credentials")
     if not catalog['version'] == 'v3':
         data = catalog['token']
     else:
@@ -433,6 +499,12 @@ def do_credentials(cs, args):
             'audit_ids': catalog['audit_ids'],
             'tenant': catalog['project'],
         }
+    if args.output_format != 'table':
+        # NOTE: Machine-readable formats print a single document.
+        cliutils.print_dict({'user': catalog['user'], 'token': data},
+                            output_format=args.output_format)
+        return
+    cliutils.print_dict(catalog['user'], "User Credentials")
     cliutils.print_dict(data, "Token")
 
 
@@ -502,7 +574,8 @@ def do_quota_show(cs, args):
                 "'share type' quotas are available only starting with "
                 "'2.39' API microversion.")
         kwargs["share_type"] = args.share_type
-    _quota_set_pretty_show(cs.quotas.get(**kwargs))
+    _quota_set_pretty_show(cs.quotas.get(**kwargs),
+                           output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -516,7 +589,8 @@ def do_quota_show(cs, args):
 def do_quota_defaults(cs, args):
     """List the default quotas for a project."""
     project = args.project_id or cs.keystone_client.project_id
-    _quota_set_pretty_show(cs.quotas.defaults(project))
+    _quota_set_pretty_show(cs.quotas.defaults(project),
+                           output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -701,7 +775,8 @@ def do_quota_delete(cs, args):
 def do_quota_class_show(cs, args):
     """List the quotas for a quota class."""
 
-    _quota_set_pretty_show(cs.quota_classes.get(args.class_name))
+    _quota_set_pretty_show(cs.quota_classes.get(args.class_name),
+                           output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -776,7 +851,7 @@ def do_absolute_limits(cs, args):
     """Print a list of absolute limits for a user."""
     limits = cs.limits.get().absolute
     columns = ['Name', 'Value']
-    cliutils.print_list(limits, columns)
+    cliutils.print_list(limits, columns, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -794,7 +869,7 @@ def do_rate_limits(cs, args):
     if args.columns is not None:
         columns = _split_columns(columns=args.columns)
 
-    cliutils.print_list(limits, columns)
+    cliutils.print_list(limits, columns, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -896,7 +971,7 @@ def do_create(cs, args):
     if args.wait:
         share = _wait_for_share_status(cs, share)
 
-    _print_share(cs, share)
+    _print_share(cs, share, output_format=args.output_format)
 
 
 @api_versions.wraps("2.29")
@@ -1062,7 +1137,7 @@ def do_migration_get_progress(cs, args):
     share = _find_share(cs, args.share)
     result = share.migration_get_progress()
     # NOTE(ganso): result[0] is response code, result[1] is dict body
-    cliutils.print_dict(result[1])
+    cliutils.print_dict(result[1], output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -1122,7 +1197,7 @@ def do_share_server_migration_check(cs, args):
     result = share_server.migration_check(
         args.host, args.writable, args.nondisruptive, args.preserve_snapshots,
         new_share_net_id)
-    cliutils.print_dict(result)
+    cliutils.print_dict(result, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -1193,7 +1268,7 @@ def do_share_server_migration_complete(cs, args):
     """
     share_server = _find_share_server(cs, args.share_server_id)
     result = share_server.migration_complete()
-    cliutils.print_dict(result)
+    cliutils.print_dict(result, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -1256,7 +1331,7 @@ def do_share_server_migration_get_progress(cs, args):
     """
     share_server = _find_share_server(cs, args.share_server_id)
     result = share_server.migration_get_progress()
-    cliutils.print_dict(result)
+    cliutils.print_dict(result, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -1293,7 +1368,7 @@ def do_metadata_show(cs, args):
     """Show metadata of given share."""
     share = _find_share(cs, args.share)
     metadata = cs.shares.get_metadata(share)._info
-    cliutils.print_dict(metadata, 'Property')
+    cliutils.print_dict(metadata, 'Property', output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -1311,7 +1386,7 @@ def do_metadata_update_all(cs, args):
     share = _find_share(cs, args.share)
     metadata = _extract_metadata(args)
     metadata = share.update_all_metadata(metadata)._info['metadata']
-    cliutils.print_dict(metadata, 'Property')
+    cliutils.print_dict(metadata, 'Property', output_format=args.output_format)
 
 
 @api_versions.wraps("2.9")
@@ -1338,7 +1413,8 @@ def do_share_export_location_list(cs, args):
         ]
     share = _find_share(cs, args.share)
     export_locations = cs.share_export_locations.list(share)
-    cliutils.print_list(export_locations, list_of_keys)
+    cliutils.print_list(export_locations, list_of_keys,
+                        output_format=args.output_format)
 
 
 @api_versions.wraps("2.9")
@@ -1356,7 +1432,7 @@ def do_share_export_location_show(cs, args):
     export_location = cs.share_export_locations.get(
         share, args.export_location)
     view_data = export_location._info.copy()
-    cliutils.print_dict(view_data)
+    cliutils.print_dict(view_data, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -1437,7 +1513,7 @@ def do_manage(cs, args):
             name=args.name, description=args.description,
             is_public=args.public)
 
-    _print_share(cs, share)
+    _print_share(cs, share, output_format=args.output_format)
 
 
 @api_versions.wraps("2.49")
@@ -1492,7 +1568,7 @@ def do_share_server_manage(cs, args):
         args.host, args.share_network, args.identifier,
         **manage_kwargs)
 
-    cliutils.print_dict(share_server._info)
+    cliutils.print_dict(share_server._info, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -1554,7 +1630,7 @@ def do_snapshot_manage(cs, args):
         name=args.name, description=args.description
     )
 
-    _print_share_snapshot(cs, share_snapshot)
+    _print_share_snapshot(cs, share_snapshot, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -1583,16 +1659,11 @@ def do_unmanage(cs, args):
          "driver does not support it.")
 def do_share_server_unmanage(cs, args):
     """Unmanage share server (Admin only)."""
-    failure_count = 0
-    for server in args.share_server:
-        try:
-            cs.share_servers.unmanage(server, args.force)
-        except Exception as e:
-            failure_count += 1
-            print("Unmanage for share server %s failed: %s" % (server, e),
-                  file=sys.stderr)
+    results = _run_bulk(
+        args, lambda server: cs.share_servers.unmanage(server, args.force),
+        args.share_server, "Unmanage for share server %s failed: %s")
 
-    if failure_count == len(args.share_server):
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to unmanage any of the "
                                       "specified share servers.")
 
@@ -1605,17 +1676,13 @@ def do_share_server_unmanage(cs, args):
     help='Name or ID of the snapshot(s).')
 def do_snapshot_unmanage(cs, args):
     """Unmanage one or more share snapshots (Admin only)."""
-    failure_count = 0
-    for snapshot in args.snapshot:
-        try:
-            snapshot_ref = _find_share_snapshot(cs, snapshot)
-            snapshot_ref.unmanage_snapshot()
-        except Exception as e:
-            failure_count += 1
-            print("Unmanage for share snapshot %s failed: %s" % (snapshot, e),
-                  file=sys.stderr)
-
-    if failure_count == len(args.snapshot):
+    results = _run_bulk(
+        args,
+        lambda snapshot: (
+            _find_share_snapshot(cs, snapshot).unmanage_snapshot()),
+        args.snapshot, "Unmanage for share snapshot %s failed: %s")
+
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to unmanage any of the "
                                       "specified snapshots.")
 
@@ -1652,33 +1719,27 @@ def do_revert_to_snapshot(cs, args):
 @cliutils.service_type('sharev2')
 def do_delete(cs, args):
     """Remove one or more shares."""
-    failure_count = 0
-    shares_to_delete = []
 
-    for share in args.share:
-        try:
-            share_ref = _find_share(cs, share)
-            shares_to_delete.append(share_ref)
-            if args.share_group:
-                share_group_id = _find_share_group(cs, args.share_group).id
-                cs.shares.delete(share_ref, share_group_id=share_group_id)
-            else:
-                cs.shares.delete(share_ref)
-        except Exception as e:
-            failure_count += 1
-            print("Delete for share %s failed: %s" % (share, e),
-                  file=sys.stderr)
+    def _delete_share(share):
+        share_ref = _find_share(cs, share)
+        if args.share_group:
+            share_group_id = _find_share_group(cs, args.share_group).id
+            cs.shares.delete(share_ref, share_group_id=share_group_id)
+        else:
+            cs.shares.delete(share_ref)
+        return share_ref
+
+    results = _run_bulk(args, _delete_share, args.share,
+                        "Delete for share %s failed: %s")
 
-    if failure_count == len(args.share):
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to delete any of the specified "
                                       "shares.")
 
     if args.wait:
-        for share in shares_to_delete:
-            try:
-                _wait_for_share_status(cs, share, expected_status='deleted')
-            except exceptions.CommandError as e:
-                print(e, file=sys.stderr)
+        shares_to_delete = [result.result for result in results
+                            if not result.failed]
+        _wait_for_resources_deletion(cs.shares, shares_to_delete)
 
 
 @cliutils.arg(
@@ -1688,15 +1749,10 @@ def do_delete(cs, args):
     help='Name or ID of the share(s) to force delete.')
 def do_force_delete(cs, args):
     """Attempt force-delete of share, regardless of state (Admin only)."""
-    failure_count = 0
-    for share in args.share:
-        try:
-            _find_share(cs, share).force_delete()
-        except Exception as e:
-            failure_count += 1
-            print("Delete for share %s failed: %s" % (share, e),
-                  file=sys.stderr)
-    if failure_count == len(args.share):
+    results = _run_bulk(
+        args, lambda share: _find_share(cs, share).force_delete(),
+        args.share, "Delete for share %s failed: %s")
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to force delete any of "
                                       "specified shares.")
 
@@ -1709,7 +1765,7 @@ def do_force_delete(cs, args):
 def do_show(cs, args):
     """Show details about a NAS share."""
     share = _find_share(cs, args.share)
-    _print_share(cs, share)
+    _print_share(cs, share, output_format=args.output_format)
 
 
 @api_versions.wraps("2.9")  # noqa
@@ -1722,7 +1778,7 @@ def do_show(cs, args):  # noqa
     share = _find_share(cs, args.share)
     export_locations = cs.share_export_locations.list(share)
     share._info['export_locations'] = export_locations
-    _print_share(cs, share)
+    _print_share(cs, share, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -1770,7 +1826,7 @@ def do_access_allow(cs, args):
     share = _find_share(cs, args.share)
     access = share.allow(args.access_type, args.access_to, args.access_level,
                          access_metadata)
-    cliutils.print_dict(access)
+    cliutils.print_dict(access, output_format=args.output_format)
 
 
 @api_versions.wraps("2.45")
@@ -1782,7 +1838,7 @@ def do_access_show(cs, args):
     """Show details about a NAS share access rule."""
     access = cs.share_access_rules.get(args.access_id)
     view_data = access._info.copy()
-    cliutils.print_dict(view_data)
+    cliutils.print_dict(view_data, output_format=args.output_format)
 
 
 @api_versions.wraps("2.45")
@@ -1832,7 +1888,7 @@ def do_snapshot_access_allow(cs, args):
     """Allow read only access to a snapshot."""
     share_snapshot = _find_share_snapshot(cs, args.snapshot)
     access = share_snapshot.allow(args.access_type, args.access_to)
-    cliutils.print_dict(access)
+    cliutils.print_dict(access, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -1861,18 +1917,11 @@ def do_access_deny(cs, args):
     help='ID(s) of the access rule(s) to be deleted.')
 def do_snapshot_access_deny(cs, args):
     """Deny access to a snapshot."""
-    failure_count = 0
     snapshot = _find_share_snapshot(cs, args.snapshot)
-    for access_id in args.id:
-        try:
-            snapshot.deny(access_id)
-        except Exception as e:
-            failure_count += 1
-            print("Failed to remove rule %(access)s: %(reason)s."
-                  % {'access': access_id, 'reason': e},
-                  file=sys.stderr)
-
-    if failure_count == len(args.id):
+    results = _run_bulk(args, snapshot.deny, args.id,
+                        "Failed to remove rule %s: %s.")
+
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to delete any of the specified "
                                       "snapshot rules.")
 
@@ -1900,7 +1949,8 @@ def do_access_list(cs, args):
 
     share = _find_share(cs, args.share)
     access_list = share.access_list()
-    cliutils.print_list(access_list, list_of_keys)
+    cliutils.print_list(access_list, list_of_keys,
+                        output_format=args.output_format)
 
 
 @api_versions.wraps("2.21")  # noqa
@@ -1927,7 +1977,8 @@ def do_access_list(cs, args):  # noqa
 
     share = _find_share(cs, args.share)
     access_list = share.access_list()
-    cliutils.print_list(access_list, list_of_keys)
+    cliutils.print_list(access_list, list_of_keys,
+                        output_format=args.output_format)
 
 
 @api_versions.wraps("2.33")  # noqa
@@ -1969,7 +2020,8 @@ def do_access_list(cs, args):  # noqa
             share, {'metadata': _extract_metadata(args)})
     if args.columns is not None:
         list_of_keys = _split_columns(columns=args.columns)
-    cliutils.print_list(access_list, list_of_keys)
+    cliutils.print_list(access_list, list_of_keys,
+                        output_format=args.output_format)
 
 
 @api_versions.wraps("2.32")
@@ -1993,7 +2045,8 @@ def do_snapshot_access_list(cs, args):
 
     snapshot = _find_share_snapshot(cs, args.snapshot)
     access_list = snapshot.access_list()
-    cliutils.print_list(access_list, list_of_keys)
+    cliutils.print_list(access_list, list_of_keys,
+                        output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -2257,24 +2310,38 @@ def do_list(cs, args):
             sort_dir=args.sort_dir,
         )
     else:
+        kwargs = {}
+        if (args.output_format != 'table' and
+                (columns is None or 'export_location' not in columns)):
+            # NOTE: Shares are printed while they are received, unless
+            # their export locations have to be fetched first.
+            kwargs['stream'] = True
         shares = cs.shares.list(
             search_opts=search_opts, sort_key=args.sort_key,
-            sort_dir=args.sort_dir,
+            sort_dir=args.sort_dir, **kwargs
         )
     # NOTE(vponomaryov): usage of 'export_location' and
-    # 'export_locations' columns may cause scaling issue using API 2.9+ and
-    # when lots of shares are returned.
+    # 'export_locations' columns requires one API call per share using
+    # API 2.9+, they are made concurrently, up to --bulk-concurrency.
     if (shares and columns is not None and 'export_location' in columns and
             not hasattr(shares[0], 'export_location')):
         # NOTE(vponomaryov): we will get here only using API 2.9+
+        export_locations = cs.share_export_locations.list_bulk(
+            shares, max_workers=getattr(args, 'bulk_concurrency',
+                                        bulk.DEFAULT_MAX_WORKERS))
         for share in shares:
-            els_objs = cs.share_export_locations.list(share)
+            els_objs = export_locations[share.id]
             els = [el.to_dict()['path'] for el in els_objs]
             setattr(share, 'export_locations', els)
             setattr(share, 'export_location', els[0] if els else None)
-    cliutils.print_list(shares, list_of_keys, sortby_index=None)
+    cliutils.print_list(shares, list_of_keys, sortby_index=None,
+                        output_format=args.output_format)
     if args.count:
-        print("Shares in total: %s" % total_count)
+        # NOTE: Only tables are followed by the count, it would corrupt
+        # machine-readable output.
+        print("Shares in total: %s" % total_count,
+              file=sys.stdout if args.output_format == 'table'
+              else sys.stderr)
 
 
 @cliutils.arg(
@@ -2325,7 +2392,8 @@ def do_share_instance_list(cs, args):
                     "available with manila API version >= 2.35")
             instances = cs.share_instances.list()
 
-    cliutils.print_list(instances, list_of_keys)
+    cliutils.print_list(instances, list_of_keys,
+                        output_format=args.output_format)
 
 
 @api_versions.wraps("2.3", "2.8")
@@ -2336,7 +2404,7 @@ def do_share_instance_list(cs, args):
 def do_share_instance_show(cs, args):
     """Show details about a share instance."""
     instance = _find_share_instance(cs, args.instance)
-    _print_share_instance(cs, instance)
+    _print_share_instance(cs, instance, output_format=args.output_format)
 
 
 @api_versions.wraps("2.9")  # noqa
@@ -2349,7 +2417,7 @@ def do_share_instance_show(cs, args):  # noqa
     instance = _find_share_instance(cs, args.instance)
     export_locations = cs.share_instance_export_locations.list(instance)
     instance._info['export_locations'] = export_locations
-    _print_share_instance(cs, instance)
+    _print_share_instance(cs, instance, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -2360,15 +2428,11 @@ def do_share_instance_show(cs, args):  # noqa
 @api_versions.wraps("2.3")
 def do_share_instance_force_delete(cs, args):
     """Force-delete the share instance, regardless of state (Admin only)."""
-    failure_count = 0
-    for instance in args.instance:
-        try:
-            _find_share_instance(cs, instance).force_delete()
-        except Exception as e:
-            failure_count += 1
-            print("Delete for share instance %s failed: %s" % (instance, e),
-                  file=sys.stderr)
-    if failure_count == len(args.instance):
+    results = _run_bulk(
+        args,
+        lambda instance: _find_share_instance(cs, instance).force_delete(),
+        args.instance, "Delete for share instance %s failed: %s")
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to force delete any of "
                                       "specified share instances.")
 
@@ -2416,7 +2480,8 @@ def do_share_instance_export_location_list(cs, args):
         ]
     instance = _find_share_instance(cs, args.instance)
     export_locations = cs.share_instance_export_locations.list(instance)
-    cliutils.print_list(export_locations, list_of_keys)
+    cliutils.print_list(export_locations, list_of_keys,
+                        output_format=args.output_format)
 
 
 @api_versions.wraps("2.9")
@@ -2434,7 +2499,7 @@ def do_share_instance_export_location_show(cs, args):
     export_location = cs.share_instance_export_locations.get(
         instance, args.export_location)
     view_data = export_location._info.copy()
-    cliutils.print_dict(view_data)
+    cliutils.print_dict(view_data, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -2573,12 +2638,18 @@ def do_snapshot_list(cs, args):
             "Pattern based filtering (name~, description~ and description)"
             " is only available with manila API version >= 2.36")
 
+    kwargs = {}
+    if args.output_format != 'table':
+        # NOTE: Snapshots are printed while they are received.
+        kwargs['stream'] = True
     snapshots = cs.share_snapshots.list(
         search_opts=search_opts,
         sort_key=args.sort_key,
         sort_dir=args.sort_dir,
+        **kwargs
     )
-    cliutils.print_list(snapshots, list_of_keys, sortby_index=None)
+    cliutils.print_list(snapshots, list_of_keys, sortby_index=None,
+                        output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -2591,7 +2662,7 @@ def do_snapshot_show(cs, args):
     export_locations = cs.share_snapshot_export_locations.list(
         snapshot=snapshot)
     snapshot._info['export_locations'] = export_locations
-    _print_share_snapshot(cs, snapshot)
+    _print_share_snapshot(cs, snapshot, output_format=args.output_format)
 
 
 @api_versions.wraps("2.32")
@@ -2618,7 +2689,8 @@ def do_snapshot_export_location_list(cs, args):
     snapshot = _find_share_snapshot(cs, args.snapshot)
     export_locations = cs.share_snapshot_export_locations.list(
         snapshot)
-    cliutils.print_list(export_locations, list_of_keys)
+    cliutils.print_list(export_locations, list_of_keys,
+                        output_format=args.output_format)
 
 
 @api_versions.wraps("2.32")
@@ -2646,7 +2718,8 @@ def do_snapshot_instance_export_location_list(cs, args):
     instance = _find_share_snapshot_instance(cs, args.instance)
     export_locations = cs.share_snapshot_instance_export_locations.list(
         instance)
-    cliutils.print_list(export_locations, list_of_keys)
+    cliutils.print_list(export_locations, list_of_keys,
+                        output_format=args.output_format)
 
 
 @api_versions.wraps("2.32")
@@ -2664,7 +2737,7 @@ def do_snapshot_export_location_show(cs, args):
     export_location = cs.share_snapshot_export_locations.get(
         args.export_location, snapshot)
     view_data = export_location._info.copy()
-    cliutils.print_dict(view_data)
+    cliutils.print_dict(view_data, output_format=args.output_format)
 
 
 @api_versions.wraps("2.32")
@@ -2684,7 +2757,7 @@ def do_snapshot_instance_export_location_show(cs, args):
         args.export_location, snapshot_instance)
 
     view_data = export_location._info.copy()
-    cliutils.print_dict(view_data)
+    cliutils.print_dict(view_data, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -2715,7 +2788,7 @@ def do_snapshot_create(cs, args):
                                          args.force,
                                          args.name,
                                          args.description)
-    _print_share_snapshot(cs, snapshot)
+    _print_share_snapshot(cs, snapshot, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -2792,19 +2865,13 @@ def do_snapshot_rename(cs, args):
     help='Name or ID of the snapshot(s) to delete.')
 def do_snapshot_delete(cs, args):
     """Remove one or more snapshots."""
-    failure_count = 0
+    results = _run_bulk(
+        args,
+        lambda snapshot: cs.share_snapshots.delete(
+            _find_share_snapshot(cs, snapshot)),
+        args.snapshot, "Delete for snapshot %s failed: %s")
 
-    for snapshot in args.snapshot:
-        try:
-            snapshot_ref = _find_share_snapshot(
-                cs, snapshot)
-            cs.share_snapshots.delete(snapshot_ref)
-        except Exception as e:
-            failure_count += 1
-            print("Delete for snapshot %s failed: %s" % (
-                snapshot, e), file=sys.stderr)
-
-    if failure_count == len(args.snapshot):
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to delete any of the specified "
                                       "snapshots.")
 
@@ -2819,19 +2886,13 @@ def do_snapshot_force_delete(cs, args):
 
     Regardless of the state (Admin only).
     """
-    failure_count = 0
+    results = _run_bulk(
+        args,
+        lambda snapshot: cs.share_snapshots.force_delete(
+            _find_share_snapshot(cs, snapshot)),
+        args.snapshot, "Delete for snapshot %s failed: %s")
 
-    for snapshot in args.snapshot:
-        try:
-            snapshot_ref = _find_share_snapshot(
-                cs, snapshot)
-            cs.share_snapshots.force_delete(snapshot_ref)
-        except Exception as e:
-            failure_count += 1
-            print("Delete for snapshot %s failed: %s" % (
-                snapshot, e), file=sys.stderr)
-
-    if failure_count == len(args.snapshot):
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to force delete any of the "
                                       "specified snapshots.")
 
@@ -2889,7 +2950,8 @@ def do_snapshot_instance_list(cs, args):
     instances = cs.share_snapshot_instances.list(
         detailed=args.detailed, snapshot=snapshot)
 
-    cliutils.print_list(instances, list_of_keys)
+    cliutils.print_list(instances, list_of_keys,
+                        output_format=args.output_format)
 
 
 @api_versions.wraps("2.19")
@@ -2904,7 +2966,8 @@ def do_snapshot_instance_show(cs, args):
     export_locations = (
         cs.share_snapshot_instance_export_locations.list(snapshot_instance))
     snapshot_instance._info['export_locations'] = export_locations
-    _print_share_snapshot(cs, snapshot_instance)
+    _print_share_snapshot(cs, snapshot_instance,
+                          output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -2990,7 +3053,7 @@ def do_share_network_create(cs, args):
     }
     share_network = cs.share_networks.create(**values)
     info = share_network._info.copy()
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=args.output_format)
 
 
 @api_versions.wraps("2.26")  # noqa
@@ -3045,7 +3108,7 @@ def do_share_network_create(cs, args):  # noqa
             "available with manila API version >= 2.51")
     share_network = cs.share_networks.create(**values)
     info = share_network._info.copy()
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=args.output_format)
 
 
 @api_versions.wraps("1.0", "2.25")
@@ -3099,7 +3162,7 @@ def do_share_network_update(cs, args):
     share_network = _find_share_network(
         cs, args.share_network).update(**values)
     info = share_network._info.copy()
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=args.output_format)
 
 
 @api_versions.wraps("2.26")  # noqa
@@ -3146,7 +3209,7 @@ def do_share_network_update(cs, args):   # noqa
     share_network = _find_share_network(
         cs, args.share_network).update(**values)
     info = share_network._info.copy()
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -3157,7 +3220,7 @@ def do_share_network_show(cs, args):
     """Retrieve details for a share network."""
     share_network = _find_share_network(cs, args.share_network)
     info = share_network._info.copy()
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=args.output_format)
 
 
 @api_versions.wraps("1.0", "2.25")
@@ -3308,7 +3371,8 @@ def do_share_network_list(cs, args):
     if args.columns is not None:
         fields = _split_columns(columns=args.columns)
 
-    cliutils.print_list(share_networks, fields=fields)
+    cliutils.print_list(share_networks, fields=fields,
+                        output_format=args.output_format)
 
 
 @api_versions.wraps("2.26")  # noqa
@@ -3483,7 +3547,8 @@ def do_share_network_list(cs, args):   # noqa
     if args.columns is not None:
         fields = _split_columns(columns=args.columns)
 
-    cliutils.print_list(share_networks, fields=fields)
+    cliutils.print_list(share_networks, fields=fields,
+                        output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -3539,7 +3604,8 @@ def do_share_network_security_service_list(cs, args):
     if args.columns is not None:
         fields = _split_columns(columns=args.columns)
 
-    cliutils.print_list(security_services, fields=fields)
+    cliutils.print_list(security_services, fields=fields,
+                        output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -3589,7 +3655,7 @@ def do_share_network_subnet_create(cs, args):
     }
     share_network_subnet = cs.share_network_subnets.create(**values)
     info = share_network_subnet._info.copy()
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -3603,18 +3669,16 @@ def do_share_network_subnet_create(cs, args):
     help='Name or ID of share network subnet(s) to be deleted.')
 def do_share_network_subnet_delete(cs, args):
     """Delete one or more share network subnets."""
-    failure_count = 0
     share_network_ref = _find_share_network(cs, args.share_network)
 
-    for subnet in args.share_network_subnet:
-        try:
-            cs.share_network_subnets.delete(share_network_ref, subnet)
-        except Exception as e:
-            failure_count += 1
-            print("Deletion of share network subnet %s failed: %s" % (
-                subnet, e), file=sys.stderr)
+    results = _run_bulk(
+        args,
+        lambda subnet: cs.share_network_subnets.delete(
+            share_network_ref, subnet),
+        args.share_network_subnet,
+        "Deletion of share network subnet %s failed: %s")
 
-    if failure_count == len(args.share_network_subnet):
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to delete any of the specified "
                                       "share network subnets.")
 
@@ -3633,7 +3697,7 @@ def do_share_network_subnet_show(cs, args):
     share_network_subnet = cs.share_network_subnets.get(
         share_network.id, args.share_network_subnet)
     view_data = share_network_subnet._info.copy()
-    cliutils.print_dict(view_data)
+    cliutils.print_dict(view_data, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -3643,19 +3707,13 @@ def do_share_network_subnet_show(cs, args):
     help='Name or ID of share network(s) to be deleted.')
 def do_share_network_delete(cs, args):
     """Delete one or more share networks."""
-    failure_count = 0
+    results = _run_bulk(
+        args,
+        lambda share_network: cs.share_networks.delete(
+            _find_share_network(cs, share_network)),
+        args.share_network, "Delete for share network %s failed: %s")
 
-    for share_network in args.share_network:
-        try:
-            share_ref = _find_share_network(
-                cs, share_network)
-            cs.share_networks.delete(share_ref)
-        except Exception as e:
-            failure_count += 1
-            print("Delete for share network %s failed: %s" % (
-                share_network, e), file=sys.stderr)
-
-    if failure_count == len(args.share_network):
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to delete any of the specified "
                                       "share networks.")
 
@@ -3727,7 +3785,7 @@ def do_security_service_create(cs, args):
 
     security_service = cs.security_services.create(args.type, **values)
     info = security_service._info.copy()
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -3797,7 +3855,8 @@ def do_security_service_update(cs, args):
 
     security_service = _find_security_service(
         cs, args.security_service).update(**values)
-    cliutils.print_dict(security_service._info)
+    cliutils.print_dict(security_service._info,
+                        output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -3808,7 +3867,7 @@ def do_security_service_show(cs, args):
     """Show security service."""
     security_service = _find_security_service(cs, args.security_service)
     info = security_service._info.copy()
-    cliutils.print_dict(info)
+    cliutils.print_dict(info, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -3936,7 +3995,8 @@ def do_security_service_list(cs, args):
 
     if args.detailed:
         fields.append('share_networks')
-    cliutils.print_list(security_services, fields=fields)
+    cliutils.print_list(security_services, fields=fields,
+                        output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -3946,19 +4006,13 @@ def do_security_service_list(cs, args):
     help='Name or ID of the security service(s) to delete.')
 def do_security_service_delete(cs, args):
     """Delete one or more security services."""
-    failure_count = 0
+    results = _run_bulk(
+        args,
+        lambda security_service: cs.security_services.delete(
+            _find_security_service(cs, security_service)),
+        args.security_service, "Delete for security service %s failed: %s")
 
-    for security_service in args.security_service:
-        try:
-            security_ref = _find_security_service(
-                cs, security_service)
-            cs.security_services.delete(security_ref)
-        except Exception as e:
-            failure_count += 1
-            print("Delete for security service %s failed: %s" % (
-                security_service, e), file=sys.stderr)
-
-    if failure_count == len(args.security_service):
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to delete any of the specified "
                                       "security services.")
 
@@ -4028,7 +4082,8 @@ def do_share_server_list(cs, args):
         fields = _split_columns(columns=args.columns)
 
     share_servers = cs.share_servers.list(search_opts=search_opts)
-    cliutils.print_list(share_servers, fields=fields)
+    cliutils.print_list(share_servers, fields=fields,
+                        output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4043,7 +4098,7 @@ def do_share_server_show(cs, args):
     # so remove big dict from view.
     if "backend_details" in share_server._info:
         del share_server._info["backend_details"]
-    cliutils.print_dict(share_server._info)
+    cliutils.print_dict(share_server._info, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4054,7 +4109,7 @@ def do_share_server_show(cs, args):
 def do_share_server_details(cs, args):
     """Show share server details (Admin only)."""
     details = cs.share_servers.details(args.id)
-    cliutils.print_dict(details._info)
+    cliutils.print_dict(details._info, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4065,19 +4120,13 @@ def do_share_server_details(cs, args):
     help='ID of the share server(s) to delete.')
 def do_share_server_delete(cs, args):
     """Delete one or more share servers (Admin only)."""
+    results = _run_bulk(
+        args,
+        lambda server_id: cs.share_servers.delete(
+            _find_share_server(cs, server_id)),
+        args.id, "Delete for share server %s failed: %s")
 
-    failure_count = 0
-
-    for server_id in args.id:
-        try:
-            id_ref = _find_share_server(cs, server_id)
-            cs.share_servers.delete(id_ref)
-        except Exception as e:
-            failure_count += 1
-            print("Delete for share server %s failed: %s" % (
-                server_id, e), file=sys.stderr)
-
-    if failure_count == len(args.id):
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to delete any of the specified "
                                       "share servers.")
 
@@ -4098,7 +4147,8 @@ def do_availability_zone_list(cs, args):
         fields = ("Id", "Name", "Created_At", "Updated_At")
 
     availability_zones = cs.availability_zones.list()
-    cliutils.print_list(availability_zones, fields=fields)
+    cliutils.print_list(availability_zones, fields=fields,
+                        output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4148,7 +4198,8 @@ def do_service_list(cs, args):
         fields = _split_columns(columns=args.columns)
 
     services = cs.services.list(search_opts=search_opts)
-    cliutils.print_list(services, fields=fields)
+    cliutils.print_list(services, fields=fields,
+                        output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4164,7 +4215,7 @@ def do_service_enable(cs, args):
     columns = ("Host", "Binary", "Enabled")
     result = cs.services.enable(args.host, args.binary)
     result.enabled = not result.disabled
-    cliutils.print_list([result], columns)
+    cliutils.print_list([result], columns, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4180,7 +4231,7 @@ def do_service_disable(cs, args):
     columns = ("Host", "Binary", "Enabled")
     result = cs.services.disable(args.host, args.binary)
     result.enabled = not result.disabled
-    cliutils.print_list([result], columns)
+    cliutils.print_list([result], columns, output_format=args.output_format)
 
 
 def _print_dict(data_dict):
@@ -4253,13 +4304,23 @@ def do_pool_list(cs, args):
         pools = cs.pools.list(detailed=True, search_opts=search_opts)
 
     if args.detail:
+        backends = []
         for info in pools:
             backend = dict()
             backend['name'] = info.name
             backend.update(info.capabilities)
-            cliutils.print_dict(backend)
+            backends.append(backend)
+        if args.output_format != 'table':
+            # NOTE: Machine-readable formats print a single document.
+            cliutils.print_dict(
+                dict((backend['name'], backend) for backend in backends),
+                'Pool', output_format=args.output_format)
+            return
+        for backend in backends:
+            cliutils.print_dict(backend, output_format=args.output_format)
     else:
-        cliutils.print_list(pools, fields=fields)
+        cliutils.print_list(pools, fields=fields,
+                            output_format=args.output_format)
 
 
 @cliutils.arg('share', metavar='<share>',
@@ -4282,7 +4343,7 @@ def do_extend(cs, args):
         share = _wait_for_share_status(cs, share)
     else:
         share = _find_share(cs, args.share)
-    _print_share(cs, share)
+    _print_share(cs, share, output_format=args.output_format)
 
 @cliutils.arg('share', metavar='<share>',
               help='Name or ID of share to shrink.')
@@ -4304,7 +4365,7 @@ def do_shrink(cs, args):
         share = _wait_for_share_status(cs, share)
     else:
         share = _find_share(cs, args.share)
-    _print_share(cs, share)
+    _print_share(cs, share, output_format=args.output_format)
 
 ##############################################################################
 #
@@ -4340,7 +4401,7 @@ def _is_share_type_public(share_type):
 
 
 def _print_share_type_list(stypes, default_share_type=None, columns=None,
-                           description=False):
+                           description=False, output_format='table'):
 
     def _is_default(share_type):
         if hasattr(share_type, 'is_default'):
@@ -4375,10 +4436,12 @@ def _print_share_type_list(stypes, default_share_type=None, columns=None,
     if columns is not None:
         fields = _split_columns(columns=columns, title=False)
 
-    cliutils.print_list(stypes, fields, formatters)
+    cliutils.print_list(stypes, fields, formatters,
+                        output_format=output_format)
 
 
-def _print_share_type(stype, default_share_type=None, show_des=False):
+def _print_share_type(stype, default_share_type=None, show_des=False,
+                      output_format='table'):
 
     def _is_default(share_type):
         if hasattr(share_type, 'is_default'):
@@ -4395,10 +4458,11 @@ def _print_share_type(stype, default_share_type=None, show_des=False):
     }
     if show_des:
         stype_dict['Description'] = stype.description
-    cliutils.print_dict(stype_dict)
+    cliutils.print_dict(stype_dict, output_format=output_format)
 
 
-def _print_type_and_extra_specs_list(stypes, columns=None):
+def _print_type_and_extra_specs_list(stypes, columns=None,
+                                     output_format='table'):
     """Prints extra specs for a list of share types or share group types."""
     formatters = {
         'all_extra_specs': _print_type_extra_specs,
@@ -4408,7 +4472,8 @@ def _print_type_and_extra_specs_list(stypes, columns=None):
     if columns is not None:
         fields = _split_columns(columns=columns, title=False)
 
-    cliutils.print_list(stypes, fields, formatters)
+    cliutils.print_list(stypes, fields, formatters,
+                        output_format=output_format)
 
 
 def _find_share_type(cs, stype):
@@ -4466,7 +4531,8 @@ def do_type_list(cs, args):
     show_des = cs.api_version.matches(
         api_versions.APIVersion("2.41"), api_versions.APIVersion())
     _print_share_type_list(share_types, default_share_type=default,
-                           columns=args.columns, description=show_des)
+                           columns=args.columns, description=show_des,
+                           output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4479,7 +4545,8 @@ def do_type_show(cs, args):
     default = None
     if (share_type and not hasattr(share_type, 'is_default')):
         default = cs.share_types.get()
-    _print_type_show(share_type, default_share_type=default)
+    _print_type_show(share_type, default_share_type=default,
+                     output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4492,7 +4559,8 @@ def do_type_show(cs, args):
 def do_extra_specs_list(cs, args):
     """Print a list of current 'share types and extra specs' (Admin Only)."""
     stypes = cs.share_types.list()
-    _print_type_and_extra_specs_list(stypes, columns=args.columns)
+    _print_type_and_extra_specs_list(stypes, columns=args.columns,
+                                     output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4617,7 +4685,8 @@ def do_type_create(cs, args):
             raise exceptions.CommandError(msg)
 
     stype = cs.share_types.create(**kwargs)
-    _print_share_type(stype, show_des=show_des)
+    _print_share_type(stype, show_des=show_des,
+                      output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4666,7 +4735,7 @@ def do_type_update(cs, args):
     kwargs['description'] = description
     stype = _find_share_type(cs, args.id)
     stype = stype.update(**kwargs)
-    _print_share_type(stype, show_des=True)
+    _print_share_type(stype, show_des=True, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4676,19 +4745,13 @@ def do_type_update(cs, args):
     help="Name or ID of the share type(s) to delete.")
 def do_type_delete(cs, args):
     """Delete one or more specific share types (Admin only)."""
+    results = _run_bulk(
+        args,
+        lambda name_or_id: cs.share_types.delete(
+            _find_share_type(cs, name_or_id)),
+        args.id, "Delete for share type %s failed: %s")
 
-    failure_count = 0
-
-    for name_or_id in args.id:
-        try:
-            id_ref = _find_share_type(cs, name_or_id)
-            cs.share_types.delete(id_ref)
-        except Exception as e:
-            failure_count += 1
-            print("Delete for share type %s failed: %s" % (
-                name_or_id, e), file=sys.stderr)
-
-    if failure_count == len(args.id):
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to delete any of the specified "
                                       "share types.")
 
@@ -4734,7 +4797,7 @@ def do_type_access_list(cs, args):
     access_list = cs.share_type_access.list(share_type)
 
     columns = ['Project_ID']
-    cliutils.print_list(access_list, columns)
+    cliutils.print_list(access_list, columns, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4776,7 +4839,8 @@ def do_type_access_remove(cs, args):
 
 
 def _print_share_group_type_list(share_group_types,
-                                 default_share_group_type=None, columns=None):
+                                 default_share_group_type=None, columns=None,
+                                 output_format='table'):
 
     def _is_default(share_group_type):
         if hasattr(share_group_type, 'is_default'):
@@ -4806,10 +4870,11 @@ def _print_share_group_type_list(share_group_types,
         fields = _split_columns(columns=columns, title=False)
 
     cliutils.print_list(share_group_types, fields, formatters,
-                        sortby_index=None)
+                        sortby_index=None, output_format=output_format)
 
 
-def _print_share_group_type(share_group_type, default_share_type=None):
+def _print_share_group_type(share_group_type, default_share_type=None,
+                            output_format='table'):
 
     def _is_default(share_group_type):
         if hasattr(share_group_type, 'is_default'):
@@ -4822,7 +4887,7 @@ def _print_share_group_type(share_group_type, default_share_type=None):
         'Visibility': _is_share_type_public(share_group_type),
         'is_default': _is_default(share_group_type)
     }
-    cliutils.print_dict(share_group_type_dict)
+    cliutils.print_dict(share_group_type_dict, output_format=output_format)
 
 
 def _find_share_group_type(cs, sg_type):
@@ -4856,7 +4921,8 @@ def do_share_group_type_list(cs, args):
             default = cs.share_group_types.get()
 
     _print_share_group_type_list(
-        sg_types, default_share_group_type=default, columns=args.columns)
+        sg_types, default_share_group_type=default, columns=args.columns,
+        output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4871,7 +4937,8 @@ def do_share_group_type_specs_list(cs, args):
     """Print a list of 'share group types specs' (Admin Only)."""
 
     sg_types = cs.share_group_types.list()
-    _print_type_and_extra_specs_list(sg_types, columns=args.columns)
+    _print_type_and_extra_specs_list(sg_types, columns=args.columns,
+                                     output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4916,7 +4983,7 @@ def do_share_group_type_create(cs, args):
         kwargs['group_specs'] = _extract_group_specs(args)
 
     sg_type = cs.share_group_types.create(**kwargs)
-    _print_share_group_type(sg_type)
+    _print_share_group_type(sg_type, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -4969,7 +5036,7 @@ def do_share_group_type_access_list(cs, args):
             "Forbidden to get access list for public share group type.")
     access_list = cs.share_group_type_access.list(share_group_type)
     columns = ['Project_ID']
-    cliutils.print_list(access_list, columns)
+    cliutils.print_list(access_list, columns, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -5095,7 +5162,7 @@ def do_share_group_create(cs, args):
     }
 
     share_group = cs.share_groups.create(**kwargs)
-    _print_share_group(cs, share_group)
+    _print_share_group(cs, share_group, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -5267,7 +5334,7 @@ def do_share_group_list(cs, args):
         search_opts=search_opts, sort_key=args.sort_key,
         sort_dir=args.sort_dir)
     cliutils.print_list(share_groups, fields=list_of_keys,
-                        sortby_index=None)
+                        sortby_index=None, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -5278,7 +5345,7 @@ def do_share_group_list(cs, args):
 def do_share_group_show(cs, args):
     """Show details about a share group."""
     share_group = _find_share_group(cs, args.share_group)
-    _print_share_group(cs, share_group)
+    _print_share_group(cs, share_group, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -5310,7 +5377,7 @@ def do_share_group_update(cs, args):
         raise exceptions.CommandError(msg)
     share_group = _find_share_group(cs, args.share_group)
     share_group = cs.share_groups.update(share_group, **kwargs)
-    _print_share_group(cs, share_group)
+    _print_share_group(cs, share_group, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -5327,22 +5394,18 @@ def do_share_group_update(cs, args):
 @cliutils.service_type('sharev2')
 def do_share_group_delete(cs, args):
     """Remove one or more share groups."""
-    failure_count = 0
     kwargs = {}
 
     if args.force is not None:
         kwargs['force'] = args.force
 
-    for share_group in args.share_group:
-        try:
-            share_group_ref = _find_share_group(cs, share_group)
-            cs.share_groups.delete(share_group_ref, **kwargs)
-        except Exception as e:
-            failure_count += 1
-            print("Delete for share group %s failed: %s" % (share_group, e),
-                  file=sys.stderr)
-
-    if failure_count == len(args.share_group):
+    results = _run_bulk(
+        args,
+        lambda share_group: cs.share_groups.delete(
+            _find_share_group(cs, share_group), **kwargs),
+        args.share_group, "Delete for share group %s failed: %s")
+
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to delete any of the specified "
                                       "share groups.")
 
@@ -5396,7 +5459,8 @@ def do_share_group_snapshot_create(cs, args):
     kwargs = {'name': args.name, 'description': args.description}
     share_group = _find_share_group(cs, args.share_group)
     sg_snapshot = cs.share_group_snapshots.create(share_group.id, **kwargs)
-    _print_share_group_snapshot(cs, sg_snapshot)
+    _print_share_group_snapshot(cs, sg_snapshot,
+                                output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -5491,7 +5555,7 @@ def do_share_group_snapshot_list(cs, args):
         detailed=args.detailed, search_opts=search_opts,
         sort_key=args.sort_key, sort_dir=args.sort_dir)
     cliutils.print_list(share_group_snapshots, fields=list_of_keys,
-                        sortby_index=None)
+                        sortby_index=None, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -5502,7 +5566,8 @@ def do_share_group_snapshot_list(cs, args):
 def do_share_group_snapshot_show(cs, args):
     """Show details about a share group snapshot."""
     sg_snapshot = _find_share_group_snapshot(cs, args.share_group_snapshot)
-    _print_share_group_snapshot(cs, sg_snapshot)
+    _print_share_group_snapshot(cs, sg_snapshot,
+                                output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -5527,7 +5592,8 @@ def do_share_group_snapshot_list_members(cs, args):
     sg_snapshot = _find_share_group_snapshot(cs, args.share_group_snapshot)
     members = [type('ShareGroupSnapshotMember', (object,), member)
                for member in sg_snapshot._info.get('members', [])]
-    cliutils.print_list(members, fields=list_of_keys)
+    cliutils.print_list(members, fields=list_of_keys,
+                        output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -5598,22 +5664,19 @@ def do_share_group_snapshot_update(cs, args):
 @cliutils.service_type('sharev2')
 def do_share_group_snapshot_delete(cs, args):
     """Remove one or more share group snapshots."""
-    failure_count = 0
     kwargs = {}
 
     if args.force is not None:
         kwargs['force'] = args.force
 
-    for sg_snapshot in args.share_group_snapshot:
-        try:
-            sg_snapshot_ref = _find_share_group_snapshot(cs, sg_snapshot)
-            cs.share_group_snapshots.delete(sg_snapshot_ref, **kwargs)
-        except Exception as e:
-            failure_count += 1
-            print("Delete for share group snapshot %s failed: %s" % (
-                sg_snapshot, e), file=sys.stderr)
-
-    if failure_count == len(args.share_group_snapshot):
+    results = _run_bulk(
+        args,
+        lambda sg_snapshot: cs.share_group_snapshots.delete(
+            _find_share_group_snapshot(cs, sg_snapshot), **kwargs),
+        args.share_group_snapshot,
+        "Delete for share group snapshot %s failed: %s")
+
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to delete any of the specified "
                                       "share group snapshots.")
 
@@ -5663,7 +5726,8 @@ def do_share_replica_list(cs, args):
     else:
         replicas = cs.share_replicas.list()
 
-    cliutils.print_list(replicas, list_of_keys)
+    cliutils.print_list(replicas, list_of_keys,
+                        output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -5684,7 +5748,7 @@ def do_share_replica_create(cs, args):
     share = _find_share(cs, args.share)
 
     replica = cs.share_replicas.create(share, args.availability_zone)
-    _print_share_replica(cs, replica)
+    _print_share_replica(cs, replica, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -5696,7 +5760,7 @@ def do_share_replica_show(cs, args):
     """Show details about a replica."""
 
     replica = cs.share_replicas.get(args.replica)
-    _print_share_replica(cs, replica)
+    _print_share_replica(cs, replica, output_format=args.output_format)
 
 
 @api_versions.wraps("2.47")  # noqa
@@ -5710,7 +5774,7 @@ def do_share_replica_show(cs, args):  # noqa
     replica = cs.share_replicas.get(args.replica)
     export_locations = cs.share_replica_export_locations.list(replica)
     replica._info['export_locations'] = export_locations
-    _print_share_replica(cs, replica)
+    _print_share_replica(cs, replica, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -5728,21 +5792,17 @@ def do_share_replica_show(cs, args):  # noqa
 @api_versions.wraps("2.11")
 def do_share_replica_delete(cs, args):
     """Remove one or more share replicas."""
-    failure_count = 0
     kwargs = {
         "force": args.force
     }
 
-    for replica in args.replica:
-        try:
-            replica_ref = _find_share_replica(cs, replica)
-            cs.share_replicas.delete(replica_ref, **kwargs)
-        except Exception as e:
-            failure_count += 1
-            print("Delete for share replica %s failed: %s" % (replica, e),
-                  file=sys.stderr)
-
-    if failure_count == len(args.replica):
+    results = _run_bulk(
+        args,
+        lambda replica: cs.share_replicas.delete(
+            _find_share_replica(cs, replica), **kwargs),
+        args.replica, "Delete for share replica %s failed: %s")
+
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to delete any of the specified "
                                       "replicas.")
 
@@ -5784,7 +5844,8 @@ def do_share_replica_export_location_list(cs, args):
         ]
     replica = _find_share_replica(cs, args.replica)
     export_locations = cs.share_replica_export_locations.list(replica)
-    cliutils.print_list(export_locations, list_of_keys)
+    cliutils.print_list(export_locations, list_of_keys,
+                        output_format=args.output_format)
 
 
 @api_versions.wraps("2.47")
@@ -5802,7 +5863,7 @@ def do_share_replica_export_location_show(cs, args):
     export_location = cs.share_replica_export_locations.get(
         replica, args.export_location)
     view_data = export_location._info.copy()
-    cliutils.print_dict(view_data)
+    cliutils.print_dict(view_data, output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -5990,7 +6051,8 @@ def do_message_list(cs, args):
     messages = cs.messages.list(
         search_opts=search_opts, sort_key=args.sort_key,
         sort_dir=args.sort_dir)
-    cliutils.print_list(messages, fields=list_of_keys, sortby_index=None)
+    cliutils.print_list(messages, fields=list_of_keys, sortby_index=None,
+                        output_format=args.output_format)
 
 
 @cliutils.arg(
@@ -6002,7 +6064,7 @@ def do_message_show(cs, args):
     """Show details about a message."""
 
     message = cs.messages.get(args.message)
-    _print_message(message)
+    _print_message(message, output_format=args.output_format)
 
 
 @api_versions.wraps("2.37")
@@ -6013,23 +6075,17 @@ def do_message_show(cs, args):
     help='ID of the message(s).')
 def do_message_delete(cs, args):
     """Remove one or more messages."""
-    failure_count = 0
+    results = _run_bulk(
+        args,
+        lambda message: cs.messages.delete(_find_message(cs, message)),
+        args.message, "Delete for message %s failed: %s")
 
-    for message in args.message:
-        try:
-            message_ref = _find_message(cs, message)
-            cs.messages.delete(message_ref)
-        except Exception as e:
-            failure_count += 1
-            print("Delete for message %s failed: %s" % (message, e),
-                  file=sys.stderr)
-
-    if failure_count == len(args.message):
+    if all(result.failed for result in results):
         raise exceptions.CommandError("Unable to delete any of the specified "
                                       "messages.")
 
 
-def _print_message(message):
+def _print_message(message, output_format='table'):
     message_dict = {
         'id': message.id,
         'resource_type': message.resource_type,
@@ -6042,4 +6098,4 @@ def _print_message(message):
         'expires_at': message.expires_at,
         'request_id': message.request_id,
     }
-    cliutils.print_dict(message_dict)
+    cliutils.print_dict(message_dict, output_format=output_format)
@@ -0,0 +1,86 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measure the overhead of calling API microversioned manager methods.
+
+A method decorated with api_versions.wraps, with several versions like most
+manager methods, is compared with a plain method and with the dispatch made
+before versioned methods were cached, which filtered and sorted all the
+versions of the method on every call.
+
+Usage: python tools/dispatch_benchmark.py [--calls N]
+"""
+
+import argparse
+import time
+
+from manilaclient import api_versions
+
+
+class _Manager(object):
+
+    def __init__(self, version):
+        self.api_version = api_versions.APIVersion(version)
+
+    def plain(self, value):
+        return value
+
+    @api_versions.wraps("2.0", "2.9")
+    def versioned(self, value):
+        return value
+
+    @api_versions.wraps("2.10", "2.44")  # noqa
+    def versioned(self, value):  # noqa
+        return value
+
+    @api_versions.wraps("2.45")  # noqa
+    def versioned(self, value):  # noqa
+        return value
+
+    def legacy(self, value):
+        name = api_versions.utils.get_function_name(
+            _Manager.versioned.__wrapped__)
+        methods = api_versions.get_versioned_methods(name, self.api_version)
+        method = max(methods, key=lambda f: f.start_version)
+        return method.func(self, value)
+
+
+def _run(func, count):
+    start = time.time()
+    for i in range(count):
+        func(i)
+    return (time.time() - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--calls', type=int, default=100000,
+                        help='Number of calls of each scenario.')
+    args = parser.parse_args()
+
+    manager = _Manager(api_versions.MAX_VERSION)
+    print('%-30s %15s' % ('scenario', 'per call (us)'))
+    for name, func in (('plain method', manager.plain),
+                       ('versioned, cached dispatch', manager.versioned),
+                       ('versioned, legacy dispatch', manager.legacy)):
+        print('%-30s %15.3f' % (name, _run(func, args.calls) * 1e6))
+
+    start = time.time()
+    for i in range(args.calls):
+        api_versions.APIVersion("2.36")
+    print('%-30s %15.3f' % ('APIVersion("2.36")',
+                            (time.time() - start) / args.calls * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measure the time and memory needed to print a large share listing.
+
+The columns of 'manila list' are printed, for generated shares, in each
+output format of the shell. The table format holds all the rows and renders
+them at once, the other formats write each row while the shares are
+generated. Times include the overhead of tracing memory allocations.
+
+Usage: python tools/output_benchmark.py [--rows N]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+from manilaclient.common import cliutils
+
+FIELDS = ['ID', 'Name', 'Size', 'Share Proto', 'Status', 'Is Public',
+          'Share Type Name', 'Host', 'Availability Zone']
+
+
+class _Share(object):
+
+    def __init__(self, index):
+        self.id = '%08d-1f0c-4e6b-9c1a-5d1e0f2a3b4c' % index
+        self.name = 'share-%d' % index
+        self.size = index % 100 + 1
+        self.share_proto = 'NFS'
+        self.status = 'available'
+        self.is_public = False
+        self.share_type_name = 'default'
+        self.host = 'manila@generic#pool%d' % (index % 4)
+        self.availability_zone = 'nova'
+
+
+def _run(output_format, rows):
+    shares = (_Share(i) for i in range(rows))
+    tracemalloc.start()
+    start = time.time()
+    cliutils.print_list(shares, FIELDS, sortby_index=None,
+                        output_format=output_format)
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--rows', type=int, default=20000,
+                        help='Number of listed shares.')
+    args = parser.parse_args()
+
+    results = []
+    stdout = sys.stdout
+    with open(os.devnull, 'w') as devnull:
+        sys.stdout = devnull
+        try:
+            for output_format in cliutils.OUTPUT_FORMATS:
+                results.append((output_format,) + _run(output_format,
+                                                       args.rows))
+        finally:
+            sys.stdout = stdout
+
+    print('%-10s %12s %16s' % ('format', 'time (s)', 'peak memory (KiB)'))
+    for output_format, elapsed, peak in results:
+        print('%-10s %12.3f %16d' % (output_format, elapsed, peak / 1024))
+
+
+if __name__ == '__main__':
+    main()
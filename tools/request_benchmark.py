@@ -0,0 +1,136 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measure the client side overhead of manilaclient HTTP requests.
+
+Requests are answered by an in-process transport adapter, so only the work
+done by manilaclient and requests is measured. The previous request pipeline,
+which deep copied headers and options and parsed the decoded response text,
+is measured as a reference.
+
+Usage: python tools/request_benchmark.py [--requests N] [--shares N]
+"""
+
+import argparse
+import copy
+import json
+import time
+
+import requests
+
+import manilaclient
+from manilaclient.common import httpclient
+from manilaclient import exceptions
+
+
+class _FakeAdapter(requests.adapters.BaseAdapter):
+    """Answers every request with the same canned response."""
+
+    def __init__(self, status_code, content):
+        super(_FakeAdapter, self).__init__()
+        self.status_code = status_code
+        self.content = content
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers['Content-Type'] = 'application/json'
+        response._content = self.content
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+class _LegacyHTTPClient(httpclient.HTTPClient):
+    """HTTPClient with the request pipeline used before the optimization."""
+
+    def request(self, url, method, **kwargs):
+        headers = copy.deepcopy(self.default_headers)
+        headers.update(kwargs.get('headers', {}))
+
+        options = copy.deepcopy(self.request_options)
+
+        if 'body' in kwargs:
+            headers['Content-Type'] = 'application/json'
+            options['data'] = json.dumps(kwargs['body'])
+
+        self.log_request(method, url, headers, options.get('data', None))
+        resp = self.http_session.request(
+            method, url, headers=headers, **options)
+        self.log_response(resp)
+
+        body = None
+
+        if resp.text:
+            try:
+                body = json.loads(resp.text)
+            except ValueError:
+                pass
+
+        if resp.status_code >= 400:
+            raise exceptions.from_response(resp, method, url)
+
+        return resp, body
+
+
+def _get_client(client_class, status_code, content):
+    client = client_class('http://127.0.0.1:8786/v2/fake', 'token',
+                          'benchmark', manilaclient.API_MAX_VERSION)
+    client.http_session.mount('http://', _FakeAdapter(status_code, content))
+    return client
+
+
+def _run(client, method, count):
+    start = time.time()
+    for i in range(count):
+        if method == 'POST':
+            client.post('/shares', body={'share': {'size': 1}})
+        else:
+            client._cs_request('/shares/detail', method)
+    return (time.time() - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--requests', type=int, default=2000,
+                        help='Number of requests of each scenario.')
+    parser.add_argument('--shares', type=int, default=5000,
+                        help='Number of shares in the large listing.')
+    args = parser.parse_args()
+
+    share = {'id': 'f6a8ba57-0d0f-4d2b-a7b9-1b5d0e8e7d22',
+             'name': u'shäre', 'status': 'available', 'size': 1,
+             'metadata': {'key': 'value'}}
+    listing = json.dumps({'shares': [share] * args.shares}).encode('utf-8')
+    scenarios = (
+        ('DELETE, empty 204 response', 'DELETE', 204, b'', args.requests),
+        ('POST, small response', 'POST', 202,
+         json.dumps({'share': share}).encode('utf-8'), args.requests),
+        ('GET, %d shares' % args.shares, 'GET', 200, listing,
+         max(1, args.requests // 100)),
+    )
+
+    print('%-30s %15s %15s' % ('scenario', 'legacy (us)', 'current (us)'))
+    for name, method, status_code, content, count in scenarios:
+        timings = [
+            _run(_get_client(client_class, status_code, content), method,
+                 count) * 1e6
+            for client_class in (_LegacyHTTPClient, httpclient.HTTPClient)]
+        print('%-30s %15.1f %15.1f' % (name, timings[0], timings[1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measure the cold start time of manilaclient.
+
+Every scenario runs in a fresh interpreter, so module imports are not shared
+between runs. No API request is made.
+
+Usage: python tools/startup_benchmark.py [--runs N]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+
+SCENARIOS = (
+    ('import manilaclient.v2.client',
+     'import manilaclient.v2.client'),
+    ('import manilaclient.shell',
+     'import manilaclient.shell'),
+    ('create client and use one manager',
+     'from manilaclient import client\n'
+     'cs = client.Client("2", input_auth_token="token",\n'
+     '                   service_catalog_url="http://127.0.0.1:8786/v2")\n'
+     'cs.shares'),
+    ('manila help list',
+     'import sys\n'
+     'from manilaclient import shell\n'
+     'sys.stdout = open("/dev/null", "w")\n'
+     'shell.OpenStackManilaShell().main(["help", "list"])'),
+)
+
+
+def _run(code):
+    start = time.time()
+    subprocess.check_call([sys.executable, '-c', code])
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--runs', type=int, default=10,
+                        help='Number of runs of each scenario.')
+    args = parser.parse_args()
+
+    baseline = sorted(_run('pass') for i in range(args.runs))
+    print('%-40s %10s %10s' % ('scenario', 'min (ms)', 'median (ms)'))
+    for name, code in SCENARIOS:
+        timings = sorted(_run(code) - baseline[0] for i in range(args.runs))
+        print('%-40s %10.1f %10.1f' % (
+            name, timings[0] * 1000, timings[len(timings) // 2] * 1000))
+
+
+if __name__ == '__main__':
+    main()